@@ -1,13 +1,36 @@
+from .api_key import APIKeyInfo, VerifyAPIKey, api_key_store, api_key_usage
 from .jwt import PublishToken, VerifyToken
 from .public_api import ProductionAPIKeyGenerator
+from .rate_limit import RateLimit, api_rate_limiter
+from .revocation import refresh_token_revocations
+from .supertokens import (
+    SUPERTOKENS_BASE_PATH,
+    SUPERTOKENS_CORS_HEADERS,
+    supertokens_app,
+)
+from .throttle import login_throttle
 
 sign_in_token = PublishToken.sign_in_token
 refresh_access_token = PublishToken.refresh_access_token
+revoke_refresh_token = PublishToken.revoke_refresh_token
 VerifyToken = VerifyToken()
+VerifyAPIKey = VerifyAPIKey()
 
 __all__ = [
+    "SUPERTOKENS_BASE_PATH",
+    "SUPERTOKENS_CORS_HEADERS",
+    "APIKeyInfo",
     "ProductionAPIKeyGenerator",
+    "RateLimit",
+    "VerifyAPIKey",
     "VerifyToken",
+    "api_key_store",
+    "api_key_usage",
+    "api_rate_limiter",
+    "login_throttle",
     "refresh_access_token",
+    "refresh_token_revocations",
+    "revoke_refresh_token",
     "sign_in_token",
+    "supertokens_app",
 ]
@@ -0,0 +1,196 @@
+import hmac
+from asyncio import sleep
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import cache
+from hashlib import sha256
+from os import environ
+from time import monotonic
+from typing import Annotated, Any
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Security, status
+from fastapi.security import APIKeyHeader
+from pymongo import UpdateOne
+from structlog import BoundLogger
+
+from database import mongodb_conn
+from model import ApiKeyPublish
+from utils import Logger
+from utils.metrics import record_cache
+
+from .public_api import PUBLIC_API_MASTER_KEY, hex_setting
+
+load_dotenv()
+
+logger: BoundLogger = Logger().setup()
+
+API_KEYS_COLLECTION: str = "api_keys"
+API_KEY_PREFIX: str = "sk-cm-"
+API_KEY_CACHE_TTL_SECONDS: float = float(
+    environ.get("API_KEY_CACHE_TTL_SECONDS", "300")
+)
+API_KEY_CACHE_MAX_SIZE: int = int(environ.get("API_KEY_CACHE_MAX_SIZE", "4096"))
+API_KEY_USAGE_FLUSH_SECONDS: float = float(
+    environ.get("API_KEY_USAGE_FLUSH_SECONDS", "10")
+)
+
+
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+
+@cache
+def _index_key() -> bytes:
+    """발급 키 원문 대신 저장하는 HMAC 인덱스의 키, 마스터 키에서 용도별로 분리"""
+    master_key: bytes = hex_setting("PUBLIC_API_MASTER_KEY", PUBLIC_API_MASTER_KEY)
+    return hmac.new(master_key, b"api-key-index", sha256).digest()
+
+
+def key_index(api_key: str) -> str:
+    """API 키의 HMAC-SHA256 인덱스, DB 유출 시에도 키 원문을 복원할 수 없음"""
+    return hmac.new(_index_key(), api_key.encode(), sha256).hexdigest()
+
+
+@dataclass(frozen=True)
+class APIKeyInfo:
+    key_id: str
+    domain: str
+    purpose: str
+
+
+class APIKeyStore:
+    """
+    발급된 API 키의 HMAC 인덱스 저장소
+
+    - 검증은 요청 키의 HMAC 으로 인덱스 조회 1회 (PBKDF2 재생성 불필요)
+    - 조회 결과는 워커별로 TTL 동안 캐시, 존재하지 않는 키도 캐시하여 무작위 키 요청의 DB 부하 차단
+    """
+
+    def __init__(
+        self,
+        ttl: float = API_KEY_CACHE_TTL_SECONDS,
+        max_size: int = API_KEY_CACHE_MAX_SIZE,
+    ) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._cache: dict[str, tuple[float, APIKeyInfo | None]] = {}
+
+    async def register(self, api_key: str, publish: ApiKeyPublish) -> str:
+        index: str = key_index(api_key)
+        async with mongodb_conn(API_KEYS_COLLECTION) as conn:
+            await conn.create_index("key_hash", unique=True)
+            await conn.insert_one(
+                {
+                    "key_hash": index,
+                    "domain": publish.domain,
+                    "purpose": publish.purpose,
+                    "issued_at": datetime.now(tz=UTC),
+                    "usage_count": 0,
+                }
+            )
+
+        self._cache.pop(index, None)
+        return index
+
+    async def lookup(self, index: str) -> APIKeyInfo | None:
+        cached: tuple[float, APIKeyInfo | None] | None = self._cache.get(index)
+        if cached is not None and cached[0] > monotonic():
+            record_cache("api_key", True)
+            return cached[1]
+        record_cache("api_key", False)
+
+        async with mongodb_conn(API_KEYS_COLLECTION) as conn:
+            document: dict[str, Any] | None = await conn.find_one(
+                {"key_hash": index}, {"domain": 1, "purpose": 1}
+            )
+
+        info: APIKeyInfo | None = (
+            APIKeyInfo(index[:16], document["domain"], document["purpose"])
+            if document is not None
+            else None
+        )
+
+        if len(self._cache) >= self.max_size:
+            del self._cache[next(iter(self._cache))]
+        self._cache[index] = (monotonic() + self.ttl, info)
+        return info
+
+
+class APIKeyUsage:
+    """
+    API 키별 사용 횟수를 워커 메모리에 모아 주기적으로 한 번의 bulk_write 로 반영
+    """
+
+    def __init__(self) -> None:
+        self._counts: Counter[str] = Counter()
+        self._last_used: dict[str, datetime] = {}
+
+    def record(self, index: str) -> None:
+        self._counts[index] += 1
+        self._last_used[index] = datetime.now(tz=UTC)
+
+    async def flush(self) -> int:
+        if not self._counts:
+            return 0
+
+        counts, self._counts = self._counts, Counter()
+        last_used, self._last_used = self._last_used, {}
+
+        try:
+            async with mongodb_conn(API_KEYS_COLLECTION) as conn:
+                await conn.bulk_write(
+                    [
+                        UpdateOne(
+                            {"key_hash": index},
+                            {
+                                "$inc": {"usage_count": count},
+                                "$max": {"last_used_at": last_used[index]},
+                            },
+                        )
+                        for index, count in counts.items()
+                    ],
+                    ordered=False,
+                )
+        except Exception as e:
+            # 실패한 횟수는 다음 주기에 다시 반영
+            self._counts.update(counts)
+            for index, used_at in last_used.items():
+                self._last_used[index] = max(
+                    used_at, self._last_used.get(index, used_at)
+                )
+            logger.error("Flush API key usage to mongodb has an error", error=str(e))
+            return 0
+
+        return len(counts)
+
+    async def run_forever(self, interval: float = API_KEY_USAGE_FLUSH_SECONDS) -> None:
+        try:
+            while True:
+                await sleep(interval)
+                await self.flush()
+        finally:
+            # 종료 시 남은 횟수 반영
+            await self.flush()
+
+
+api_key_store = APIKeyStore()
+api_key_usage = APIKeyUsage()
+
+
+class VerifyAPIKey:
+    """X-API-Key 헤더의 공개 API 키 검증 의존성"""
+
+    async def __call__(
+        self, api_key: Annotated[str | None, Security(api_key_header)]
+    ) -> APIKeyInfo:
+        if api_key is None or not api_key.startswith(API_KEY_PREFIX):
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid API key")
+
+        index: str = key_index(api_key)
+        info: APIKeyInfo | None = await api_key_store.lookup(index)
+        if info is None:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid API key")
+
+        api_key_usage.record(index)
+        return info
@@ -0,0 +1,83 @@
+"""
+현재 서버에서 목표 지연 시간에 맞는 비밀번호 KDF 반복 횟수 산출
+
+사용법 (app 디렉터리에서 실행):
+    python -m auth.calibrate --target-ms 300 --algorithm pbkdf2-sha3-256
+
+출력된 PASSWORD_KDF_* 값을 .env 에 설정하면 이후 로그인하는 사용자부터 재해시됨
+"""
+
+from argparse import ArgumentParser, Namespace
+from dataclasses import dataclass
+from secrets import token_bytes
+from statistics import median
+from time import perf_counter
+
+from .encryption import KDF_ALGORITHMS, Encryption, KDFParams
+
+PROBE_ITERATIONS: int = 100_000
+ROUND_TO: int = 10_000
+
+
+@dataclass(frozen=True)
+class Calibration:
+    params: KDFParams
+    measured_ms: float
+    target_ms: float
+
+
+def measure_ms(params: KDFParams, rounds: int = 3) -> float:
+    """해시 1회 소요 시간(ms)의 중앙값"""
+    salt: bytes = token_bytes(Encryption.SALT_LENGTH)
+    samples: list[float] = []
+    for _ in range(rounds):
+        start: float = perf_counter()
+        Encryption.passwords("calibration-password", salt, params)
+        samples.append((perf_counter() - start) * 1000)
+    return median(samples)
+
+
+def calibrate(
+    target_ms: float,
+    algorithm: str = KDFParams.algorithm,
+    min_iterations: int = Encryption.ITERATIONS,
+) -> Calibration:
+    """
+    짧은 측정값으로 반복 횟수를 외삽한 뒤 실제 측정으로 확인
+
+    보안 기준선 아래로 내려가지 않도록 min_iterations 를 하한으로 사용
+    """
+    per_iteration_ms: float = (
+        measure_ms(KDFParams(algorithm, PROBE_ITERATIONS)) / PROBE_ITERATIONS
+    )
+    iterations: int = max(
+        min_iterations,
+        round(target_ms / per_iteration_ms / ROUND_TO) * ROUND_TO,
+    )
+
+    params = KDFParams(algorithm, iterations)
+    return Calibration(params, measure_ms(params), target_ms)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Calibrate password KDF cost")
+    parser.add_argument("--target-ms", type=float, default=300.0)
+    parser.add_argument(
+        "--algorithm", choices=sorted(KDF_ALGORITHMS), default=KDFParams.algorithm
+    )
+    parser.add_argument("--min-iterations", type=int, default=Encryption.ITERATIONS)
+    args: Namespace = parser.parse_args()
+
+    result: Calibration = calibrate(args.target_ms, args.algorithm, args.min_iterations)
+    if result.measured_ms > result.target_ms * 1.5:
+        print(
+            f"# warning: minimum iterations exceed the target "
+            f"({result.measured_ms:.0f}ms > {result.target_ms:.0f}ms)"
+        )
+    print(f"# measured {result.measured_ms:.0f}ms per hash")
+    print(f"PASSWORD_KDF_ALGORITHM={result.params.algorithm}")
+    print(f"PASSWORD_KDF_ITERATIONS={result.params.iterations}")
+
+
+if __name__ == "__main__":
+    main()
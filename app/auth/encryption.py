@@ -1,27 +1,87 @@
+from asyncio import get_running_loop
 from base64 import urlsafe_b64encode
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from os import environ
 from secrets import token_bytes
+from time import perf_counter
+from typing import Any
 
-from cryptography.hazmat.primitives.hashes import SHA3_256
+from cryptography.hazmat.primitives.hashes import SHA3_256, SHA256, HashAlgorithm
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from structlog import BoundLogger
 
 from model import PasswordAndSalt
+from utils import Logger
+from utils.metrics import KDF_DURATION
+from utils.server_timing import server_timing
+from utils.tracing import tracer
+
+load_dotenv()
+
+logger: BoundLogger = Logger().setup()
+
+KDF_MAX_WORKERS: int = int(environ.get("KDF_MAX_WORKERS", "2"))
+KDF_MAX_PENDING: int = int(environ.get("KDF_MAX_PENDING", "32"))
+
+
+KDF_ALGORITHMS: dict[str, type[HashAlgorithm]] = {
+    "pbkdf2-sha3-256": SHA3_256,
+    "pbkdf2-sha256": SHA256,
+}
+
+
+@dataclass(frozen=True)
+class KDFParams:
+    """
+    비밀번호 해시 알고리즘과 파라미터, 사용자 문서의 password_kdf 필드에 함께 저장
+
+    파라미터를 해시와 함께 저장하므로 비용 조정이나 알고리즘 교체 후에도 기존 해시 검증 가능
+    """
+
+    algorithm: str = "pbkdf2-sha3-256"
+    iterations: int = 600_000
+    length: int = 32
+
+    def to_document(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_document(cls, document: dict[str, Any] | None) -> "KDFParams":
+        # password_kdf 필드가 없는 기존 사용자는 도입 이전 고정 파라미터로 해시됨
+        return cls(**document) if document else cls()
+
+    @classmethod
+    def from_env(cls) -> "KDFParams":
+        params = cls(
+            algorithm=environ.get("PASSWORD_KDF_ALGORITHM", cls.algorithm),
+            iterations=int(environ.get("PASSWORD_KDF_ITERATIONS", str(cls.iterations))),
+        )
+        if params.algorithm not in KDF_ALGORITHMS:
+            raise ValueError(f"Unsupported password KDF: {params.algorithm}")
+        return params
 
 
 class Encryption:
     SALT_LENGTH: int = 32
     ITERATIONS: int = 600_000
+    # 신규 해시에 사용할 파라미터, 이와 다른 파라미터의 해시는 로그인 시 재해시
+    CURRENT_PARAMS: KDFParams = KDFParams.from_env()
 
     @classmethod
     def _random_salt(cls) -> bytes:
         return token_bytes(cls.SALT_LENGTH)
 
     @classmethod
-    def _hmac_sha3_256(cls, salt: bytes) -> PBKDF2HMAC:
+    def _kdf(cls, salt: bytes, params: KDFParams) -> PBKDF2HMAC:
         return PBKDF2HMAC(
-            algorithm=SHA3_256(),
-            length=cls.SALT_LENGTH,
+            algorithm=KDF_ALGORITHMS[params.algorithm](),
+            length=params.length,
             salt=salt,
-            iterations=cls.ITERATIONS,
+            iterations=params.iterations,
         )
 
     @staticmethod
@@ -29,14 +89,122 @@ class Encryption:
         return kdf.derive(password.encode())
 
     @classmethod
-    def passwords(cls, password: str, salt: bytes | None = None) -> PasswordAndSalt:
+    def passwords(
+        cls,
+        password: str,
+        salt: bytes | None = None,
+        params: KDFParams | None = None,
+    ) -> PasswordAndSalt:
+        """params 를 생략하면 password_kdf 도입 이전의 기본 파라미터 사용"""
         if salt is None:
             salt = cls._random_salt()
 
-        kdf: PBKDF2HMAC = cls._hmac_sha3_256(salt)
+        kdf: PBKDF2HMAC = cls._kdf(salt, params or KDFParams(iterations=cls.ITERATIONS))
         encrypted_password: bytes = cls._derive_key(kdf, password)
 
         return PasswordAndSalt(
             encrypted_password=urlsafe_b64encode(encrypted_password).decode(),
             salt=urlsafe_b64encode(salt).decode(),
         )
+
+    @classmethod
+    async def passwords_async(
+        cls,
+        password: str,
+        salt: bytes | None = None,
+        params: KDFParams | None = None,
+    ) -> PasswordAndSalt:
+        """이벤트 루프를 막지 않도록 키 유도를 전용 풀에서 수행"""
+        return await kdf_pool.run(cls.passwords, password, salt, params)
+
+    @classmethod
+    def needs_rehash(cls, params: KDFParams) -> bool:
+        return params != cls.CURRENT_PARAMS
+
+
+@dataclass
+class KDFPoolStats:
+    max_workers: int
+    max_pending: int
+    in_flight: int
+    queued: int
+    completed: int
+    rejected: int
+    peak_queued: int
+
+
+class KeyDerivationPool:
+    """
+    PBKDF2 전용 스레드 풀
+
+    - OpenSSL 이 키 유도 중 GIL 을 해제하므로 스레드만으로 이벤트 루프를 막지 않음
+    - 작업 수를 max_workers 로 제한하여 로그인 폭주 시 다른 요청의 CPU 를 보장
+    - 대기 작업이 max_pending 을 넘으면 큐에 쌓지 않고 503 으로 즉시 거절
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        # 스레드는 첫 작업 제출 시 생성되므로 preload 후 fork 해도 안전
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kdf"
+        )
+        self._pending: int = 0
+        self._completed: int = 0
+        self._rejected: int = 0
+        self._peak_queued: int = 0
+
+    @property
+    def queued(self) -> int:
+        return max(0, self._pending - self.max_workers)
+
+    def stats(self) -> KDFPoolStats:
+        return KDFPoolStats(
+            max_workers=self.max_workers,
+            max_pending=self.max_pending,
+            in_flight=min(self._pending, self.max_workers),
+            queued=self.queued,
+            completed=self._completed,
+            rejected=self._rejected,
+            peak_queued=self._peak_queued,
+        )
+
+    async def run(
+        self, derive: Callable[..., PasswordAndSalt], *args: Any
+    ) -> PasswordAndSalt:
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            logger.warning("Key derivation pool is saturated", **asdict(self.stats()))
+            raise HTTPException(
+                status.HTTP_503_SERVICE_UNAVAILABLE,
+                "Too many concurrent sign-in requests",
+            )
+
+        submitted: float = perf_counter()
+
+        def timed() -> tuple[PasswordAndSalt, float, float]:
+            started: float = perf_counter()
+            return derive(*args), started, perf_counter()
+
+        self._pending += 1
+        self._peak_queued = max(self._peak_queued, self.queued)
+        try:
+            with (
+                server_timing("auth"),
+                tracer.span("kdf.derive", queued=self.queued) as span,
+            ):
+                result, started, finished = await get_running_loop().run_in_executor(
+                    self._executor, timed
+                )
+                if span is not None:
+                    span.attributes["kdf.wait_ms"] = (started - submitted) * 1000
+            # 관측은 이벤트 루프 스레드에서만 수행
+            KDF_DURATION.observe(("wait",), started - submitted)
+            KDF_DURATION.observe(("derive",), finished - started)
+            return result
+        finally:
+            self._pending -= 1
+            self._completed += 1
+
+
+kdf_pool = KeyDerivationPool(KDF_MAX_WORKERS, KDF_MAX_PENDING)
@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from hashlib import blake2b
 from os import environ
+from time import time
 from typing import Annotated, Any
 from uuid import uuid4
 
@@ -12,7 +15,11 @@ from jwt.exceptions import InvalidTokenError
 
 from query.queries import Users
 from utils import datetime_now, unix_to_datetime
+from utils.metrics import record_cache
+from utils.server_timing import server_timing
+from utils.tracing import tracer
 
+from .revocation import refresh_token_revocations
 from .roles import check_roles
 
 load_dotenv()
@@ -21,6 +28,8 @@ load_dotenv()
 SECRET_KEY: str = environ["SECRET_KEY"]
 ALGORITHM: str = environ["SECRET_ALGORITHM"]
 security = HTTPBearer()
+# 워커별 검증 완료 토큰 캐시 크기
+VERIFY_TOKEN_CACHE_SIZE: int = int(environ.get("VERIFY_TOKEN_CACHE_SIZE", "1024"))
 
 
 @dataclass
@@ -48,7 +57,8 @@ class CreateToken:
             "aud": "cocktail-maker.co.kr",
             "type": "access",
         }
-        return jwt.encode(token, SECRET_KEY, ALGORITHM)
+        with tracer.span("jwt.encode", type="access"):
+            return jwt.encode(token, SECRET_KEY, ALGORITHM)
 
     def refresh(self, expire_days: int = 7) -> str:
         """
@@ -65,7 +75,8 @@ class CreateToken:
             "type": "refresh",
             "access_jti": self.jti,
         }
-        return jwt.encode(token, SECRET_KEY, ALGORITHM)
+        with tracer.span("jwt.encode", type="refresh"):
+            return jwt.encode(token, SECRET_KEY, ALGORITHM)
 
 
 class PublishToken:
@@ -89,21 +100,27 @@ class PublishToken:
         리프레시 토큰을 받아 액세스 토큰을 갱신
         """
         try:
-            refresh_payload = jwt.decode(
-                refresh_token,
-                SECRET_KEY,
-                algorithms=ALGORITHM,
-                audience="cocktail-maker.co.kr",
-            )
+            with tracer.span("jwt.decode", type="refresh"):
+                refresh_payload = jwt.decode(
+                    refresh_token,
+                    SECRET_KEY,
+                    algorithms=ALGORITHM,
+                    audience="cocktail-maker.co.kr",
+                )
 
             if refresh_payload["type"] != "refresh":
                 raise InvalidTokenError("Invalid token type")
 
+            if await refresh_token_revocations.is_revoked(
+                refresh_payload["jti"], unix_to_datetime(refresh_payload["exp"])
+            ):
+                raise InvalidTokenError("Refresh token has been revoked")
+
             create_token = CreateToken(
                 refresh_payload["jti"], datetime_now(), refresh_payload["sub"]
             )
 
-            # refresh 토큰에는 roles 정보가 없기 때문에 MongoDB 조회 후 access 토큰 생성 시 활용
+            # refresh 토큰에는 roles 정보가 없기 때문에 조회(캐시 우선) 후 access 토큰 생성 시 활용
             return {
                 "accessToken": create_token.access(
                     await Users.get_roles(refresh_payload["sub"])
@@ -115,43 +132,119 @@ class PublishToken:
         except jwt.InvalidTokenError as ite:
             raise InvalidTokenError(f"Invalid refresh token: {ite!s}") from ite
 
+    @staticmethod
+    async def revoke_refresh_token(refresh_token: str) -> None:
+        """
+        로그아웃 시 리프레시 토큰 폐기, 이미 만료된 토큰은 폐기할 필요 없음
+        """
+        try:
+            with tracer.span("jwt.decode", type="refresh"):
+                refresh_payload = jwt.decode(
+                    refresh_token,
+                    SECRET_KEY,
+                    algorithms=ALGORITHM,
+                    audience="cocktail-maker.co.kr",
+                )
+        except jwt.ExpiredSignatureError:
+            return
+        except jwt.InvalidTokenError as ite:
+            raise InvalidTokenError(f"Invalid refresh token: {ite!s}") from ite
+
+        if refresh_payload["type"] != "refresh":
+            raise InvalidTokenError("Invalid token type")
+
+        await refresh_token_revocations.revoke(
+            refresh_payload["jti"],
+            refresh_payload["sub"],
+            unix_to_datetime(refresh_payload["exp"]),
+        )
+
+
+class VerifiedTokenCache:
+    """
+    서명, 클레임 검증을 마친 액세스 토큰 payload 를 exp 까지 보관하는 LRU 캐시
+
+    키는 토큰 원문 대신 digest 를 사용하여 메모리에 토큰을 남기지 않음,
+    잠금이 없으므로 이벤트 루프에서만 접근
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str, now: int) -> dict[str, Any] | None:
+        digest: bytes = self._digest(token)
+        payload: dict[str, Any] | None = self._entries.get(digest)
+        if payload is None:
+            return None
+        if payload["exp"] <= now:
+            del self._entries[digest]
+            return None
+        self._entries.move_to_end(digest)
+        return payload
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        self._entries[self._digest(token)] = payload
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def validate_access_claims(payload: dict[str, Any], now: int) -> None:
+    """exp, nbf, iat 은 모두 정수 unix time 이므로 datetime 변환 없이 비교"""
+    if payload["exp"] <= now:
+        raise InvalidTokenError("Token has expired")
+    if payload["nbf"] > now:
+        raise InvalidTokenError("Token is not yet valid")
+    if payload["iat"] > now:
+        raise InvalidTokenError("Token issued in the future")
+
+    # 발행자 검증
+    if payload["iss"] != "cocktail-maker.co.kr/api":
+        raise InvalidTokenError("Invalid issuer")
+
+    # 토큰 타입 검증
+    if payload["type"] != "access":
+        raise InvalidTokenError("Invalid token type")
+
 
 class VerifyToken:
+    def __init__(self, cache_size: int = VERIFY_TOKEN_CACHE_SIZE) -> None:
+        self.cache = VerifiedTokenCache(cache_size)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        """검증된 payload 반환, 캐시에 있으면 서명 검증과 디코딩 생략"""
+        now: int = int(time())
+        payload: dict[str, Any] | None = self.cache.get(token, now)
+        record_cache("access_token", payload is not None)
+        if payload is not None:
+            return payload
+
+        with server_timing("auth"), tracer.span("jwt.decode", type="access"):
+            payload = jwt.decode(
+                token,
+                SECRET_KEY,
+                ALGORITHM,
+                audience="cocktail-maker.co.kr",
+            )
+            validate_access_claims(payload, now)
+
+        self.cache.put(token, payload)
+        return payload
+
     def __call__(self, required_roles: list[str]):
-        def verify(
+        # async 로 선언하여 threadpool 대신 이벤트 루프에서 실행, 캐시와 지표 카운터를
+        # 스레드 간에 공유하지 않음 (HMAC 서명 검증은 짧아 루프를 막지 않음)
+        async def verify(
             credentials: Annotated[HTTPAuthorizationCredentials, Security(security)],
         ):
             try:
-                payload: dict[str, Any] = jwt.decode(
-                    credentials.credentials,
-                    SECRET_KEY,
-                    ALGORITHM,
-                    audience="cocktail-maker.co.kr",
-                )
+                payload: dict[str, Any] = self.decode(credentials.credentials)
 
-                # 시간 관련 변수 설정
-                now: datetime = datetime_now()
-                exp_time: datetime = unix_to_datetime(payload["exp"])
-                nbf_time: datetime = unix_to_datetime(payload["nbf"])
-                iat_time: datetime = unix_to_datetime(payload["iat"])
-
-                # 시간 관련 검증
-                if exp_time <= now:
-                    raise InvalidTokenError("Token has expired")
-                if nbf_time > now:
-                    raise InvalidTokenError("Token is not yet valid")
-                if iat_time > now:
-                    raise InvalidTokenError("Token issued in the future")
-
-                # 발행자 검증
-                if payload["iss"] != "cocktail-maker.co.kr/api":
-                    raise InvalidTokenError("Invalid issuer")
-
-                # 토큰 타입 검증
-                if payload["type"] != "access":
-                    raise InvalidTokenError("Invalid token type")
-
-                # 권한 검증
+                # 권한 검증, 엔드포인트마다 요구 권한이 다르므로 캐시 적중 시에도 수행
                 if not check_roles(payload["roles"], required_roles):
                     raise HTTPException(
                         status_code=403, detail="Insufficient permissions"
@@ -9,8 +9,20 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-PUBLIC_API_MASTER_KEY: str = environ["PUBLIC_API_MASTER_KEY"]
-PUBLIC_API_SALT: str = environ["PUBLIC_API_SALT"]
+# 모듈 import 시에는 읽기만 하고 형식 검증은 키를 사용할 때 수행
+PUBLIC_API_MASTER_KEY: str = environ.get("PUBLIC_API_MASTER_KEY", "")
+PUBLIC_API_SALT: str = environ.get("PUBLIC_API_SALT", "")
+
+
+def hex_setting(name: str, value: str) -> bytes:
+    """16진수 설정 값을 bytes 로 변환, 없거나 형식이 잘못되면 설정 이름과 함께 오류"""
+    try:
+        parsed: bytes = bytes.fromhex(value)
+    except ValueError:
+        parsed = b""
+    if not parsed:
+        raise RuntimeError(f"{name} must be set to a non-empty hex string")
+    return parsed
 
 
 class ProductionAPIKeyGenerator:
@@ -23,14 +35,9 @@ class ProductionAPIKeyGenerator:
     - sk-cm- 접두사: API 키 형식 통일
     """
 
-    # // TODO: 누가, 언제, 왜 발급했는지 기록해야함
-    # // TODO: API 키를 인증을 요청받으면 저장된 시간과 실제 요청한 도메인으로 키를 재생산하여 검증, API 키 자체를 저장하게되면 유출 시 악용 우려
-    """
-    1. API 요청 시 요청한 도메인을 데이터베이스에서 검색
-    2. 저장된 시간과 도메인으로 API 키를 재생산
-    3. 재생산된 API 키와 요청한 API 키를 비교하여 유효성 검증
-    * 권한은..?
-    """
+    # 검증은 키를 재생성하지 않고 auth.api_key 의 HMAC 인덱스로 조회 (키 원문은 저장하지 않음)
+    # 발급 시 도메인, 용도, 발급 시각을 함께 저장
+    # // TODO: 발급한 사용자도 기록해야함
 
     def __init__(self, master_key: bytes, persistent_salt: bytes) -> None:
         self.master_key: bytes = master_key
@@ -58,6 +65,6 @@ class ProductionAPIKeyGenerator:
 
     @classmethod
     def from_env(cls) -> "ProductionAPIKeyGenerator":
-        master_key: bytes = bytes.fromhex(PUBLIC_API_MASTER_KEY)
-        salt: bytes = bytes.fromhex(PUBLIC_API_SALT)
+        master_key: bytes = hex_setting("PUBLIC_API_MASTER_KEY", PUBLIC_API_MASTER_KEY)
+        salt: bytes = hex_setting("PUBLIC_API_SALT", PUBLIC_API_SALT)
         return cls(master_key, salt)
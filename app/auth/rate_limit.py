@@ -0,0 +1,190 @@
+from asyncio import to_thread
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import ceil
+from os import environ
+from pathlib import Path
+from typing import Annotated, Literal
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Response, Security, status
+
+from utils.shared_state import (
+    WINDOW_CURRENT,
+    SharedSlotTable,
+    slide_window,
+    window_retry_after,
+    window_usage,
+)
+
+from .api_key import APIKeyInfo, VerifyAPIKey
+
+load_dotenv()
+
+RATE_LIMIT_PATH: Path = Path(environ.get("RATE_LIMIT_PATH", "../data/.rate-limit"))
+
+# API 키로 접근하는 공개 라우트는 조회뿐이며, 업로드, 등록은 JWT 인증 라우트
+RouteKind = Literal["detail", "search"]
+
+# 요청 비용 가중치, 정규식 검색은 단건 조회보다 DB 비용이 큼
+ROUTE_COSTS: dict[RouteKind, int] = {
+    "detail": int(environ.get("RATE_LIMIT_COST_DETAIL", "1")),
+    "search": int(environ.get("RATE_LIMIT_COST_SEARCH", "5")),
+}
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    API 키 요청 제한 정책, 한도는 윈도우당 비용 합계
+
+    - key_limit: API 키별 전체 한도
+    - route_limit: API 키의 라우트별 한도
+    """
+
+    window_seconds: float = 60.0
+    key_limit: int = 600
+    route_limit: int = 300
+
+    @classmethod
+    def from_env(cls) -> "RateLimitPolicy":
+        return cls(
+            window_seconds=float(environ.get("RATE_LIMIT_WINDOW_SECONDS", "60")),
+            key_limit=int(environ.get("RATE_LIMIT_KEY_LIMIT", "600")),
+            route_limit=int(environ.get("RATE_LIMIT_ROUTE_LIMIT", "300")),
+        )
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: float
+    retry_after: float
+
+    def headers(self, window: float) -> dict[str, str]:
+        """IETF RateLimit 헤더 필드 (draft-ietf-httpapi-ratelimit-headers)"""
+        headers: dict[str, str] = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(ceil(self.reset)),
+            "RateLimit-Policy": f"{self.limit};w={int(window)}",
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(max(1, ceil(self.retry_after)))
+        return headers
+
+
+class APIRateLimiter:
+    """
+    API 키, 라우트별 가중 슬라이딩 윈도우 제한
+
+    두 버킷(키 전체, 키+라우트)을 공유 테이블에서 한 번의 잠금으로 확인하고 함께 차감,
+    이벤트 루프에서는 try_take 로 잠금을 기다리지 않고 시도
+    """
+
+    def __init__(
+        self, policy: RateLimitPolicy, path: Path = RATE_LIMIT_PATH, slots: int = 16384
+    ) -> None:
+        self.policy = policy
+        self._table = SharedSlotTable(path, fields=3, slots=slots)
+
+    def take(self, key_id: str, route: str, cost: int) -> RateLimitDecision:
+        return self._table.update_all(
+            (key_id, f"{key_id}:{route}"), self._updater(cost)
+        )
+
+    def try_take(self, key_id: str, route: str, cost: int) -> RateLimitDecision | None:
+        """다른 워커가 잠금을 보유 중이면 None 반환"""
+        return self._table.try_update_all(
+            (key_id, f"{key_id}:{route}"), self._updater(cost)
+        )
+
+    def _updater(
+        self, cost: int
+    ) -> Callable[[list[list[float]], float], RateLimitDecision]:
+        window: float = self.policy.window_seconds
+        key_limit: int = self.policy.key_limit
+        route_limit: int = self.policy.route_limit
+
+        def take(records: list[list[float]], now: float) -> RateLimitDecision:
+            # 요청마다 호출되므로 두 버킷을 풀어서 계산
+            key_values, route_values = records
+            key_elapsed: float = slide_window(key_values, now, window)
+            route_elapsed: float = slide_window(route_values, now, window)
+            key_remaining: float = key_limit - window_usage(
+                key_values, key_elapsed, window
+            )
+            route_remaining: float = route_limit - window_usage(
+                route_values, route_elapsed, window
+            )
+
+            # 더 적게 남은 버킷 기준으로 헤더 구성
+            if key_remaining <= route_remaining:
+                limit, remaining, elapsed = key_limit, key_remaining, key_elapsed
+            else:
+                limit, remaining, elapsed = route_limit, route_remaining, route_elapsed
+
+            if remaining < cost:
+                retry_after: float = max(
+                    window_retry_after(
+                        key_values, key_elapsed, window, cost, key_limit
+                    ),
+                    window_retry_after(
+                        route_values, route_elapsed, window, cost, route_limit
+                    ),
+                )
+                return RateLimitDecision(
+                    False, limit, max(0, int(remaining)), retry_after, retry_after
+                )
+
+            key_values[WINDOW_CURRENT] += cost
+            route_values[WINDOW_CURRENT] += cost
+            return RateLimitDecision(
+                True, limit, max(0, int(remaining - cost)), window - elapsed, 0.0
+            )
+
+        return take
+
+
+api_rate_limiter = APIRateLimiter(RateLimitPolicy.from_env())
+_verify_api_key = VerifyAPIKey()
+
+
+class RateLimit:
+    """
+    API 키 인증 후 요청 비용만큼 한도를 차감하는 의존성
+
+    허용 시 응답에 RateLimit-* 헤더를 추가하고, 초과 시 Retry-After 와 함께 429 반환
+    """
+
+    def __init__(self, route: str, kind: RouteKind) -> None:
+        # 같은 컬렉션이라도 검색, 단건 조회는 별도 라우트 버킷
+        self.route = f"{route}:{kind}"
+        self.cost: int = ROUTE_COSTS[kind]
+
+    async def __call__(
+        self,
+        response: Response,
+        api_key: Annotated[APIKeyInfo, Security(_verify_api_key)],
+    ) -> APIKeyInfo:
+        decision: RateLimitDecision | None = api_rate_limiter.try_take(
+            api_key.key_id, self.route, self.cost
+        )
+        if decision is None:
+            # 경합 시에만 스레드에서 잠금 대기, 루프를 막지 않음
+            decision = await to_thread(
+                api_rate_limiter.take, api_key.key_id, self.route, self.cost
+            )
+        headers: dict[str, str] = decision.headers(
+            api_rate_limiter.policy.window_seconds
+        )
+
+        if not decision.allowed:
+            raise HTTPException(
+                status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded", headers
+            )
+
+        response.headers.update(headers)
+        return api_key
@@ -0,0 +1,100 @@
+from datetime import UTC, datetime
+from os import environ
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+from structlog import BoundLogger
+
+from database import mongodb_conn
+from utils import Logger
+from utils.shared_state import SharedBloomFilter
+
+load_dotenv()
+
+logger: BoundLogger = Logger().setup()
+
+REVOCATION_BLOOM_PATH: Path = Path(
+    environ.get("REVOCATION_BLOOM_PATH", "../data/.revoked-refresh-tokens")
+)
+REVOCATION_BLOOM_BITS: int = int(environ.get("REVOCATION_BLOOM_BITS", str(1 << 20)))
+REVOCATION_BLOOM_HASHES: int = int(environ.get("REVOCATION_BLOOM_HASHES", "7"))
+# 리프레시 토큰 최대 수명 이상이어야 함 (기본 7일)
+REVOCATION_BLOOM_GENERATION_SECONDS: float = float(
+    environ.get("REVOCATION_BLOOM_GENERATION_SECONDS", str(7 * 24 * 60 * 60))
+)
+REVOKED_TOKENS_COLLECTION: str = "revoked_tokens"
+
+
+class RefreshTokenRevocations:
+    """
+    리프레시 토큰 jti 폐기 목록
+
+    - 워커 간 공유 Bloom filter 로 폐기되지 않은 토큰은 DB 조회 없이 O(1) 판별
+    - Bloom filter 양성(폐기 또는 오탐)인 경우에만 MongoDB 의 정확한 목록 조회
+    - Bloom filter 는 토큰 만료 시각 세대별로 돌려 쓰고, MongoDB 문서는 TTL 인덱스로
+      토큰 만료 시각에 자동 삭제
+    """
+
+    def __init__(self, bloom: SharedBloomFilter) -> None:
+        self.bloom = bloom
+        self.exact_lookups: int = 0
+
+    async def revoke(self, jti: str, user_id: str, expires_at: datetime) -> None:
+        async with mongodb_conn(REVOKED_TOKENS_COLLECTION) as conn:
+            await conn.update_one(
+                {"jti": jti},
+                {
+                    "$set": {
+                        "user_id": user_id,
+                        "expires_at": expires_at,
+                        "revoked_at": datetime.now(tz=UTC),
+                    }
+                },
+                upsert=True,
+            )
+        # DB 저장 후 등록해야 양성 판정 시 정확한 목록에서 확인 가능
+        self.bloom.add(jti, expires_at.timestamp())
+
+    async def is_revoked(self, jti: str, expires_at: datetime) -> bool:
+        if not self.bloom.might_contain(jti, expires_at.timestamp()):
+            return False
+
+        self.exact_lookups += 1
+        async with mongodb_conn(REVOKED_TOKENS_COLLECTION) as conn:
+            return await conn.find_one({"jti": jti}, {"_id": 1}) is not None
+
+    async def load(self) -> int:
+        """
+        시작 시 만료되지 않은 폐기 목록을 Bloom filter 에 반영
+
+        공유 파일이 지워졌거나 새 서버에서 시작한 경우에도 폐기 상태가 유지되며,
+        만료된 세대의 비트는 add 에서 비워지므로 다시 쌓이지 않음
+        """
+        loaded: int = 0
+        async with mongodb_conn(REVOKED_TOKENS_COLLECTION) as conn:
+            await conn.create_index("jti", unique=True)
+            await conn.create_index("expires_at", expireAfterSeconds=0)
+
+            document: dict[str, Any]
+            async for document in conn.find(
+                {"expires_at": {"$gt": datetime.now(tz=UTC)}},
+                {"jti": 1, "expires_at": 1},
+            ):
+                # MongoDB 는 시간대 없는 UTC datetime 을 반환
+                expires_at: datetime = document["expires_at"].replace(tzinfo=UTC)
+                self.bloom.add(document["jti"], expires_at.timestamp())
+                loaded += 1
+
+        logger.info("Refresh token revocations loaded", count=loaded)
+        return loaded
+
+
+refresh_token_revocations = RefreshTokenRevocations(
+    SharedBloomFilter(
+        REVOCATION_BLOOM_PATH,
+        REVOCATION_BLOOM_GENERATION_SECONDS,
+        REVOCATION_BLOOM_BITS,
+        REVOCATION_BLOOM_HASHES,
+    )
+)
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from os import environ
+
+from dotenv import load_dotenv
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from structlog import BoundLogger
+from supertokens_python import InputAppInfo, SupertokensConfig, init
+from supertokens_python.framework.fastapi import get_middleware
+from supertokens_python.recipe import emailpassword, session
+
+from utils import Logger
+
+load_dotenv()
+
+logger: BoundLogger = Logger().setup()
+
+SUPERTOKENS_BASE_PATH: str = "/auth"
+
+# session, emailpassword 레시피의 get_all_cors_headers() 결과
+# CORS 미들웨어는 앱 생성 시 헤더 목록이 필요하지만 SDK 는 첫 /auth 요청 때 초기화하므로 고정 목록 사용
+SUPERTOKENS_CORS_HEADERS: tuple[str, ...] = (
+    "anti-csrf",
+    "authorization",
+    "fdi-version",
+    "rid",
+    "st-auth-mode",
+)
+
+
+@dataclass(frozen=True)
+class SuperTokensSettings:
+    connection_uri: str
+    api_key: str
+    api_domain: str = "http://localhost:8000"
+    website_domain: str = "http://localhost:3000"
+
+    @classmethod
+    def from_env(cls) -> "SuperTokensSettings":
+        return cls(
+            connection_uri=environ.get(
+                "SUPERTOKENS_CONNECTION_URI", "http://localhost:3567"
+            ),
+            api_key=environ["SUPERTOKEN_API_KEY"],
+            api_domain=environ.get("SUPERTOKENS_API_DOMAIN", "http://localhost:8000"),
+            website_domain=environ.get(
+                "SUPERTOKENS_WEBSITE_DOMAIN", "http://localhost:3000"
+            ),
+        )
+
+
+class SuperTokensApp:
+    """
+    /auth 경로에만 마운트하는 SuperTokens ASGI 앱
+
+    - 카탈로그, 이미지 업로드 등 다른 경로는 SuperTokens 미들웨어를 거치지 않음
+    - SDK 초기화는 첫 /auth 요청 시 워커별로 1회 수행
+    """
+
+    def __init__(self, settings: SuperTokensSettings) -> None:
+        self.settings = settings
+        self._app: ASGIApp | None = None
+
+    @property
+    def initialized(self) -> bool:
+        return self._app is not None
+
+    def _build(self) -> ASGIApp:
+        init(
+            app_info=InputAppInfo(
+                app_name="cocktail-maker",
+                api_domain=self.settings.api_domain,
+                website_domain=self.settings.website_domain,
+                api_base_path=SUPERTOKENS_BASE_PATH,
+                website_base_path=SUPERTOKENS_BASE_PATH,
+            ),
+            supertokens_config=SupertokensConfig(
+                connection_uri=self.settings.connection_uri,
+                api_key=self.settings.api_key,
+            ),
+            framework="fastapi",
+            recipe_list=[
+                session.init(),
+                emailpassword.init(),
+            ],
+            mode="asgi",  # wsgi
+        )
+        logger.info(
+            "SuperTokens initialized", connection_uri=self.settings.connection_uri
+        )
+
+        # SuperTokens 가 처리하지 않은 /auth 요청은 404
+        fallback = FastAPI(
+            openapi_url=None,
+            docs_url=None,
+            redoc_url=None,
+            default_response_class=ORJSONResponse,
+        )
+        return get_middleware()(fallback)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._app is None:
+            self._app = self._build()
+
+        # SDK 는 root_path 를 제외한 경로를 api_base_path(/auth)와 비교하므로 마운트 경로를 되돌림
+        root_path: str = scope.get("root_path", "")
+        scope = {**scope, "root_path": root_path.removesuffix(SUPERTOKENS_BASE_PATH)}
+        await self._app(scope, receive, send)
+
+
+supertokens_app = SuperTokensApp(SuperTokensSettings.from_env())
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from math import ceil
+from os import environ
+from pathlib import Path
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from structlog import BoundLogger
+
+from utils import Logger
+from utils.shared_state import (
+    WINDOW_CURRENT,
+    SharedCounters,
+    SharedSlotTable,
+    slide_window,
+    window_usage,
+)
+
+load_dotenv()
+
+logger: BoundLogger = Logger().setup()
+
+LOGIN_THROTTLE_PATH: Path = Path(
+    environ.get("LOGIN_THROTTLE_PATH", "../data/.login-throttle")
+)
+
+# 레코드 필드: 슬라이딩 윈도우(0~2), 연속 실패, 차단 해제 시각
+FAILURES, BLOCKED_UNTIL = 3, 4
+
+COUNTER_NAMES: tuple[str, ...] = (
+    "allowed",
+    "rejected_ip",
+    "rejected_account",
+    "rejected_backoff",
+    "failures",
+    "successes",
+)
+
+
+@dataclass(frozen=True)
+class LoginThrottlePolicy:
+    """
+    로그인 제한 정책
+
+    - window_seconds: 슬라이딩 윈도우 길이
+    - ip_limit, account_limit: 윈도우당 IP, 계정별 최대 로그인 시도 수
+    - free_failures: 백오프 없이 허용하는 연속 실패 수
+    - backoff_base_seconds, backoff_max_seconds: 이후 실패마다 2배씩 늘어나는 차단 시간
+    """
+
+    window_seconds: float = 60.0
+    ip_limit: int = 20
+    account_limit: int = 10
+    free_failures: int = 3
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 900.0
+
+    @classmethod
+    def from_env(cls) -> "LoginThrottlePolicy":
+        return cls(
+            window_seconds=float(environ.get("LOGIN_WINDOW_SECONDS", "60")),
+            ip_limit=int(environ.get("LOGIN_IP_LIMIT", "20")),
+            account_limit=int(environ.get("LOGIN_ACCOUNT_LIMIT", "10")),
+            free_failures=int(environ.get("LOGIN_FREE_FAILURES", "3")),
+            backoff_base_seconds=float(environ.get("LOGIN_BACKOFF_BASE_SECONDS", "1")),
+            backoff_max_seconds=float(environ.get("LOGIN_BACKOFF_MAX_SECONDS", "900")),
+        )
+
+
+def _too_many_requests(retry_after: float, detail: str) -> HTTPException:
+    return HTTPException(
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        detail,
+        headers={"Retry-After": str(max(1, ceil(retry_after)))},
+    )
+
+
+class LoginThrottle:
+    """
+    워커 간 공유되는 로그인 시도 제한
+
+    키 유도(PBKDF2) 전에 호출하여 대량 대입 공격이 워커 CPU 를 점유하지 못하도록 차단
+    - IP, 계정별 슬라이딩 윈도우 (이전 윈도우 횟수를 경과 비율만큼 가중)
+    - 계정별 연속 실패 시 지수 백오프
+    """
+
+    def __init__(
+        self,
+        policy: LoginThrottlePolicy,
+        path: Path = LOGIN_THROTTLE_PATH,
+        slots: int = 8192,
+    ) -> None:
+        self.policy = policy
+        self._table = SharedSlotTable(path, fields=5, slots=slots)
+        self._counters = SharedCounters(
+            path.with_name(f"{path.name}.counters"), COUNTER_NAMES
+        )
+
+    def check(self, user_id: str, client_ip: str) -> None:
+        """
+        로그인 시도 허용 여부 확인, 거절 시 429 HTTPException
+
+        IP, 계정 레코드를 한 번의 잠금으로 확인하고 모두 허용할 때만 함께 차감하여,
+        이미 계정이 차단된 시도가 같은 IP(NAT 뒤 다른 사용자)의 한도를 소모하지 않음
+        """
+        policy: LoginThrottlePolicy = self.policy
+        window: float = policy.window_seconds
+
+        def take(records: list[list[float]], now: float) -> tuple[str, float] | None:
+            user_values, ip_values = records
+            blocked_for: float = user_values[BLOCKED_UNTIL] - now
+            if blocked_for > 0:
+                return "rejected_backoff", blocked_for
+
+            ip_elapsed: float = slide_window(ip_values, now, window)
+            if window_usage(ip_values, ip_elapsed, window) + 1 > policy.ip_limit:
+                return "rejected_ip", window - ip_elapsed
+
+            user_elapsed: float = slide_window(user_values, now, window)
+            if (
+                window_usage(user_values, user_elapsed, window) + 1
+                > policy.account_limit
+            ):
+                return "rejected_account", window - user_elapsed
+
+            ip_values[WINDOW_CURRENT] += 1
+            user_values[WINDOW_CURRENT] += 1
+            return None
+
+        rejected: tuple[str, float] | None = self._table.update_all(
+            (f"user:{user_id}", f"ip:{client_ip}"), take
+        )
+        if rejected is None:
+            self._counters.increment("allowed")
+            return
+
+        reason, retry_after = rejected
+        self._counters.increment(reason)
+        if reason == "rejected_backoff":
+            raise _too_many_requests(retry_after, "Too many failed sign-in attempts")
+        if reason == "rejected_ip":
+            logger.warning("Sign-in rate limited by client IP", client_ip=client_ip)
+        else:
+            logger.warning("Sign-in rate limited by account", user_id=user_id)
+        raise _too_many_requests(retry_after, "Too many sign-in attempts")
+
+    def record_failure(self, user_id: str) -> None:
+        policy: LoginThrottlePolicy = self.policy
+
+        def fail(values: list[float], now: float) -> None:
+            values[FAILURES] += 1
+            excess: float = values[FAILURES] - policy.free_failures
+            if excess > 0:
+                values[BLOCKED_UNTIL] = now + min(
+                    policy.backoff_base_seconds * 2 ** (excess - 1),
+                    policy.backoff_max_seconds,
+                )
+
+        self._table.update(f"user:{user_id}", fail)
+        self._counters.increment("failures")
+
+    def record_success(self, user_id: str) -> None:
+        def succeed(values: list[float], _: float) -> None:
+            values[FAILURES] = 0.0
+            values[BLOCKED_UNTIL] = 0.0
+
+        self._table.update(f"user:{user_id}", succeed)
+        self._counters.increment("successes")
+
+    def stats(self) -> dict[str, int]:
+        return self._counters.snapshot()
+
+
+login_throttle = LoginThrottle(LoginThrottlePolicy.from_env())
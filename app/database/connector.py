@@ -8,12 +8,15 @@ from pymongo.asynchronous.collection import AsyncCollection
 from pymongo.asynchronous.database import AsyncDatabase
 from sqlmodel import Session
 
+from .monitoring import instrument_sqlite
 from .table import engine
 
 load_dotenv()
 MONGODB_URL: str = environ["MONGODB_URL"]
 SQLITE_PATH: str = environ["SQLITE_PATH"]
 
+instrument_sqlite(engine)
+
 
 @asynccontextmanager
 async def mongodb_conn(collection: str) -> AsyncGenerator[AsyncCollection]:
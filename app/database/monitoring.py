@@ -0,0 +1,181 @@
+from time import perf_counter
+from typing import Any
+
+from pymongo import monitoring
+from sqlalchemy import Engine, event
+
+from utils.metrics import DB_OPERATION_DURATION
+from utils.server_timing import record_timing
+from utils.slow_requests import capturing_commands, record_command
+from utils.tracing import Span, tracer
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    MongoDB 명령별 지연 시간 기록, 드라이버가 측정한 duration_micros 사용
+
+    느린 요청 수집 중이면 요청별 명령 목록에도 기록하고, 트레이스 중이면 CLIENT span 생성
+    """
+
+    def __init__(self) -> None:
+        # 완료 이벤트에는 명령 본문이 없으므로 시작 시 대상 컬렉션 보관
+        self._targets: dict[int, str] = {}
+        self._spans: dict[int, Span] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if capturing_commands():
+            self._targets[event.request_id] = str(
+                event.command.get(event.command_name, "")
+            )
+        span: Span | None = tracer.begin(
+            f"mongodb.{event.command_name}",
+            "CLIENT",
+            **{
+                "db.system": "mongodb",
+                "db.namespace": event.database_name,
+                "db.operation.name": event.command_name,
+                "db.collection.name": str(event.command.get(event.command_name, "")),
+            },
+        )
+        if span is not None:
+            self._spans[event.request_id] = span
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finish(event, "success")
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finish(event, "failure")
+
+    def _finish(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        status: str,
+    ) -> None:
+        duration: float = event.duration_micros / 1e6
+        DB_OPERATION_DURATION.observe(("mongodb", event.command_name, status), duration)
+        record_timing("db", duration)
+        target: str | None = self._targets.pop(event.request_id, None)
+        if target is not None:
+            record_command("mongodb", event.command_name, target, duration, status)
+        span: Span | None = self._spans.pop(event.request_id, None)
+        if span is not None:
+            if isinstance(event, monitoring.CommandFailedEvent):
+                span.status, span.status_message = "ERROR", str(event.failure)
+            tracer.end(span)
+
+
+class MongoPoolMonitor(monitoring.ConnectionPoolListener):
+    """
+    워커의 모든 클라이언트에서 사용 중인 연결과 연결을 기다리는 작업 수
+
+    checkout 시작 후 성공, 실패 전까지를 대기로 보며 대기가 늘면 풀 포화
+    """
+
+    def __init__(self) -> None:
+        self.in_use: int = 0
+        self.waiting: int = 0
+        self.open: int = 0
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        self.open += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        self.open -= 1
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        self.waiting += 1
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        self.waiting -= 1
+
+    def connection_checked_out(
+        self, event: monitoring.ConnectionCheckedOutEvent
+    ) -> None:
+        self.waiting -= 1
+        self.in_use += 1
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        self.in_use -= 1
+
+    def stats(self) -> dict[str, int]:
+        return {"open": self.open, "in_use": self.in_use, "waiting": self.waiting}
+
+
+mongo_pool = MongoPoolMonitor()
+
+
+def instrument_sqlite(engine: Engine) -> None:
+    """SQLite 구문 종류(SELECT, INSERT 등)별 지연 시간 기록, 트레이스 중이면 span 생성"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before(  # noqa: PLR0913, PLR0917
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        many: bool,
+    ) -> None:
+        context._metrics_started = perf_counter()
+        context._trace_span = tracer.begin(
+            f"sqlite.{statement.split(None, 1)[0].upper()}",
+            "CLIENT",
+            **{"db.system": "sqlite", "db.query.text": statement},
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after(  # noqa: PLR0913, PLR0917
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        many: bool,
+    ) -> None:
+        kind: str = statement.split(None, 1)[0].upper()
+        duration: float = perf_counter() - context._metrics_started
+        DB_OPERATION_DURATION.observe(("sqlite", kind, "success"), duration)
+        record_timing("db", duration)
+        record_command("sqlite", kind, statement[:200], duration, "success")
+        if context._trace_span is not None:
+            tracer.end(context._trace_span)
+
+    @event.listens_for(engine, "handle_error")
+    def failed(exception_context: Any) -> None:
+        context: Any = exception_context.execution_context
+        started: float | None = getattr(context, "_metrics_started", None)
+        if started is None:
+            return
+        statement: str = exception_context.statement or "UNKNOWN"
+        kind: str = statement.split(None, 1)[0].upper()
+        duration: float = perf_counter() - started
+        DB_OPERATION_DURATION.observe(("sqlite", kind, "failure"), duration)
+        record_timing("db", duration)
+        record_command("sqlite", kind, statement[:200], duration, "failure")
+        span: Span | None = getattr(context, "_trace_span", None)
+        if span is not None:
+            tracer.end(span, exception_context.original_exception)
+
+
+# 전역 리스너는 이후 생성되는 모든 클라이언트에 적용되므로 mongodb_conn 보다 먼저 등록
+monitoring.register(MongoCommandMetrics())
+monitoring.register(mongo_pool)
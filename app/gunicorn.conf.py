@@ -1,4 +1,5 @@
 import os
+import shutil
 from multiprocessing import cpu_count
 
 from dotenv import load_dotenv
@@ -103,3 +104,9 @@ elif ENVIRONMENT == "production":
 # suppress_ragged_eofs = True
 # do_handshake_on_connect = False
 # ciphers = "ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS"
+
+
+##### Server Hooks #####
+def on_starting(server) -> None:  # noqa: ANN001
+    """이전 실행의 워커별 메트릭 스냅숏 삭제, 재시작 시 카운터는 0 부터 시작"""
+    shutil.rmtree(os.getenv("METRICS_DIR", "../data/.metrics"), ignore_errors=True)
@@ -1,9 +1,17 @@
-from asyncio import set_event_loop_policy as set_global_asyncio_event_loop_policy
-from collections.abc import Awaitable, Callable
+from asyncio import (
+    CancelledError,
+    create_task,
+    gather,
+    set_event_loop_policy as set_global_asyncio_event_loop_policy,
+    to_thread,
+)
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from datetime import UTC, datetime
+from hmac import compare_digest
 from os import environ
 from time import time_ns
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from dotenv import load_dotenv
 from fastapi import (
@@ -23,26 +31,27 @@ from fastapi import (
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import ORJSONResponse
-from pyinstrument import Profiler
+from fastapi.responses import PlainTextResponse
+from jwt import InvalidTokenError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette_compress import CompressMiddleware
 from structlog import BoundLogger
-from supertokens_python import (
-    InputAppInfo,
-    SupertokensConfig,
-    get_all_cors_headers,
-    init,
-)
-from supertokens_python.framework.fastapi import get_middleware
-from supertokens_python.recipe import emailpassword, session
 from uvloop import EventLoopPolicy as uvloopEventLoopPolicy
 
 from auth import (
+    SUPERTOKENS_BASE_PATH,
+    SUPERTOKENS_CORS_HEADERS,
+    APIKeyInfo,
     ProductionAPIKeyGenerator,
+    RateLimit,
     VerifyToken,
+    api_key_store,
+    api_key_usage,
+    login_throttle,
     refresh_access_token,
+    refresh_token_revocations,
+    revoke_refresh_token,
     sign_in_token,
+    supertokens_app,
 )
 from model import (
     COCKTAIL_DATA_KIND,
@@ -71,35 +80,60 @@ from model import (
     User,
 )
 from model.validation import ImageValidation
-from query import metadata, queries
+from query import health, image_gc, metadata, queries
+from storage import get_image_storage
 from utils import Logger, problem_details_formatter, return_formatter
-
-init(
-    app_info=InputAppInfo(
-        app_name="cocktail-maker",
-        api_domain="http://localhost:8000",
-        website_domain="http://localhost:3000",
-        api_base_path="/auth",
-        website_base_path="/auth",
-    ),
-    supertokens_config=SupertokensConfig(
-        connection_uri="http://localhost:3567",
-        api_key="73a50f5ae216404588bbbcee4f05b143",
-    ),
-    framework="fastapi",
-    recipe_list=[
-        session.init(),
-        emailpassword.init(),
-    ],
-    mode="asgi",  # wsgi
+from utils.compression import CompressionMiddleware
+from utils.headers import CustomHeadersMiddleware
+from utils.loop_monitor import loop_monitor
+from utils.metrics import MetricsMiddleware, metrics
+from utils.profiling import ProfilingMiddleware, continuous_profiler, to_speedscope
+from utils.server_timing import (
+    ServerTimingMiddleware,
+    TimedORJSONResponse as ORJSONResponse,
 )
+from utils.slow_requests import SlowRequestMiddleware, slow_requests
+from utils.tracing import TracingMiddleware
 
 set_global_asyncio_event_loop_policy(uvloopEventLoopPolicy())
 
 load_dotenv()
 logger: BoundLogger = Logger().setup()
 
-SUPERTOKEN_API_KEY: str = environ["SUPERTOKEN_API_KEY"]
+METRICS_TOKEN: str | None = environ.get("METRICS_TOKEN")
+
+
+async def load_refresh_token_revocations() -> None:
+    """공유 Bloom filter 에 DB 의 폐기 목록 반영, 실패해도 서비스는 계속 실행"""
+    try:
+        await refresh_token_revocations.load()
+    except Exception as e:
+        logger.error("Load refresh token revocations has an error", error=str(e))
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """워커별 백그라운드 작업 시작 및 종료"""
+    background_tasks = [
+        create_task(load_refresh_token_revocations()),
+        create_task(api_key_usage.run_forever()),
+        create_task(metrics.run_forever()),
+        create_task(loop_monitor.run_forever()),
+        create_task(health.readiness.run_forever()),
+        create_task(continuous_profiler.run_forever()),
+        create_task(image_gc.cleanup_worker()),
+        create_task(image_gc.OrphanImageGC().run_forever()),
+    ]
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    with suppress(CancelledError):
+        await gather(*background_tasks)
+
+    await get_image_storage().close()
+
 
 cocktail_maker = FastAPI(
     title="Cocktail maker REST API",
@@ -134,129 +168,12 @@ cocktail_maker = FastAPI(
     default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
 
-@cocktail_maker.middleware("http")
-async def profile_request(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """
-    성능 프로파일링 미들웨어
-
-    쿼리 파라미터 ?profile=true로 요청 시 해당 요청의 성능 프로파일을 HTML로 반환
-
-    Profiler 설정 옵션:
-    - interval (float, 기본값: 0.001): 샘플링 간격 (초)
-      * 작은 값 (0.0001): 높은 정확도, 높은 오버헤드
-      * 큰 값 (0.01): 낮은 오버헤드, 낮은 정확도
-
-    - async_mode (AsyncMode, 기본값: "enabled"): async/await 추적 모드
-      * "enabled": await 지점에서 대기 시간 추적, 실제 코드 실행 시간만 측정 (권장)
-      * "disabled": async/await 지원 없이 모든 실행 추적 (이벤트 루프, 다른 코루틴 포함)
-      * "strict": 현재 async context만 엄격하게 프로파일링, 다른 context는 <out-of-context>로 표시
-
-    - use_timing_thread (bool | None, 기본값: None): 별도 타이밍 스레드 사용 여부
-      * True: 시간 측정 오버헤드가 큰 시스템에서 성능 향상을 위해 별도 스레드 사용
-      * False: 메인 스레드에서 시간 측정
-      * None: pyinstrument가 자동으로 최적 방법 선택
-
-    프로파일링 출력 형식:
-    - output_html(): 대화형 HTML 출력 (웹 브라우저에서 확인, 트리 구조 탐색 가능)
-    - output_text(): 콘솔용 텍스트 출력 (터미널에서 확인, 간단한 텍스트 형태)
-    - write_html(path): HTML 파일로 저장 (파일 시스템에 저장 후 나중에 확인)
-    - open_in_browser(): 웹 브라우저에서 자동 열기 (즉시 시각화된 결과 확인)
-    - print(): 콘솔에 직접 출력 (실시간 결과 확인)
-
-    텍스트 출력 옵션:
-    - unicode: 유니코드 문자 사용 여부 (트리 구조 표시용)
-    - color: 컬러 출력 여부 (터미널 색상 지원 시)
-    - show_all: 모든 함수 표시 여부 (기본적으로 빠른 함수는 숨김)
-    - timeline: 타임라인 뷰 표시 여부 (시간 흐름에 따른 실행 순서)
-    - time: 시간 표시 형식 ("seconds" 또는 "percent_of_total")
-    - flat: 플랫 뷰 표시 여부 (호출 스택 대신 함수별 총 시간)
-    - short_mode: 간단 모드 (요약된 출력)
-
-    Args:
-        request: FastAPI 요청 객체
-        call_next: 다음 미들웨어 또는 엔드포인트 호출 함수
-
-    Returns:
-        HTMLResponse: 프로파일링 결과 HTML (profile=true인 경우)
-        Response: 일반 응답 (profile=false 또는 없는 경우)
-
-    Examples:
-        # 기본 프로파일링 활성화
-        GET /api/v1/health?profile=true
-
-        # 고정밀 프로파일링 (짧은 함수 분석용)
-        profiler = Profiler(interval=0.0001, async_mode="enabled")
-
-        # 저오버헤드 프로파일링 (긴 실행 시간용)
-        profiler = Profiler(interval=0.01, async_mode="disabled")
-
-        # 엄격한 async context 프로파일링
-        profiler = Profiler(interval=0.001, async_mode="strict")
-
-        # 다양한 출력 방식 지원
-        1. HTML로 브라우저에서 확인
-        profiler.open_in_browser()
-
-        2. 파일로 저장
-        profiler.write_html("profile_result.html")
-
-        3. 콘솔에 텍스트로 출력
-        profiler.print(color=True, unicode=True)
-        - 콘솔 출력 옵션
-          * unicode: 유니코드 문자 사용 (트리 구조 표시용)
-          * color: 컬러 출력 (터미널 색상 지원 시)
-          * show_all: 모든 함수 표시 (기본적으로 빠른 함수는 숨김)
-          * timeline: 타임라인 뷰 표시 (시간 흐름에 따른 실행 순서)
-          * time: 시간 표시 형식 ("seconds" 또는 "percent_of_total")
-          * flat: 트리 구조로 호출 스택 표시
-          * short_mode: 간단 모드 (요약된 출력)
-
-        4. 문자열로 가져와서 로그에 기록
-        text_output = profiler.output_text(color=False)
-        logger.info(f"Profile result:\n{text_output}")
-    """
-    profiling: bool = request.query_params.get("profile") == "true"
-
-    if profiling:
-        with Profiler() as profiler:
-            response: Response = await call_next(request)
-
-        # Console output
-        profiler.print(
-            color=True,
-            unicode=True,
-            show_all=False,
-            timeline=True,
-            flat=False,
-            short_mode=True,
-            time="percent_of_total",
-        )
-
-        # File write
-        # # 파일명에 번호 추가 로직
-        # base_filename = "profile.speedscope"
-        # extension = ".json"
-        # filename = f"{base_filename}-0{extension}"
-        # counter = 0
-
-        # # 파일이 존재하면 번호를 증가시켜 새로운 파일명 생성
-        # while PathLib(filename).exists():
-        #     counter += 1
-        #     filename = f"{base_filename}-{counter}{extension}"
-
-        # async with aiofiles.open(filename, "w") as out:
-        #     await out.write(profiler.output(renderer=SpeedscopeRenderer()))
-
-        # HTML view
-        # return HTMLResponse(profiler.output_html())
-        return response
-    else:
-        return await call_next(request)
+# ?profile=true 요청은 콘솔에 프로파일 출력, PROFILE_CONTINUOUS=true 면 일부 요청을 누적
+cocktail_maker.add_middleware(ProfilingMiddleware)
 
 
 # cocktail_maker.add_middleware(
@@ -370,43 +287,42 @@ POST: preflight requests were made except for "text/plain", "application/x-www-f
 # )
 
 
-@cocktail_maker.middleware("http")
-async def add_custom_headers(request: Request, call_next):  # noqa: ANN001, ANN201
-    response = await call_next(request)
-
-    # Application global custom headers
-    response.headers["X-Server-Version"] = cocktail_maker.version
-
-    # Security headers
-    # response.headers["X-Content-Type-Options"] = "nosniff"
-    # response.headers["X-Frame-Options"] = "DENY"
-    # response.headers["X-XSS-Protection"] = "1; mode=block"
-    # response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    # response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
-    # Content Security Policy for API
-    # response.headers["Content-Security-Policy"] = (
-    #     "default-src 'self'; "
-    #     "script-src 'self'; "
-    #     "style-src 'self' 'unsafe-inline'; "
-    #     "img-src 'self' data: https:; "
-    #     "font-src 'self'; "
-    #     "connect-src 'self'; "
-    #     "media-src 'none'; "
-    #     "object-src 'none'; "
-    #     "base-uri 'self'; "
-    #     "form-action 'self'; "
-    #     "frame-ancestors 'none'"
-    # )
-
-    return response
-
-
 cocktail_maker.add_middleware(
-    CompressMiddleware, minimum_size=1, zstd_level=4, brotli_quality=4, gzip_level=6
+    CustomHeadersMiddleware,
+    headers=[
+        # Application global custom headers
+        ("X-Server-Version", cocktail_maker.version),
+        # Security headers
+        # ("X-Content-Type-Options", "nosniff"),
+        # ("X-Frame-Options", "DENY"),
+        # ("X-XSS-Protection", "1; mode=block"),
+        # ("Referrer-Policy", "strict-origin-when-cross-origin"),
+        # ("Permissions-Policy", "geolocation=(), microphone=(), camera=()"),
+        # Content Security Policy for API
+        # (
+        #     "Content-Security-Policy",
+        #     "default-src 'self'; "
+        #     "script-src 'self'; "
+        #     "style-src 'self' 'unsafe-inline'; "
+        #     "img-src 'self' data: https:; "
+        #     "font-src 'self'; "
+        #     "connect-src 'self'; "
+        #     "media-src 'none'; "
+        #     "object-src 'none'; "
+        #     "base-uri 'self'; "
+        #     "form-action 'self'; "
+        #     "frame-ancestors 'none'",
+        # ),
+    ],
 )
 
-cocktail_maker.add_middleware(get_middleware())
+
+# COMPRESS_MIN_SIZE 미만이거나 목록 밖의 Content-Type 은 압축하지 않고,
+# GET 응답의 압축 결과는 ETag, 인코딩별로 캐시
+cocktail_maker.add_middleware(CompressionMiddleware)
+
+# 압축까지 감싸 Server-Timing 에 compress 단계 추가
+cocktail_maker.add_middleware(ServerTimingMiddleware)
 
 # Add security middleware
 cocktail_maker.add_middleware(
@@ -422,9 +338,18 @@ cocktail_maker.add_middleware(
     ],
     allow_credentials=True,
     allow_methods=["GET", "PUT", "POST", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["Content-Type", *get_all_cors_headers()],
+    allow_headers=["Content-Type", *SUPERTOKENS_CORS_HEADERS],
 )
 
+# 라우트별 기준을 넘는 요청을 DB 명령, 프로파일과 함께 수집
+cocktail_maker.add_middleware(SlowRequestMiddleware)
+
+# TRACING_ENABLED=true 일 때 traceparent 전파, 헤드 샘플링된 요청의 span 기록
+cocktail_maker.add_middleware(TracingMiddleware)
+
+# 가장 바깥에서 CORS, 호스트 검증에서 끝난 요청과 압축 후 응답 크기까지 기록
+cocktail_maker.add_middleware(MetricsMiddleware)
+
 
 @cocktail_maker.exception_handler(Exception)
 async def general_exception_handler_rfc(
@@ -480,6 +405,7 @@ async def http_exception_handler_rfc(
             content=problem_details,
             status_code=exc.status_code,
             media_type="application/problem+json",
+            headers=getattr(exc, "headers", None),
         )
 
     return await http_exception_handler(request, exc)
@@ -500,7 +426,6 @@ async def sign_up(user: Annotated[User, Body(...)]) -> Response:
 
     Raises:
         HTTPException: 409 - 이미 존재하는 사용자인 경우
-        HTTPException: 401 - 회원가입 후 로그인 검증에 실패한 경우
 
     Returns:
         Response:
@@ -513,16 +438,8 @@ async def sign_up(user: Annotated[User, Body(...)]) -> Response:
         if not await queries.Users.sign_up(user):
             raise HTTPException(status.HTTP_409_CONFLICT, "User already exists")
 
-        login = Login(
-            userId=user.user_id,
-            password=user.password,
-        )
-        if (roles := await queries.Users.sign_in(login)) == []:
-            raise HTTPException(
-                status.HTTP_401_UNAUTHORIZED, "Invalid user_id or password"
-            )
-
-        jwt: dict[str, str] = sign_in_token(login.userId, roles)
+        # 방금 저장한 사용자 정보로 토큰 발급, 비밀번호 재검증(키 유도)은 생략
+        jwt: dict[str, str] = sign_in_token(user.user_id, user.roles)
 
     except HTTPException as he:
         return Response(
@@ -555,24 +472,34 @@ async def sign_up(user: Annotated[User, Body(...)]) -> Response:
 
 
 @cocktail_maker_v1.post("/signin", summary="로그인", tags=["인증"])
-async def sign_in(login: Annotated[Login, Body(...)]) -> Response:
+async def sign_in(request: Request, login: Annotated[Login, Body(...)]) -> Response:
     """로그인
 
     Args:
+        request (Request): 요청 객체, 클라이언트 IP 확인용
         login (Annotated[Login, Body): 로그인 정보
 
     Raises:
+        HTTPException: 429 - 시도 횟수 제한 또는 연속 실패로 차단된 경우
         HTTPException: 로그인 실패 시
 
     Returns:
         Response: 로그인 성공 시 JWT 쿠키 설정
     """
+    # 비밀번호 키 유도 전에 제한하여 대입 공격이 CPU 를 소모하지 못하도록 함
+    login_throttle.check(
+        login.userId, request.client.host if request.client else "unknown"
+    )
+
     try:
         if (roles := await queries.Users.sign_in(login)) == []:
+            login_throttle.record_failure(login.userId)
             raise HTTPException(
                 status.HTTP_401_UNAUTHORIZED, "Invalid user_id or password"
             )
 
+        login_throttle.record_success(login.userId)
+
         jwt: dict[str, str] = sign_in_token(login.userId, roles)
 
         logger.info("User successfully logged in", user_id=login.userId, roles=roles)
@@ -626,8 +553,11 @@ async def refresh_token(request: Request) -> Response:
         if refresh_token is None:
             raise HTTPException(status_code=401, detail="Refresh token is missing")
 
-        # 액세스 토큰 갱신
-        new_token: dict[str, str] = await refresh_access_token(refresh_token)
+        # 액세스 토큰 갱신, 폐기되었거나 유효하지 않은 토큰은 401
+        try:
+            new_token: dict[str, str] = await refresh_access_token(refresh_token)
+        except InvalidTokenError as ite:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, str(ite)) from ite
 
         logger.info(
             "Access token successfully refreshed", used_token=new_token["accessToken"]
@@ -656,6 +586,50 @@ async def refresh_token(request: Request) -> Response:
     return response
 
 
+@cocktail_maker_v1.post("/signout", summary="로그아웃", tags=["인증"])
+async def sign_out(request: Request) -> Response:
+    """로그아웃, 리프레시 토큰을 폐기하고 토큰 쿠키 삭제
+
+    Args:
+        request (Request): 요청 객체
+
+    Returns:
+        Response: 204 No Content
+    """
+    if (refresh_token := request.cookies.get("refreshToken")) is not None:
+        try:
+            await revoke_refresh_token(refresh_token)
+        except InvalidTokenError as ite:
+            raise HTTPException(status.HTTP_401_UNAUTHORIZED, str(ite)) from ite
+
+    response = Response(status_code=204)
+    response.delete_cookie("accessToken", path="/", secure=True, httponly=True)
+    response.delete_cookie(
+        "refreshToken", path="/refresh-token", secure=True, httponly=True
+    )
+
+    return response
+
+
+@cocktail_maker_v1.put(
+    "/users/{user_id}/roles", summary="사용자 권한 변경", tags=["인증"]
+)
+async def update_user_roles(
+    user_id: Annotated[str, Path(..., min_length=4, max_length=14)],
+    roles: Annotated[list[str], Body(..., min_length=1, max_length=4)],
+    _: Annotated[None, Security(VerifyToken(["admin"]))],
+) -> ORJSONResponse:
+    """사용자 권한 변경, 모든 워커의 권한 캐시를 무효화하여 다음 토큰 갱신부터 반영"""
+    if not await queries.Users.update_roles(user_id, roles):
+        raise HTTPException(status.HTTP_404_NOT_FOUND, "User not found")
+
+    return ORJSONResponse(
+        return_formatter(
+            "success", 200, {"roles": roles}, "Successfully updated user roles"
+        )
+    )
+
+
 @cocktail_maker_v1.get("/my-role", summary="내 JWT 권한 확인", tags=["인증"])
 async def my_role(
     _: Annotated[None, Security(VerifyToken(["admin", "user"]))],
@@ -675,6 +649,23 @@ async def my_role(
     return ORJSONResponse(formatted_response, status.HTTP_200_OK)
 
 
+@cocktail_maker_v1.get(
+    "/login-throttle", summary="로그인 제한 카운터 확인", tags=["인증"]
+)
+async def login_throttle_stats(
+    _: Annotated[None, Security(VerifyToken(["admin"]))],
+) -> ORJSONResponse:
+    """모든 워커에서 누적된 로그인 허용, 거절, 실패 횟수"""
+    return ORJSONResponse(
+        return_formatter(
+            "success",
+            200,
+            login_throttle.stats(),
+            "Successfully get login throttle counters",
+        )
+    )
+
+
 @cocktail_maker_v1.post("/publish-api-key", summary="API 키 발급", tags=["인증"])
 async def publish_api_key(
     api_key_publish: Annotated[ApiKeyPublish, Body(...)],
@@ -682,6 +673,8 @@ async def publish_api_key(
 ) -> ORJSONResponse:
     generator: ProductionAPIKeyGenerator = ProductionAPIKeyGenerator.from_env()
     api_key: str = generator.generate_api_key(api_key_publish.domain, time_ns())
+    # 키 원문은 저장하지 않고 HMAC 인덱스만 저장
+    await api_key_store.register(api_key, api_key_publish)
 
     return ORJSONResponse(
         return_formatter(
@@ -702,6 +695,89 @@ async def health_check() -> ORJSONResponse:
     return ORJSONResponse(formatted_response, status.HTTP_200_OK)
 
 
+@cocktail_maker_v1.get("/profiles", summary="상시 프로파일 조회", tags=["기타"])
+async def continuous_profiles(
+    _: Annotated[None, Security(VerifyToken(["admin"]))],
+    route: Annotated[str | None, Query()] = None,
+    since: Annotated[float, Query(ge=0)] = 0.0,
+    output: Annotated[Literal["collapsed", "speedscope"], Query()] = "speedscope",
+) -> Response:
+    """
+    모든 워커가 내보낸 라우트별 프로파일 합산
+
+    - collapsed: flamegraph.pl 입력 형식 (`라우트;프레임;... 마이크로초`)
+    - speedscope: https://www.speedscope.app 에서 열 수 있는 JSON
+    """
+    # 현재 워커 집계는 이벤트 루프에서 복사하고 파일 읽기만 스레드에서 수행
+    stacks = await to_thread(
+        continuous_profiler.load, since, route, continuous_profiler.snapshot()
+    )
+
+    if output == "collapsed":
+        return PlainTextResponse(
+            "".join(
+                f"{line_route};{stack} {weight}\n"
+                for line_route, route_stacks in stacks.items()
+                for stack, weight in route_stacks.items()
+            )
+        )
+    return ORJSONResponse(to_speedscope(stacks))
+
+
+@cocktail_maker_v1.get("/slow-requests", summary="느린 요청 조회", tags=["기타"])
+async def slow_request_captures(
+    _: Annotated[None, Security(VerifyToken(["admin"]))],
+    route: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> ORJSONResponse:
+    """모든 워커에서 수집한 느린 요청을 최신순으로 반환"""
+    captures = await to_thread(slow_requests.load, route, limit)
+
+    return ORJSONResponse(
+        return_formatter(
+            "success", 200, captures, "Successfully get slow request captures"
+        )
+    )
+
+
+@cocktail_maker_v1.get("/ready", summary="서비스 준비 상태 확인", tags=["기타"])
+async def readiness_check() -> ORJSONResponse:
+    """
+    의존성과 워커 상태를 포함한 준비 상태, 준비되지 않았으면 503
+
+    MongoDB, SQLite, 이미지 저장소는 백그라운드에서 주기적으로 확인한 결과를 반환
+    """
+    ready, report = health.readiness.report()
+    if ready:
+        return ORJSONResponse(
+            return_formatter("success", 200, report, "Service is ready"),
+            status.HTTP_200_OK,
+        )
+    return ORJSONResponse(
+        return_formatter("failed", 503, report, "Service is not ready"),
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
+@cocktail_maker.get("/metrics", include_in_schema=False)
+async def metrics_exposition(request: Request) -> Response:
+    """
+    Prometheus 스크레이프 엔드포인트, 모든 워커의 메트릭 합산
+
+    METRICS_TOKEN 설정 시 Authorization: Bearer <token> 필요
+    """
+    if METRICS_TOKEN and not compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {METRICS_TOKEN}"
+    ):
+        raise HTTPException(status.HTTP_401_UNAUTHORIZED, "Invalid metrics token")
+
+    # 직렬화는 이벤트 루프에서, 파일 잠금과 읽기는 스레드에서 수행
+    return Response(
+        await metrics.exposition(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @cocktail_maker_v1.post(
     "/spirits",
     summary="주류 정보 등록",
@@ -1416,4 +1492,83 @@ async def cocktail_register(
     return ORJSONResponse(formatted_response, formatted_response["code"])
 
 
+# 외부 파트너용 읽기 전용 공개 API, X-API-Key 헤더로 인증하고 키, 라우트별 요청 비용 제한
+public_v1 = APIRouter(prefix="/api/public/v1", tags=["공개 API"])
+
+
+@public_v1.get("/spirits", summary="주류 정보 검색")
+async def public_spirits_search(
+    params: Annotated[SpiritsSearch, Depends()],
+    _: Annotated[APIKeyInfo, Security(RateLimit("spirits", "search"))],
+) -> ORJSONResponse:
+    data: SearchResponse = await queries.SearchSpirits(params).query()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, data, "Successfully search spirits")
+    )
+
+
+@public_v1.get("/spirits/{name}", summary="단일 주류 정보 조회")
+async def public_spirits_detail(
+    name: Annotated[str, Path(..., description="주류의 이름, 정확한 일치")],
+    _: Annotated[APIKeyInfo, Security(RateLimit("spirits", "detail"))],
+) -> ORJSONResponse:
+    spirits: dict[str, Any] = await queries.RetrieveSpirits(name).only_name()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, spirits, "Successfully get spirits")
+    )
+
+
+@public_v1.get("/liqueur", summary="리큐르 정보 검색")
+async def public_liqueur_search(
+    params: Annotated[LiqueurSearchQuery, Depends()],
+    _: Annotated[APIKeyInfo, Security(RateLimit("liqueur", "search"))],
+) -> ORJSONResponse:
+    data: SearchResponse = await queries.SearchLiqueur(params).query()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, data, "Successfully search liqueur")
+    )
+
+
+@public_v1.get("/liqueur/{name}", summary="단일 리큐르 정보 조회")
+async def public_liqueur_detail(
+    name: Annotated[str, Path(..., description="리큐르의 이름, 정확한 일치")],
+    _: Annotated[APIKeyInfo, Security(RateLimit("liqueur", "detail"))],
+) -> ORJSONResponse:
+    liqueur: dict[str, Any] = await queries.RetrieveLiqueur(name).only_name()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, liqueur, "Successfully get liqueur")
+    )
+
+
+@public_v1.get("/ingredient", summary="기타 재료 정보 검색")
+async def public_ingredient_search(
+    params: Annotated[IngredientSearch, Query()],
+    _: Annotated[APIKeyInfo, Security(RateLimit("ingredient", "search"))],
+) -> ORJSONResponse:
+    data: SearchResponse = await queries.SearchIngredient(params).query()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, data, "Successfully search ingredients")
+    )
+
+
+@public_v1.get("/ingredient/{name}", summary="단일 기타 재료 정보 조회")
+async def public_ingredient_detail(
+    name: Annotated[str, Path(..., description="재료의 이름, 정확한 일치")],
+    _: Annotated[APIKeyInfo, Security(RateLimit("ingredient", "detail"))],
+) -> ORJSONResponse:
+    ingredient: dict[str, Any] = await queries.RetrieveIngredient(name).only_name()
+
+    return ORJSONResponse(
+        return_formatter("success", 200, ingredient, "Successfully get ingredient")
+    )
+
+
 cocktail_maker.include_router(cocktail_maker_v1)
+cocktail_maker.include_router(public_v1)
+# SuperTokens 미들웨어는 /auth 하위 경로에만 적용
+cocktail_maker.mount(SUPERTOKENS_BASE_PATH, supertokens_app)
@@ -5,7 +5,13 @@ from .cocktail import (
     RecipeDict,
     RecipeStepDict,
 )
-from .etc import COCKTAIL_DATA_KIND, ImageField, MetadataCategory, MetadataRegister
+from .etc import (
+    COCKTAIL_DATA_KIND,
+    ImageField,
+    MetadataCategory,
+    MetadataRegister,
+    StoredImageInfo,
+)
 from .ingredient import (
     IngredientDict,
     IngredientRegisterForm,
@@ -50,5 +56,6 @@ __all__ = [
     "SpiritsRegisterForm",
     "SpiritsSearch",
     "SpiritsUpdateForm",
+    "StoredImageInfo",
     "User",
 ]
@@ -6,12 +6,24 @@ from pydantic import BaseModel, Field
 COCKTAIL_DATA_KIND = Literal["spirits", "liqueur", "ingredient", "cocktail"]
 
 
+class StoredImageInfo(TypedDict):
+    content_type: str
+    width: int
+    height: int
+    original_size: int
+    stored_size: int
+    # 원본 로딩 전 표시할 16px WEBP data URI 와 대표 색상(#rrggbb)
+    placeholder: str
+    dominant_color: str
+
+
 class ImageField(TypedDict, total=False):
     main_image: str
     sub_image_1: str
     sub_image_2: str
     sub_image_3: str
     sub_image_4: str
+    image_info: dict[str, StoredImageInfo]
 
 
 class MetadataCategory(str, Enum):
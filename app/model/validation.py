@@ -4,6 +4,8 @@ import unicodedata
 from fastapi import HTTPException, UploadFile, status
 from pydantic import field_validator
 
+from utils.server_timing import timed
+
 # 모듈 레벨에서 미리 컴파일된 정규식 사용 (재사용 및 성능)
 KOREAN_NAME_RE: re.Pattern[str] = re.compile(r"^[가-힣\s]+$")
 
@@ -33,6 +35,7 @@ class ImageValidation:
         return await file.read() if file is not None else None
 
     @classmethod
+    @timed("validation")
     async def files(
         cls,
         main_image: UploadFile,
@@ -0,0 +1,153 @@
+from asyncio import CancelledError, gather, sleep, to_thread, wait_for
+from collections.abc import Awaitable
+from dataclasses import asdict
+from os import environ
+from time import monotonic, perf_counter, time
+from typing import Any
+
+from dotenv import load_dotenv
+from pymongo import AsyncMongoClient
+from structlog import BoundLogger
+
+from auth.encryption import KDFPoolStats, kdf_pool
+from database import sqlite_conn_orm
+from database.connector import MONGODB_URL
+from database.monitoring import mongo_pool
+from storage import get_image_storage
+from utils import Logger
+from utils.loop_monitor import loop_monitor
+
+from .image_gc import cleanup_queued
+
+load_dotenv()
+logger: BoundLogger = Logger().setup()
+
+HEALTH_PROBE_INTERVAL: float = float(environ.get("HEALTH_PROBE_INTERVAL", "10"))
+HEALTH_PROBE_TIMEOUT: float = float(environ.get("HEALTH_PROBE_TIMEOUT", "2"))
+# 최근 이벤트 루프 지연 p99 가 이 값을 넘으면 준비되지 않은 것으로 판단
+HEALTH_MAX_LOOP_LAG: float = float(environ.get("HEALTH_MAX_LOOP_LAG", "0.5"))
+HEALTH_MIN_FREE_BYTES: int = int(
+    environ.get("HEALTH_MIN_FREE_BYTES", str(512 * 1024 * 1024))
+)
+
+
+class ReadinessProbe:
+    """
+    의존성 상태를 주기적으로 확인하여 캐시, readiness 요청은 캐시만 반환
+
+    - MongoDB ping, SQLite SELECT 1, 이미지 저장소 여유 공간은 interval 마다 확인
+    - 이벤트 루프 지연, 풀과 큐 적재량은 프로세스 내부 값이므로 요청 시 바로 읽음
+    - 로드밸런서가 자주 호출해도 DB 로 요청이 가지 않음
+    """
+
+    def __init__(
+        self,
+        interval: float = HEALTH_PROBE_INTERVAL,
+        timeout: float = HEALTH_PROBE_TIMEOUT,
+    ) -> None:
+        self.interval = interval
+        self.timeout = timeout
+        self._checks: dict[str, dict[str, Any]] = {}
+        self._checked_at: float | None = None
+        self._client: AsyncMongoClient | None = None
+
+    async def _timed(self, probe: Awaitable[dict[str, Any]]) -> dict[str, Any]:
+        started: float = perf_counter()
+        try:
+            detail: dict[str, Any] = await wait_for(probe, self.timeout)
+        except Exception as e:
+            return {
+                "ok": False,
+                "error": f"{type(e).__name__}: {e}",
+                "latency_ms": round((perf_counter() - started) * 1000, 2),
+            }
+        return {
+            "ok": True,
+            "latency_ms": round((perf_counter() - started) * 1000, 2),
+            **detail,
+        }
+
+    async def _mongodb(self) -> dict[str, Any]:
+        # 요청 처리와 달리 연결을 유지하여 ping 에 연결 수립 시간이 섞이지 않도록 함
+        if self._client is None:
+            self._client = AsyncMongoClient(
+                MONGODB_URL,
+                serverSelectionTimeoutMS=int(self.timeout * 1000),
+                maxPoolSize=1,
+            )
+        await self._client.admin.command("ping")
+        return {}
+
+    @staticmethod
+    def _select_one() -> None:
+        with sqlite_conn_orm() as session:
+            session.connection().exec_driver_sql("SELECT 1")
+
+    async def _sqlite(self) -> dict[str, Any]:
+        await to_thread(self._select_one)
+        return {}
+
+    async def _storage(self) -> dict[str, Any]:
+        free: int | None = await get_image_storage().free_bytes()
+        if free is not None and free < HEALTH_MIN_FREE_BYTES:
+            raise OSError(f"Only {free} bytes left in image storage")
+        return {"free_bytes": free}
+
+    async def probe(self) -> dict[str, dict[str, Any]]:
+        mongodb, sqlite, storage = await gather(
+            self._timed(self._mongodb()),
+            self._timed(self._sqlite()),
+            self._timed(self._storage()),
+        )
+        self._checks = {"mongodb": mongodb, "sqlite": sqlite, "image_storage": storage}
+        self._checked_at = time()
+        for name, check in self._checks.items():
+            if not check["ok"]:
+                logger.warning("Readiness probe failed", check=name, **check)
+        return self._checks
+
+    def report(self) -> tuple[bool, dict[str, Any]]:
+        """캐시된 의존성 상태와 현재 프로세스 상태로 준비 여부 판단"""
+        lag: dict[float, float] = loop_monitor.stats()
+        kdf: KDFPoolStats = kdf_pool.stats()
+        event_loop: dict[str, Any] = {
+            "ok": lag.get(0.99, 0.0) <= HEALTH_MAX_LOOP_LAG,
+            **{f"lag_p{round(q * 100)}_ms": round(v * 1000, 2) for q, v in lag.items()},
+        }
+        checks: dict[str, dict[str, Any]] = {
+            **self._checks,
+            "event_loop": event_loop,
+            "mongodb_pool": {"ok": True, **mongo_pool.stats()},
+            "executors": {
+                # 대기 작업이 가득 차면 로그인 요청이 503 으로 거절됨
+                "ok": kdf.in_flight + kdf.queued < kdf.max_pending,
+                "kdf": asdict(kdf),
+                "image_cleanup_queued": cleanup_queued(),
+            },
+        }
+
+        age: float | None = (
+            None if self._checked_at is None else max(time() - self._checked_at, 0.0)
+        )
+        # 백그라운드 확인이 멈춘 경우 오래된 결과로 준비 상태를 보고하지 않음
+        fresh: bool = age is not None and age <= self.interval * 3
+        ready: bool = fresh and all(check["ok"] for check in checks.values())
+        return ready, {
+            "ready": ready,
+            "checked_age_seconds": None if age is None else round(age, 1),
+            "checks": checks,
+        }
+
+    async def run_forever(self) -> None:
+        try:
+            while True:
+                started: float = monotonic()
+                await self.probe()
+                await sleep(max(self.interval - (monotonic() - started), 0.0))
+        except CancelledError:
+            if self._client is not None:
+                await self._client.close()
+            raise
+
+
+readiness = ReadinessProbe()
@@ -0,0 +1,203 @@
+import fcntl
+from asyncio import CancelledError, Queue, QueueFull, gather, sleep
+from dataclasses import dataclass, field
+from os import environ
+from pathlib import Path
+from time import monotonic, time
+from typing import IO, Any, get_args
+
+from bson import ObjectId
+from structlog import BoundLogger
+
+from database import mongodb_conn
+from model import COCKTAIL_DATA_KIND
+from storage import ImageStorage, StoredPrefix, get_image_storage, image_prefix
+from utils import Logger
+
+logger: BoundLogger = Logger().setup()
+
+IMAGE_GC_LOCK_PATH: Path = Path(
+    environ.get("IMAGE_GC_LOCK_PATH", "../data/.image-gc.lock")
+)
+IMAGE_GC_INTERVAL_SECONDS: float = float(
+    environ.get("IMAGE_GC_INTERVAL_SECONDS", "3600")
+)
+# 업로드 중인 이미지를 고아로 오인하지 않도록 최근 수정된 접두사는 건너뜀
+IMAGE_GC_GRACE_SECONDS: float = float(environ.get("IMAGE_GC_GRACE_SECONDS", "600"))
+IMAGE_GC_BATCH_SIZE: int = int(environ.get("IMAGE_GC_BATCH_SIZE", "500"))
+IMAGE_CLEANUP_QUEUE_SIZE: int = int(environ.get("IMAGE_CLEANUP_QUEUE_SIZE", "1024"))
+
+
+# 삭제 요청 경로에서는 접두사를 큐에 넣기만 하고 실제 삭제는 백그라운드에서 수행
+_cleanup_queue: Queue[str] = Queue(maxsize=IMAGE_CLEANUP_QUEUE_SIZE)
+
+
+def cleanup_queued() -> int:
+    return _cleanup_queue.qsize()
+
+
+def enqueue_cleanup(collection_name: str, document_id: str) -> None:
+    """이미지 삭제 예약, 큐가 가득 차면 주기적 GC 에 맡김"""
+    try:
+        _cleanup_queue.put_nowait(image_prefix(collection_name, document_id))
+    except QueueFull:
+        logger.warning(
+            "Image cleanup queue is full, deferring to GC",
+            collection=collection_name,
+            document_id=document_id,
+        )
+
+
+async def cleanup_worker() -> None:
+    """삭제 큐를 비우는 백그라운드 작업"""
+    storage: ImageStorage = get_image_storage()
+    while True:
+        prefix: str = await _cleanup_queue.get()
+        try:
+            reclaimed: int = await storage.delete_prefix(prefix)
+            logger.info("Image files removed", prefix=prefix, reclaimed=reclaimed)
+        except Exception as e:
+            logger.error("Remove image files has an error", prefix=prefix, error=str(e))
+        finally:
+            _cleanup_queue.task_done()
+
+
+@dataclass
+class GCReport:
+    scanned: int = 0
+    orphans: int = 0
+    reclaimed_bytes: int = 0
+    duration: float = 0.0
+    collections: dict[str, int] = field(default_factory=dict)
+
+
+class OrphanImageGC:
+    """
+    문서가 없는 이미지를 회수하는 주기 작업
+
+    - gunicorn 워커 중 리더 락을 획득한 하나의 워커만 실행
+    - 컬렉션별 접두사 탐색은 병렬로 수행 (로컬 저장소는 저우선순위 스레드)
+    - 문서 존재 여부는 $in 배치 쿼리로 확인
+    """
+
+    def __init__(
+        self,
+        storage: ImageStorage | None = None,
+        lock_path: Path = IMAGE_GC_LOCK_PATH,
+        batch_size: int = IMAGE_GC_BATCH_SIZE,
+        grace_seconds: float = IMAGE_GC_GRACE_SECONDS,
+    ) -> None:
+        self.storage: ImageStorage = storage or get_image_storage()
+        self.lock_path = lock_path
+        self.batch_size = batch_size
+        self.grace_seconds = grace_seconds
+        self._lock_file: IO[bytes] | None = None
+
+    def acquire_leader_lock(self) -> bool:
+        """비차단 flock, 프로세스가 종료되면 커널이 자동으로 해제"""
+        if self._lock_file is not None:
+            return True
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file: IO[bytes] = open(self.lock_path, "ab")  # noqa: SIM115
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+
+        self._lock_file = lock_file
+        return True
+
+    async def _existing_ids(
+        self, collection_name: str, object_ids: list[ObjectId]
+    ) -> set[str]:
+        existing: set[str] = set()
+        async with mongodb_conn(collection_name) as conn:
+            for start in range(0, len(object_ids), self.batch_size):
+                batch: list[ObjectId] = object_ids[start : start + self.batch_size]
+                cursor = conn.find({"_id": {"$in": batch}}, {"_id": 1})
+                existing.update(str(document["_id"]) async for document in cursor)
+        return existing
+
+    async def _collect(self, collection_name: str) -> tuple[int, list[str]]:
+        """유예 시간이 지난 접두사 중 문서가 없는 document_id 목록"""
+        deadline: float = time() - self.grace_seconds
+        prefixes: list[StoredPrefix] = await self.storage.list_prefixes(
+            f"{collection_name}/"
+        )
+
+        # 업로드 중이거나 ObjectId 형식이 아닌 알 수 없는 접두사는 건드리지 않음
+        candidates: list[str] = [
+            prefix.name
+            for prefix in prefixes
+            if prefix.last_modified < deadline and ObjectId.is_valid(prefix.name)
+        ]
+        if not candidates:
+            return len(prefixes), []
+
+        existing: set[str] = await self._existing_ids(
+            collection_name, [ObjectId(candidate) for candidate in candidates]
+        )
+        return len(prefixes), [
+            candidate for candidate in candidates if candidate not in existing
+        ]
+
+    async def run_once(self) -> GCReport:
+        started: float = monotonic()
+        report = GCReport()
+
+        collections: tuple[str, ...] = get_args(COCKTAIL_DATA_KIND)
+        collected: list[Any] = await gather(
+            *(self._collect(collection_name) for collection_name in collections),
+            return_exceptions=True,
+        )
+
+        for collection_name, result in zip(collections, collected, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Collect orphan images has an error",
+                    collection=collection_name,
+                    error=str(result),
+                )
+                continue
+
+            scanned, orphans = result
+            report.scanned += scanned
+            report.orphans += len(orphans)
+            reclaimed: list[int] = await gather(
+                *(
+                    self.storage.delete_prefix(image_prefix(collection_name, orphan))
+                    for orphan in orphans
+                )
+            )
+            report.collections[collection_name] = len(orphans)
+            report.reclaimed_bytes += sum(reclaimed)
+
+        report.duration = monotonic() - started
+        return report
+
+    async def run_forever(self, interval: float = IMAGE_GC_INTERVAL_SECONDS) -> None:
+        """리더 워커에서만 주기적으로 GC 실행, 리더가 종료되면 다른 워커가 이어받음"""
+        while True:
+            await sleep(interval)
+
+            if not self.acquire_leader_lock():
+                continue
+
+            try:
+                report: GCReport = await self.run_once()
+            except CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Orphan image GC has an error", error=str(e))
+                continue
+
+            logger.info(
+                "Orphan image GC finished",
+                scanned=report.scanned,
+                orphans=report.orphans,
+                reclaimed_bytes=report.reclaimed_bytes,
+                collections=report.collections,
+                duration=round(report.duration, 3),
+            )
@@ -0,0 +1,59 @@
+"""
+저장소 도입 전 문서의 로컬 이미지 경로(../data/images/...)를 저장소 키로 변환
+
+사용법 (app 디렉터리에서 배포 후 한 번 실행):
+    python -m query.migrate_images
+
+이미 변환된 문서는 조건에 맞지 않으므로 다시 실행해도 안전
+"""
+
+import asyncio
+from re import escape
+from typing import get_args
+
+from database import mongodb_conn
+from model import COCKTAIL_DATA_KIND
+from storage import LEGACY_LOCAL_PREFIX
+
+IMAGE_FIELDS: tuple[str, ...] = (
+    "main_image",
+    "sub_image_1",
+    "sub_image_2",
+    "sub_image_3",
+    "sub_image_4",
+)
+
+
+async def migrate_legacy_image_keys() -> int:
+    """컬렉션별 이미지 필드의 기존 경로 접두사를 제거, 변환한 필드 수 반환"""
+    migrated: int = 0
+    for collection_name in get_args(COCKTAIL_DATA_KIND):
+        async with mongodb_conn(collection_name) as conn:
+            for field_name in IMAGE_FIELDS:
+                result = await conn.update_many(
+                    {field_name: {"$regex": f"^{escape(LEGACY_LOCAL_PREFIX)}"}},
+                    [
+                        {
+                            "$set": {
+                                field_name: {
+                                    "$substrCP": [
+                                        f"${field_name}",
+                                        len(LEGACY_LOCAL_PREFIX),
+                                        {"$strLenCP": f"${field_name}"},
+                                    ]
+                                }
+                            }
+                        }
+                    ],
+                )
+                migrated += result.modified_count
+    return migrated
+
+
+def main() -> None:
+    migrated: int = asyncio.run(migrate_legacy_image_keys())
+    print(f"migrated {migrated} image fields")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 from base64 import urlsafe_b64decode
 from datetime import UTC, datetime
+from hmac import compare_digest
 from typing import Any
 
 from bson import ObjectId
-from fastapi import HTTPException
+from fastapi import HTTPException, status
+from pymongo.results import UpdateResult
 from structlog import BoundLogger
 
-from auth.encryption import Encryption
+from auth.encryption import Encryption, KDFParams
 from database import mongodb_conn
 from model import (
     CocktailDict,
@@ -31,6 +33,7 @@ from .query_child import (
     spirits_search_query,
 )
 from .query_parents import CreateDocument, RetrieveDocument, SearchDocument
+from .role_cache import role_cache
 
 logger: BoundLogger = Logger().setup()
 
@@ -72,28 +75,14 @@ class CreateSpirits(CreateDocument):
         self.subImage3 = subImage3
         self.subImage4 = subImage4
 
-    async def save(self) -> str:
-        """Save the spirits document to the database and store its images.
-
-        Raises:
-            e: If an error occurs while saving the document or its images.
-
-        Returns:
-            str: The ID of the saved document.
-        """
-        document_id: str = await super().save()
-
-        try:
-            await Images.save_image_files_to_local_dir(
-                document_id, "spirits", self.mainImage
-            )
-        except Exception as e:
-            logger.error(
-                f"Save spirits images to local has an error: {e!s}",
-            )
-            raise e
-
-        return document_id
+    def get_images(self) -> dict[str, bytes | None]:
+        return Images.image_fields(
+            self.mainImage,
+            self.subImage1,
+            self.subImage2,
+            self.subImage3,
+            self.subImage4,
+        )
 
     def get_collection_name(self) -> str:
         return "spirits"
@@ -113,20 +102,8 @@ class CreateLiqueur(CreateDocument):
         self.mainImage = mainImage
         self.collection_name = collection_name
 
-    async def save(self) -> str:
-        document_id: str = await super().save()
-
-        try:
-            await Images.save_image_files_to_local_dir(
-                document_id, "liqueur", self.mainImage
-            )
-        except Exception as e:
-            logger.error(
-                f"Save liqueur images to local has an error: {e!s}",
-            )
-            raise e
-
-        return document_id
+    def get_images(self) -> dict[str, bytes | None]:
+        return Images.image_fields(self.mainImage)
 
     def get_collection_name(self) -> str:
         return self.collection_name
@@ -140,20 +117,8 @@ class CreateIngredient(CreateDocument):
         self.ingredient_item = ingredient_item
         self.mainImage = mainImage
 
-    async def save(self) -> str:
-        document_id: str = await super().save()
-
-        try:
-            await Images.save_image_files_to_local_dir(
-                document_id, "ingredient", self.mainImage
-            )
-        except Exception as e:
-            logger.error(
-                f"Save ingredient images to local has an error: {e!s}",
-            )
-            raise e
-
-        return document_id
+    def get_images(self) -> dict[str, bytes | None]:
+        return Images.image_fields(self.mainImage)
 
     def get_collection_name(self) -> str:
         return "ingredient"
@@ -259,7 +224,7 @@ class UpdateSpirits:
 
     async def update(self) -> None:
         # 1. 기존 이미지 삭제
-        await Images.remove_image_files_in_local_dir(self.document_id)
+        await Images.remove_image_files("spirits", self.document_id)
 
         # 2. 문서 업데이트
         try:
@@ -276,7 +241,7 @@ class UpdateSpirits:
 
         # 3. 새 이미지 저장
         try:
-            await Images.save_image_files_to_local_dir(
+            await Images.save_image_files(
                 self.document_id,
                 "spirits",
                 self.main_image,
@@ -296,8 +261,6 @@ class DeleteSpirits:
 
     async def remove(self) -> None:
         try:
-            await Images.remove_image_files_in_local_dir(self.id)
-
             async with mongodb_conn("spirits") as conn:
                 result = await conn.delete_one({"_id": ObjectId(self.id)})
                 if result.deleted_count == 0:
@@ -308,11 +271,16 @@ class DeleteSpirits:
             )
             raise e
 
+        Images.enqueue_image_removal("spirits", self.id)
+
 
 class Users:
     @staticmethod
     async def sign_up(user: User) -> bool:
-        encrypted_password_set: PasswordAndSalt = Encryption.passwords(user.password)
+        params: KDFParams = Encryption.CURRENT_PARAMS
+        encrypted_password_set: PasswordAndSalt = await Encryption.passwords_async(
+            user.password, params=params
+        )
 
         try:
             data: dict[str, Any] = user.model_dump()
@@ -320,6 +288,8 @@ class Users:
             data["password"] = encrypted_password_set["encrypted_password"]
             # 솔트 추가
             data["salt"] = encrypted_password_set["salt"]
+            # 해시 알고리즘, 파라미터 추가
+            data["password_kdf"] = params.to_document()
             # 생성 시간 추가
             data["created_at"] = datetime.now(tz=UTC)
 
@@ -340,16 +310,22 @@ class Users:
                 result: dict[str, Any] | None = await conn.find_one(
                     {"user_id": login.userId}
                 )
-                if result is None:
-                    raise HTTPException(status_code=404, detail="User not found")
+            if result is None:
+                raise HTTPException(status_code=404, detail="User not found")
 
-                encrypted_password_set: PasswordAndSalt = Encryption.passwords(
-                    login.password, urlsafe_b64decode(result["salt"].encode())
-                )
+            # 풀 포화로 인한 503 은 로그인 실패로 바꾸지 않고 그대로 전달
+            params: KDFParams = KDFParams.from_document(result.get("password_kdf"))
+            encrypted_password_set: PasswordAndSalt = await Encryption.passwords_async(
+                login.password, urlsafe_b64decode(result["salt"].encode()), params
+            )
 
-                if encrypted_password_set["encrypted_password"] != result["password"]:
-                    raise HTTPException(status_code=401, detail="Password is incorrect")
+            if not compare_digest(
+                encrypted_password_set["encrypted_password"], result["password"]
+            ):
+                raise HTTPException(status_code=401, detail="Password is incorrect")
         except HTTPException as he:
+            if he.status_code == status.HTTP_503_SERVICE_UNAVAILABLE:
+                raise
             logger.error(
                 "Get User credentials from mongodb has an error",
                 code=he.status_code,
@@ -357,14 +333,56 @@ class Users:
             )
             return []
 
-        return result["roles"]
+        if Encryption.needs_rehash(params):
+            await Users._rehash(login, params)
+
+        # 인증된 사용자만 공유 버전 슬롯을 할당하도록 권한 캐시는 get_roles 로 채움,
+        # 임의의 user_id 로그인 시도가 다른 사용자의 슬롯을 밀어내지 않음
+        return await Users.get_roles(login.userId)
+
+    @staticmethod
+    async def _rehash(login: Login, previous: KDFParams) -> None:
+        """로그인 성공 시 평문 비밀번호로 현재 파라미터 해시를 만들어 교체"""
+        params: KDFParams = Encryption.CURRENT_PARAMS
+        try:
+            encrypted_password_set: PasswordAndSalt = await Encryption.passwords_async(
+                login.password, params=params
+            )
+            async with mongodb_conn("users") as conn:
+                await conn.update_one(
+                    {"user_id": login.userId},
+                    {
+                        "$set": {
+                            "password": encrypted_password_set["encrypted_password"],
+                            "salt": encrypted_password_set["salt"],
+                            "password_kdf": params.to_document(),
+                        }
+                    },
+                )
+        except Exception as e:
+            # 재해시 실패는 로그인 결과에 영향을 주지 않음, 다음 로그인 시 재시도
+            logger.warning(
+                "Rehash user password has an error", user_id=login.userId, error=str(e)
+            )
+            return
+
+        logger.info(
+            "User password rehashed",
+            user_id=login.userId,
+            previous=previous.to_document(),
+            current=params.to_document(),
+        )
 
     @staticmethod
     async def get_roles(user_id: str) -> list[str]:
+        if (roles := role_cache.get(user_id)) is not None:
+            return roles
+
+        roles_version: float = role_cache.version(user_id)
         try:
             async with mongodb_conn("users") as conn:
                 result: dict[str, Any] | None = await conn.find_one(
-                    {"user_id": user_id}
+                    {"user_id": user_id}, {"roles": 1}
                 )
                 if result is None:
                     raise HTTPException(status_code=404, detail="User not found")
@@ -372,8 +390,21 @@ class Users:
             logger.error("Get User roles from mongodb has an error", error=str(e))
             raise e
 
+        role_cache.put(user_id, result["roles"], roles_version)
         return result["roles"]
 
+    @staticmethod
+    async def update_roles(user_id: str, roles: list[str]) -> bool:
+        async with mongodb_conn("users") as conn:
+            result: UpdateResult = await conn.update_one(
+                {"user_id": user_id},
+                {"$set": {"roles": roles, "updated_at": datetime.now(tz=UTC)}},
+            )
+
+        # 모든 워커의 권한 캐시 무효화
+        role_cache.invalidate(user_id)
+        return result.matched_count > 0
+
 
 class UpdateLiqueur:
     def __init__(
@@ -385,7 +416,7 @@ class UpdateLiqueur:
 
     async def update(self) -> None:
         # 1. 기존 이미지 삭제
-        await Images.remove_image_files_in_local_dir(self.document_id)
+        await Images.remove_image_files("liqueur", self.document_id)
 
         # 2. 문서 업데이트
         try:
@@ -402,7 +433,7 @@ class UpdateLiqueur:
 
         # 3. 새 이미지 저장
         try:
-            await Images.save_image_files_to_local_dir(
+            await Images.save_image_files(
                 self.document_id,
                 "liqueur",
                 self.main_image,
@@ -418,10 +449,7 @@ class DeleteLiqueur:
 
     async def remove(self) -> None:
         try:
-            # 1. 이미지 삭제
-            await Images.remove_image_files_in_local_dir(self.document_id)
-
-            # 2. 문서 삭제
+            # 1. 문서 삭제
             async with mongodb_conn("liqueur") as conn:
                 result = await conn.delete_one({"_id": ObjectId(self.document_id)})
                 if result.deleted_count == 0:
@@ -430,6 +458,9 @@ class DeleteLiqueur:
             logger.error("Delete Liqueur object has an error", error=str(e))
             raise e
 
+        # 2. 이미지 삭제는 백그라운드 작업으로 예약
+        Images.enqueue_image_removal("liqueur", self.document_id)
+
 
 class RetrieveIngredient(RetrieveDocument):
     def __init__(self, name: str, collection_name: str = "ingredient") -> None:
@@ -478,7 +509,7 @@ class UpdateIngredient:
 
     async def update(self) -> None:
         # 1. 기존 이미지 삭제
-        await Images.remove_image_files_in_local_dir(self.document_id)
+        await Images.remove_image_files("ingredient", self.document_id)
 
         # 2. 문서 업데이트
         try:
@@ -495,7 +526,7 @@ class UpdateIngredient:
 
         # 3. 새 이미지 저장
         try:
-            await Images.save_image_files_to_local_dir(
+            await Images.save_image_files(
                 self.document_id,
                 "ingredient",
                 self.main_image,
@@ -511,10 +542,7 @@ class DeleteIngredient:
 
     async def remove(self) -> None:
         try:
-            # 1. 이미지 삭제
-            await Images.remove_image_files_in_local_dir(self.document_id)
-
-            # 2. 문서 삭제
+            # 1. 문서 삭제
             async with mongodb_conn("ingredient") as conn:
                 result = await conn.delete_one({"_id": ObjectId(self.document_id)})
                 if result.deleted_count == 0:
@@ -523,6 +551,9 @@ class DeleteIngredient:
             logger.error("Delete Ingredient object has an error", error=str(e))
             raise e
 
+        # 2. 이미지 삭제는 백그라운드 작업으로 예약
+        Images.enqueue_image_removal("ingredient", self.document_id)
+
 
 class CreateCocktail(CreateDocument):
     def __init__(
@@ -535,7 +566,7 @@ class CreateCocktail(CreateDocument):
         document_id: str = await super().save()
 
         # try:
-        #     await Images.save_image_files_to_local_dir(
+        #     await Images.save_image_files(
         #         document_id, "cocktail", self.mainImage
         #     )
         # except Exception as e:
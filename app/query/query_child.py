@@ -1,10 +1,8 @@
+from asyncio import gather, to_thread
 from datetime import UTC, datetime
-from pathlib import Path
-from shutil import rmtree
 from typing import Any
 
 from bson import ObjectId
-from fastapi import HTTPException
 from structlog import BoundLogger
 
 from database import mongodb_conn
@@ -13,11 +11,19 @@ from model import (
     IngredientSearch,
     LiqueurSearchQuery,
     SpiritsSearch,
+    StoredImageInfo,
 )
-from utils import Logger, save_image_to_local
+from storage import ImageStorage, get_image_storage, image_key, image_prefix
+from utils import EncodedImage, ImageStoragePolicy, Logger, encode_image
+from utils.server_timing import timed
+from utils.tracing import tracer
+
+from . import image_gc
 
 logger: BoundLogger = Logger().setup()
 
+IMAGE_POLICY: ImageStoragePolicy = ImageStoragePolicy.from_env()
+
 
 def spirits_search_query(params: SpiritsSearch) -> dict[str, Any]:
     """
@@ -177,20 +183,20 @@ def ingredient_search_query(params: IngredientSearch) -> dict[str, Any]:
 
 class Images:
     @classmethod
-    async def remove_image_files_in_local_dir(cls, id: str) -> None:
-        """이미지 파일 삭제"""
-        try:
-            async with mongodb_conn("spirits") as conn:
-                result: dict[str, Any] | None = await conn.find_one(
-                    {"_id": ObjectId(id)}
-                )
-                if result is None:
-                    raise HTTPException(404, "Spirits not found")
-        except Exception as e:
-            logger.error("Get Spirits object from mongodb has an error", error=str(e))
-            raise e
-        else:
-            rmtree(Path(result["main_image"]).parent, ignore_errors=True)
+    async def remove_image_files(
+        cls, collection_name: COCKTAIL_DATA_KIND, document_id: str
+    ) -> None:
+        """이미지 파일 삭제, 수정 시 새 이미지 저장 전에 기존 이미지를 즉시 제거"""
+        await get_image_storage().delete_prefix(
+            image_prefix(collection_name, document_id)
+        )
+
+    @staticmethod
+    def enqueue_image_removal(
+        collection_name: COCKTAIL_DATA_KIND, document_id: str
+    ) -> None:
+        """문서 삭제 후 이미지 삭제를 백그라운드 작업으로 예약"""
+        image_gc.enqueue_cleanup(collection_name, document_id)
 
     @classmethod
     async def _image_field_updater(
@@ -200,8 +206,99 @@ class Images:
         async with mongodb_conn(collection_name) as conn:
             await conn.update_one({"_id": ObjectId(id)}, {"$set": image_data})
 
+    @staticmethod
+    def image_fields(
+        main_image: bytes | None = None,
+        sub_image1: bytes | None = None,
+        sub_image2: bytes | None = None,
+        sub_image3: bytes | None = None,
+        sub_image4: bytes | None = None,
+    ) -> dict[str, bytes | None]:
+        """이미지 필드 이름과 바이트 매핑"""
+        return {
+            "main_image": main_image,
+            "sub_image_1": sub_image1,
+            "sub_image_2": sub_image2,
+            "sub_image_3": sub_image3,
+            "sub_image_4": sub_image4,
+        }
+
+    @staticmethod
+    @timed("image")
+    async def encode_images(
+        images: dict[str, bytes | None],
+    ) -> dict[str, EncodedImage]:
+        """저장 정책에 따라 이미지를 스레드에서 병렬 인코딩, 값이 없는 이미지는 제외"""
+        fields: list[str] = [name for name, data in images.items() if data is not None]
+
+        def encode(name: str) -> EncodedImage:
+            data: bytes = images[name]  # type: ignore[assignment]
+            with tracer.span("image.encode", field=name, size=len(data)):
+                return encode_image(data, IMAGE_POLICY)
+
+        encoded: list[EncodedImage] = await gather(
+            *(to_thread(encode, name) for name in fields)
+        )
+
+        for field_name, image in zip(fields, encoded, strict=True):
+            logger.info(
+                "Image encoded",
+                field=field_name,
+                content_type=image.content_type,
+                original_size=image.original_size,
+                stored_size=image.stored_size,
+            )
+
+        return dict(zip(fields, encoded, strict=True))
+
+    @staticmethod
+    def image_keys(
+        document_id: str,
+        collection_name: str,
+        encoded: dict[str, EncodedImage],
+    ) -> dict[str, str]:
+        """문서 저장 전 저장소 키 계산, 확장자는 인코딩된 포맷 기준"""
+        return {
+            field_name: image_key(
+                collection_name, document_id, f"{field_name}.{image.extension}"
+            )
+            for field_name, image in encoded.items()
+        }
+
+    @staticmethod
+    def image_info(encoded: dict[str, EncodedImage]) -> dict[str, StoredImageInfo]:
+        """원본 대비 저장 크기와 목록 화면용 미리보기 정보"""
+        return {
+            field_name: StoredImageInfo(
+                content_type=image.content_type,
+                width=image.width,
+                height=image.height,
+                original_size=image.original_size,
+                stored_size=image.stored_size,
+                placeholder=image.placeholder,
+                dominant_color=image.dominant_color,
+            )
+            for field_name, image in encoded.items()
+        }
+
+    @staticmethod
+    @timed("image")
+    async def write_image_files(
+        image_keys: dict[str, str], encoded: dict[str, EncodedImage]
+    ) -> None:
+        """저장소 쓰기는 이미지별로 병렬 수행"""
+        storage: ImageStorage = get_image_storage()
+
+        async def put(key: str, image: EncodedImage) -> None:
+            with tracer.span("image.store", key=key, size=len(image.data)):
+                await storage.put(key, image.data, image.content_type)
+
+        await gather(
+            *(put(key, encoded[field_name]) for field_name, key in image_keys.items())
+        )
+
     @classmethod
-    async def save_image_files_to_local_dir(  # noqa: PLR0913
+    async def save_image_files(  # noqa: PLR0913
         cls,
         document_id: str,
         collection_name: COCKTAIL_DATA_KIND,
@@ -211,28 +308,18 @@ class Images:
         sub_image3: bytes | None = None,
         sub_image4: bytes | None = None,
     ) -> None:
-        saved_image_paths: list[dict[str, str]] = []
-        spirit_images: list[tuple[str, bytes | None]] = [
-            ("main_image", main_image),
-            ("sub_image_1", sub_image1),
-            ("sub_image_2", sub_image2),
-            ("sub_image_3", sub_image3),
-            ("sub_image_4", sub_image4),
-        ]
-
-        # 이미지 저장 및 경로 정보 수집
-        for image_key, image_data in spirit_images:
-            if image_data is not None:
-                image_path = Path(
-                    f"../data/images/{collection_name}/{document_id}/{image_key}.png"
-                )
-                save_image_to_local(image_data, image_path)
-                saved_image_paths.append({"key": image_key, "path": str(image_path)})
-
-        update_image: dict[str, Any] = {}
-        # 수집된 경로 정보를 Dict에 추가
-        for image_path_info in saved_image_paths:
-            # main_image, sub_image_1, sub_image_2, sub_image_3, sub_image_4 필드 처리
-            update_image[image_path_info["key"]] = image_path_info["path"]
+        encoded: dict[str, EncodedImage] = await cls.encode_images(
+            cls.image_fields(main_image, sub_image1, sub_image2, sub_image3, sub_image4)
+        )
+
+        # 이미지 저장 및 키 정보 수집
+        update_image: dict[str, Any] = cls.image_keys(
+            document_id, collection_name, encoded
+        )
+        await cls.write_image_files(update_image, encoded)
+
+        # 기존 이미지 정보는 교체된 필드만 갱신
+        for field_name, info in cls.image_info(encoded).items():
+            update_image[f"image_info.{field_name}"] = info
 
         await cls._image_field_updater(collection_name, document_id, update_image)
@@ -2,8 +2,8 @@ from abc import ABC, abstractmethod
 from math import ceil
 from typing import Any
 
+from bson import ObjectId
 from fastapi import HTTPException
-from pymongo.results import InsertOneResult
 from structlog import BoundLogger
 
 from database import mongodb_conn
@@ -16,7 +16,10 @@ from model import (
     SpiritsDict,
     SpiritsSearch,
 )
-from utils import Logger
+from storage import get_image_storage, image_prefix
+from utils import EncodedImage, Logger
+
+from .query_child import Images
 
 logger: BoundLogger = Logger().setup()
 
@@ -24,25 +27,55 @@ logger: BoundLogger = Logger().setup()
 class CreateDocument(ABC):
     async def save(self) -> str:
         collection_name: str = ""
+        # ObjectId 를 미리 생성하여 이미지 키를 포함한 문서를 한 번에 저장
+        document_id: ObjectId = ObjectId()
 
         try:
             collection_name: str = self.get_collection_name()
             document: SpiritsDict | LiqueurDict | IngredientDict | CocktailDict = (
                 self.get_document()
             )
+            # 인코딩을 먼저 수행해야 저장 포맷에 맞는 키와 크기 정보를 함께 저장 가능
+            encoded: dict[str, EncodedImage] = await Images.encode_images(
+                self.get_images()
+            )
+            image_keys: dict[str, str] = Images.image_keys(
+                str(document_id), collection_name, encoded
+            )
+            image_fields: dict[str, Any] = {**image_keys}
+            if encoded:
+                image_fields["image_info"] = Images.image_info(encoded)
 
             async with mongodb_conn(collection_name) as conn:
-                result: InsertOneResult = await conn.insert_one(document)
+                await conn.insert_one({**document, **image_fields, "_id": document_id})
         except Exception as e:
             logger.error(
                 f"Save {collection_name} object to mongodb has an error",
                 error=str(e),
             )
             raise e
-        else:
-            document_id: str = str(result.inserted_id)
 
-        return document_id
+        if image_keys:
+            try:
+                await Images.write_image_files(image_keys, encoded)
+            except Exception as e:
+                logger.error(
+                    f"Save {collection_name} images to storage has an error",
+                    error=str(e),
+                )
+                # 이미지가 없는 문서가 남지 않도록 보상 삭제
+                async with mongodb_conn(collection_name) as conn:
+                    await conn.delete_one({"_id": document_id})
+                await get_image_storage().delete_prefix(
+                    image_prefix(collection_name, str(document_id))
+                )
+                raise e
+
+        return str(document_id)
+
+    def get_images(self) -> dict[str, bytes | None]:
+        """문서와 함께 저장할 이미지, 필드 이름과 바이트 매핑"""
+        return {}
 
     @abstractmethod
     def get_collection_name(self) -> str:
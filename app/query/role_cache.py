@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from os import environ
+from pathlib import Path
+from time import monotonic
+
+from dotenv import load_dotenv
+
+from utils.metrics import record_cache
+from utils.shared_state import SharedSlotTable
+
+load_dotenv()
+
+ROLE_CACHE_TTL_SECONDS: float = float(environ.get("ROLE_CACHE_TTL_SECONDS", "300"))
+ROLE_CACHE_MAX_SIZE: int = int(environ.get("ROLE_CACHE_MAX_SIZE", "4096"))
+ROLE_VERSIONS_PATH: Path = Path(
+    environ.get("ROLE_VERSIONS_PATH", "../data/.role-versions")
+)
+
+
+@dataclass(frozen=True)
+class _CachedRoles:
+    roles: list[str]
+    version: float
+    expires_at: float
+
+
+class RoleCache:
+    """
+    사용자 권한 TTL 캐시 (워커별)
+
+    - 권한 변경 시 워커 간 공유되는 버전 번호를 올려 다른 워커의 캐시도 즉시 무효화
+    - 버전이 없는 슬롯(처음 보거나 공유 테이블에서 밀려난 사용자)은 0 으로 읽히므로 항상 미스,
+      새 버전은 현재 시각으로 시작하여 밀려나기 전의 버전과 겹치지 않음
+    - DB 조회 전에 version() 으로 버전을 받아 put 에 넘기며, 그 사이 무효화되었으면 저장하지 않음
+    """
+
+    def __init__(
+        self,
+        versions: SharedSlotTable,
+        ttl: float = ROLE_CACHE_TTL_SECONDS,
+        max_size: int = ROLE_CACHE_MAX_SIZE,
+    ) -> None:
+        self.versions = versions
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: dict[str, _CachedRoles] = {}
+
+    def get(self, user_id: str) -> list[str] | None:
+        entry: _CachedRoles | None = self._entries.get(user_id)
+        if entry is not None and (
+            entry.expires_at <= monotonic()
+            or entry.version != self.versions.read(user_id)[0]
+        ):
+            del self._entries[user_id]
+            entry = None
+
+        record_cache("roles", entry is not None)
+        return entry.roles if entry is not None else None
+
+    def version(self, user_id: str) -> float:
+        """DB 조회 전 현재 버전, 없으면 새로 할당"""
+
+        def current(values: list[float], now: float) -> float:
+            if not values[0]:
+                values[0] = now
+            return values[0]
+
+        return self.versions.update(user_id, current)
+
+    def put(self, user_id: str, roles: list[str], version: float) -> None:
+        """version 이 여전히 현재 버전일 때만 저장, 확인과 저장을 한 번의 잠금에서 수행"""
+
+        def fill(values: list[float], _: float) -> None:
+            if values[0] != version:
+                return
+            if user_id not in self._entries and len(self._entries) >= self.max_size:
+                # 삽입 순서상 가장 오래된 항목 제거
+                del self._entries[next(iter(self._entries))]
+            self._entries[user_id] = _CachedRoles(
+                roles, version, monotonic() + self.ttl
+            )
+
+        self.versions.update(user_id, fill)
+
+    def invalidate(self, user_id: str) -> None:
+        def bump(values: list[float], now: float) -> None:
+            values[0] = values[0] + 1 if values[0] else now
+
+        self.versions.update(user_id, bump)
+        self._entries.pop(user_id, None)
+
+
+role_cache = RoleCache(SharedSlotTable(ROLE_VERSIONS_PATH, fields=1))
@@ -0,0 +1,61 @@
+from os import environ
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from .base import (
+    LEGACY_LOCAL_PREFIX,
+    ImageStorage,
+    StoredPrefix,
+    image_key,
+    image_prefix,
+)
+from .local import LocalImageStorage
+from .s3 import S3Error, S3ImageStorage
+
+load_dotenv()
+
+# local: 로컬 파일 시스템, s3: S3 호환 오브젝트 스토리지 (MinIO 등)
+IMAGE_STORAGE_BACKEND: str = environ.get("IMAGE_STORAGE_BACKEND", "local").lower()
+IMAGE_STORAGE_ROOT: str = environ.get("IMAGE_STORAGE_ROOT", "../data/images")
+
+_image_storage: ImageStorage | None = None
+
+
+def get_image_storage() -> ImageStorage:
+    """프로세스 단위로 공유하는 이미지 저장소"""
+    global _image_storage  # noqa: PLW0603
+
+    if _image_storage is None:
+        if IMAGE_STORAGE_BACKEND == "s3":
+            _image_storage = S3ImageStorage(
+                endpoint_url=environ["S3_ENDPOINT_URL"],
+                bucket=environ["S3_BUCKET"],
+                access_key=environ["S3_ACCESS_KEY_ID"],
+                secret_key=environ["S3_SECRET_ACCESS_KEY"],
+                region=environ.get("S3_REGION", "us-east-1"),
+                multipart_threshold=int(
+                    environ.get("S3_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))
+                ),
+                multipart_chunk_size=int(
+                    environ.get("S3_MULTIPART_CHUNK_SIZE", str(8 * 1024 * 1024))
+                ),
+                max_concurrency=int(environ.get("S3_MAX_CONCURRENCY", "4")),
+            )
+        else:
+            _image_storage = LocalImageStorage(Path(IMAGE_STORAGE_ROOT))
+
+    return _image_storage
+
+
+__all__ = [
+    "LEGACY_LOCAL_PREFIX",
+    "ImageStorage",
+    "LocalImageStorage",
+    "S3Error",
+    "S3ImageStorage",
+    "StoredPrefix",
+    "get_image_storage",
+    "image_key",
+    "image_prefix",
+]
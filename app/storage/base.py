@@ -0,0 +1,49 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+# 저장소 도입 전 문서에 저장된 로컬 상대 경로 접두사
+LEGACY_LOCAL_PREFIX: str = "../data/images/"
+
+
+@dataclass(frozen=True)
+class StoredPrefix:
+    """키 접두사(문서 단위 이미지 묶음)와 마지막 수정 시각(unix time)"""
+
+    name: str
+    last_modified: float
+
+
+def image_key(collection_name: str, document_id: str, image_name: str) -> str:
+    """백엔드 독립 이미지 키, e.g. spirits/<document_id>/main_image.png"""
+    return f"{collection_name}/{document_id}/{image_name}"
+
+
+def image_prefix(collection_name: str, document_id: str) -> str:
+    return f"{collection_name}/{document_id}/"
+
+
+class ImageStorage(ABC):
+    """이미지 저장소 백엔드 인터페이스, 키는 `/` 로 구분된 상대 경로"""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        """객체 저장, 같은 키가 있으면 덮어씀"""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes:
+        """객체 읽기, 없으면 FileNotFoundError"""
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> int:
+        """접두사 하위 객체 모두 삭제, 회수한 바이트 수 반환"""
+
+    @abstractmethod
+    async def list_prefixes(self, prefix: str) -> list[StoredPrefix]:
+        """접두사 바로 아래 단계의 하위 접두사 목록"""
+
+    async def free_bytes(self) -> int | None:
+        """남은 저장 공간(bytes), 용량 제한이 없는 백엔드는 None"""
+        return None
+
+    async def close(self) -> None:  # noqa: B027
+        """연결 등 리소스 정리"""
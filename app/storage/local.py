@@ -0,0 +1,102 @@
+from asyncio import get_running_loop, to_thread
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from os import PRIO_PROCESS, replace, scandir, setpriority
+from pathlib import Path
+from shutil import disk_usage, rmtree
+from threading import get_native_id
+from uuid import uuid4
+
+from .base import ImageStorage, StoredPrefix
+
+
+def _low_priority() -> None:
+    """유지보수 스레드의 nice 값을 낮춰 요청 처리 스레드보다 후순위로 실행"""
+    with suppress(OSError):
+        setpriority(PRIO_PROCESS, get_native_id(), 19)
+
+
+def dir_size(directory: Path) -> int:
+    """디렉터리 하위 파일 크기 합계(bytes)"""
+    total: int = 0
+    try:
+        with scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += dir_size(Path(entry.path))
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    except FileNotFoundError:
+        pass
+    return total
+
+
+class LocalImageStorage(ImageStorage):
+    """
+    로컬 파일 시스템 저장소
+
+    - 쓰기는 임시 파일 작성 후 rename 으로 원자적으로 교체
+    - 목록 조회, 접두사 삭제 같은 유지보수 작업은 저우선순위 스레드에서 실행
+    """
+
+    def __init__(self, root: Path, maintenance_workers: int = 4) -> None:
+        self.root = root
+        self._maintenance = ThreadPoolExecutor(
+            max_workers=maintenance_workers,
+            thread_name_prefix="image-storage",
+            initializer=_low_priority,
+        )
+
+    def _path(self, key: str) -> Path:
+        path: Path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def _write(self, key: str, data: bytes) -> None:
+        path: Path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path: Path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        temp_path.write_bytes(data)
+        replace(temp_path, path)
+
+    def _delete_prefix(self, prefix: str) -> int:
+        path: Path = self._path(prefix)
+        size: int = dir_size(path)
+        rmtree(path, ignore_errors=True)
+        return size
+
+    def _list_prefixes(self, prefix: str) -> list[StoredPrefix]:
+        prefixes: list[StoredPrefix] = []
+        try:
+            with scandir(self._path(prefix)) as entries:
+                prefixes.extend(
+                    StoredPrefix(entry.name, entry.stat(follow_symlinks=False).st_mtime)
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                )
+        except FileNotFoundError:
+            pass
+        return prefixes
+
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        await to_thread(self._write, key, data)
+
+    async def get(self, key: str) -> bytes:
+        return await to_thread(self._path(key).read_bytes)
+
+    async def delete_prefix(self, prefix: str) -> int:
+        return await get_running_loop().run_in_executor(
+            self._maintenance, self._delete_prefix, prefix
+        )
+
+    async def list_prefixes(self, prefix: str) -> list[StoredPrefix]:
+        return await get_running_loop().run_in_executor(
+            self._maintenance, self._list_prefixes, prefix
+        )
+
+    async def free_bytes(self) -> int | None:
+        return (await to_thread(disk_usage, self.root)).free
+
+    async def close(self) -> None:
+        self._maintenance.shutdown(wait=False)
@@ -0,0 +1,307 @@
+import hmac
+from asyncio import Semaphore, gather
+from base64 import b64encode
+from datetime import UTC, datetime
+from hashlib import md5, sha256
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import httpx
+
+from .base import ImageStorage, StoredPrefix
+
+EMPTY_PAYLOAD_HASH: str = sha256(b"").hexdigest()
+# S3 멀티파트 업로드 최소 파트 크기 (마지막 파트 제외)
+MIN_PART_SIZE: int = 5 * 1024 * 1024
+DELETE_BATCH_SIZE: int = 1000
+
+
+def _uri_encode(value: str, safe: str = "-_.~") -> str:
+    return quote(value, safe=safe)
+
+
+def _canonical_query(query: dict[str, str]) -> str:
+    return "&".join(
+        f"{_uri_encode(name)}={_uri_encode(value)}"
+        for name, value in sorted(query.items())
+    )
+
+
+def _strip_namespace(element: ElementTree.Element) -> None:
+    for node in element.iter():
+        node.tag = node.tag.rsplit("}", 1)[-1]
+
+
+class S3Error(Exception):
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(
+            f"S3 request failed: {response.request.method} {response.request.url} "
+            f"{response.status_code} {response.text[:200]}"
+        )
+        self.status_code = response.status_code
+
+
+class S3ImageStorage(ImageStorage):
+    """
+    S3 호환 저장소 (AWS S3, MinIO 등), path-style 주소와 SigV4 서명 사용
+
+    - 프로세스당 하나의 httpx.AsyncClient 로 커넥션 재사용
+    - 임계값을 넘는 객체는 멀티파트 업로드, 파트는 동시에 전송
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        endpoint_url: str,
+        bucket: str,
+        access_key: str,
+        secret_key: str,
+        *,
+        region: str = "us-east-1",
+        multipart_threshold: int = 8 * 1024 * 1024,
+        multipart_chunk_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        max_connections: int = 32,
+    ) -> None:
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.host: str = urlsplit(self.endpoint_url).netloc
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.multipart_threshold = multipart_threshold
+        self.multipart_chunk_size = max(multipart_chunk_size, MIN_PART_SIZE)
+        self.max_concurrency = max_concurrency
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 포크 이후 워커에서 처음 사용할 때 생성
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.endpoint_url,
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+        return self._client
+
+    def _signing_key(self, date_stamp: str) -> bytes:
+        key: bytes = f"AWS4{self.secret_key}".encode()
+        for message in (date_stamp, self.region, "s3", "aws4_request"):
+            key = hmac.new(key, message.encode(), sha256).digest()
+        return key
+
+    def _sign(
+        self,
+        method: str,
+        path: str,
+        canonical_query: str,
+        headers: dict[str, str],
+        payload_hash: str,
+    ) -> dict[str, str]:
+        """AWS Signature Version 4 헤더 생성"""
+        now: datetime = datetime.now(tz=UTC)
+        amz_date: str = now.strftime("%Y%m%dT%H%M%SZ")
+        date_stamp: str = now.strftime("%Y%m%d")
+
+        signed: dict[str, str] = {
+            **{name.lower(): value.strip() for name, value in headers.items()},
+            "host": self.host,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+        }
+        signed_headers: str = ";".join(sorted(signed))
+        canonical_headers: str = "".join(
+            f"{name}:{signed[name]}\n" for name in sorted(signed)
+        )
+        canonical_request: str = "\n".join(
+            (
+                method,
+                _uri_encode(path, safe="-_.~/"),
+                canonical_query,
+                canonical_headers,
+                signed_headers,
+                payload_hash,
+            )
+        )
+
+        scope: str = f"{date_stamp}/{self.region}/s3/aws4_request"
+        string_to_sign: str = "\n".join(
+            (
+                "AWS4-HMAC-SHA256",
+                amz_date,
+                scope,
+                sha256(canonical_request.encode()).hexdigest(),
+            )
+        )
+        signature: str = hmac.new(
+            self._signing_key(date_stamp), string_to_sign.encode(), sha256
+        ).hexdigest()
+
+        signed.pop("host")
+        signed["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed_headers}, Signature={signature}"
+        )
+        return signed
+
+    async def _request(
+        self,
+        method: str,
+        key: str = "",
+        query: dict[str, str] | None = None,
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        path: str = f"/{self.bucket}/{key}" if key else f"/{self.bucket}"
+        canonical_query: str = _canonical_query(query or {})
+        payload_hash: str = sha256(body).hexdigest() if body else EMPTY_PAYLOAD_HASH
+        signed_headers: dict[str, str] = self._sign(
+            method, path, canonical_query, headers or {}, payload_hash
+        )
+
+        # 서명한 쿼리 문자열을 그대로 전송해야 서명이 일치함
+        url: str = _uri_encode(path, safe="-_.~/")
+        if canonical_query:
+            url = f"{url}?{canonical_query}"
+
+        response: httpx.Response = await self.client.request(
+            method, url, content=body or None, headers=signed_headers
+        )
+        if response.status_code >= httpx.codes.BAD_REQUEST:
+            raise S3Error(response)
+        return response
+
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        if len(data) > self.multipart_threshold:
+            await self._multipart_upload(key, data, content_type)
+            return
+
+        await self._request(
+            "PUT", key, body=data, headers={"content-type": content_type}
+        )
+
+    async def _multipart_upload(self, key: str, data: bytes, content_type: str) -> None:
+        response: httpx.Response = await self._request(
+            "POST", key, {"uploads": ""}, headers={"content-type": content_type}
+        )
+        root: ElementTree.Element = ElementTree.fromstring(response.content)
+        _strip_namespace(root)
+        upload_id: str = root.findtext("UploadId", "")
+
+        semaphore = Semaphore(self.max_concurrency)
+
+        async def upload_part(part_number: int, offset: int) -> tuple[int, str]:
+            async with semaphore:
+                part_response: httpx.Response = await self._request(
+                    "PUT",
+                    key,
+                    {"partNumber": str(part_number), "uploadId": upload_id},
+                    body=data[offset : offset + self.multipart_chunk_size],
+                )
+            return part_number, part_response.headers["etag"]
+
+        try:
+            parts: list[tuple[int, str]] = await gather(
+                *(
+                    upload_part(index + 1, offset)
+                    for index, offset in enumerate(
+                        range(0, len(data), self.multipart_chunk_size)
+                    )
+                )
+            )
+            complete: bytes = (
+                "<CompleteMultipartUpload>"
+                + "".join(
+                    f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+                    for number, etag in sorted(parts)
+                )
+                + "</CompleteMultipartUpload>"
+            ).encode()
+            await self._request("POST", key, {"uploadId": upload_id}, body=complete)
+        except Exception:
+            await self._request("DELETE", key, {"uploadId": upload_id})
+            raise
+
+    async def get(self, key: str) -> bytes:
+        try:
+            response: httpx.Response = await self._request("GET", key)
+        except S3Error as e:
+            if e.status_code == httpx.codes.NOT_FOUND:
+                raise FileNotFoundError(key) from e
+            raise
+        return response.content
+
+    async def _list_objects(
+        self, prefix: str, delimiter: str | None = None
+    ) -> list[ElementTree.Element]:
+        """ListObjectsV2 페이지를 모두 조회하여 응답 루트 목록 반환"""
+        pages: list[ElementTree.Element] = []
+        query: dict[str, str] = {"list-type": "2", "prefix": prefix}
+        if delimiter is not None:
+            query["delimiter"] = delimiter
+
+        while True:
+            response: httpx.Response = await self._request("GET", query=query)
+            root: ElementTree.Element = ElementTree.fromstring(response.content)
+            _strip_namespace(root)
+            pages.append(root)
+
+            if root.findtext("IsTruncated") != "true":
+                return pages
+            query["continuation-token"] = root.findtext("NextContinuationToken", "")
+
+    async def delete_prefix(self, prefix: str) -> int:
+        objects: list[tuple[str, int]] = [
+            (content.findtext("Key", ""), int(content.findtext("Size", "0")))
+            for page in await self._list_objects(prefix)
+            for content in page.iter("Contents")
+        ]
+
+        for start in range(0, len(objects), DELETE_BATCH_SIZE):
+            batch: list[tuple[str, int]] = objects[start : start + DELETE_BATCH_SIZE]
+            body: bytes = (
+                "<Delete><Quiet>true</Quiet>"
+                + "".join(
+                    f"<Object><Key>{escape(key)}</Key></Object>" for key, _ in batch
+                )
+                + "</Delete>"
+            ).encode()
+            await self._request(
+                "POST",
+                query={"delete": ""},
+                body=body,
+                headers={
+                    "content-md5": b64encode(
+                        md5(body, usedforsecurity=False).digest()
+                    ).decode()
+                },
+            )
+
+        return sum(size for _, size in objects)
+
+    async def list_prefixes(self, prefix: str) -> list[StoredPrefix]:
+        # 하위 접두사의 수정 시각은 그 아래 객체 중 가장 최근 값
+        latest: dict[str, float] = {}
+        for page in await self._list_objects(prefix):
+            for content in page.iter("Contents"):
+                name, _, rest = (
+                    content.findtext("Key", "").removeprefix(prefix).partition("/")
+                )
+                if not rest:
+                    continue
+                modified: float = datetime.fromisoformat(
+                    content.findtext("LastModified", "")
+                ).timestamp()
+                latest[name] = max(latest.get(name, 0.0), modified)
+
+        return [StoredPrefix(name, modified) for name, modified in latest.items()]
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
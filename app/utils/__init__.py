@@ -1,18 +1,26 @@
 from .etc import (
     problem_details_formatter,
     return_formatter,
-    save_image_to_local,
     single_word_list_to_many_word_list,
 )
+from .images import EncodedImage, ImageStoragePolicy, encode_image
+from .log_rotation import LogArchive, LogRotationPolicy
+from .log_sampling import LogSampler, LogSamplingPolicy
 from .logger import Logger
 from .times import datetime_now, unix_to_datetime
 
 __all__ = [
+    "EncodedImage",
+    "ImageStoragePolicy",
+    "LogArchive",
+    "LogRotationPolicy",
+    "LogSampler",
+    "LogSamplingPolicy",
     "Logger",
     "datetime_now",
+    "encode_image",
     "problem_details_formatter",
     "return_formatter",
-    "save_image_to_local",
     "single_word_list_to_many_word_list",
     "unix_to_datetime",
 ]
@@ -0,0 +1,304 @@
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from hashlib import sha256
+from os import environ
+from typing import Self
+
+from dotenv import load_dotenv
+from starlette.datastructures import MutableHeaders
+from starlette.status import HTTP_200_OK
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from starlette_compress import (
+    CompressMiddleware,
+    add_compress_type,
+    remove_compress_type,
+)
+from starlette_compress._utils import parse_accept_encoding
+
+from .metrics import record_cache
+
+load_dotenv()
+
+# CompressMiddleware 와 같은 우선순위
+ENCODINGS: tuple[str, ...] = ("zstd", "br", "gzip")
+
+
+def _types(value: str) -> tuple[str, ...]:
+    return tuple(t.strip().lower() for t in value.split(",") if t.strip())
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """
+    응답 압축 정책
+
+    - minimum_size: 이보다 작은 본문은 압축하지 않음 (압축 헤더 오버헤드가 더 큼)
+    - allow_types: starlette_compress 기본 목록에 추가로 압축할 Content-Type
+    - deny_types: 기본 목록에 있어도 압축하지 않을 Content-Type (이미 압축된 형식)
+    - cache_entries, cache_bytes: 압축된 본문 캐시 크기, 0 이면 캐시하지 않음
+    """
+
+    minimum_size: int = 1024
+    allow_types: tuple[str, ...] = ("application/problem+json",)
+    deny_types: tuple[str, ...] = ("application/font-woff", "font/x-woff")
+    zstd_level: int = 4
+    brotli_quality: int = 4
+    gzip_level: int = 6
+    cache_entries: int = 256
+    cache_bytes: int = 16 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> Self:
+        return cls(
+            minimum_size=int(environ.get("COMPRESS_MIN_SIZE", "1024")),
+            allow_types=_types(
+                environ.get("COMPRESS_ALLOW_TYPES", "application/problem+json")
+            ),
+            deny_types=_types(
+                environ.get("COMPRESS_DENY_TYPES", "application/font-woff,font/x-woff")
+            ),
+            zstd_level=int(environ.get("COMPRESS_ZSTD_LEVEL", "4")),
+            brotli_quality=int(environ.get("COMPRESS_BROTLI_QUALITY", "4")),
+            gzip_level=int(environ.get("COMPRESS_GZIP_LEVEL", "6")),
+            cache_entries=int(environ.get("COMPRESS_CACHE_ENTRIES", "256")),
+            cache_bytes=int(environ.get("COMPRESS_CACHE_BYTES", str(16 * 1024 * 1024))),
+        )
+
+
+type CacheKey = tuple[str, bytes, str]
+
+
+class CompressedCache:
+    """
+    압축된 본문 LRU 캐시 (워커별)
+
+    키는 (요청 대상, ETag, 인코딩), 같은 본문이면 같은 ETag 이므로 데이터가 바뀌면
+    새 키로 저장되고 이전 항목은 사용되지 않다가 밀려남
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size: int = 0
+        self._entries: dict[CacheKey, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> bytes | None:
+        body: bytes | None = self._entries.pop(key, None)
+        if body is not None:
+            # 최근 사용 항목을 뒤로 이동
+            self._entries[key] = body
+        record_cache("compression", body is not None)
+        return body
+
+    def put(self, key: CacheKey, body: bytes) -> None:
+        if len(body) > self.max_bytes or self.max_entries <= 0:
+            return
+        if (old := self._entries.pop(key, None)) is not None:
+            self.size -= len(old)
+        while self._entries and (
+            len(self._entries) >= self.max_entries
+            or self.size + len(body) > self.max_bytes
+        ):
+            # 삽입 순서상 가장 오래 사용되지 않은 항목 제거
+            self.size -= len(self._entries.pop(next(iter(self._entries))))
+        self._entries[key] = body
+        self.size += len(body)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+
+@dataclass
+class _Pending:
+    """요청별 캐시 상태, 바깥 계층이 만들고 안쪽 계층이 키를 채움"""
+
+    encoding: str
+    key: CacheKey | None = None
+    body: list[bytes] = field(default_factory=list)
+
+
+_pending: ContextVar[_Pending | None] = ContextVar("compression_pending", default=None)
+
+
+def _etag(headers: list[tuple[bytes, bytes]], body: bytes) -> tuple[bytes | None, bool]:
+    """
+    캐시 키로 쓸 ETag 와 새로 만들었는지 여부 반환
+
+    앱이 강한 ETag 를 준 경우 그대로 사용, 약한 ETag 는 본문이 달라도 같을 수 있어
+    캐시하지 않음, 없으면 본문 해시로 약한 ETag 생성 (압축 표현과도 맞음)
+    """
+    etag: bytes | None = None
+    for name, value in headers:
+        lowered: bytes = name.lower()
+        if lowered == b"cache-control" and b"no-store" in value.lower():
+            return None, False
+        if lowered == b"etag":
+            etag = value
+    if etag is not None:
+        return (None if etag.startswith(b"W/") else etag), False
+    # SHA-256 은 하드웨어 가속으로 blake2b 보다 빠름
+    return b'W/"%s"' % sha256(body).hexdigest()[:32].encode(), True
+
+
+def _target(scope: Scope) -> str:
+    query: bytes = scope.get("query_string", b"")
+    return scope["path"] + ("?" + query.decode("latin-1") if query else "")
+
+
+def _encoded_start(start: Message, encoding: str, body: bytes) -> Message:
+    """캐시된 압축 본문에 맞게 Content-Encoding, Content-Length, Vary 수정"""
+    raw: list[tuple[bytes, bytes]] = [
+        (name, value)
+        for name, value in start["headers"]
+        if name.lower() not in {b"content-length", b"content-encoding"}
+    ]
+    raw += [
+        (b"content-encoding", encoding.encode()),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    if any(name.lower() == b"vary" for name, _ in raw):
+        MutableHeaders(raw=raw).add_vary_header("Accept-Encoding")
+    else:
+        raw.append((b"vary", b"Accept-Encoding"))
+    start["headers"] = raw
+    return start
+
+
+class CompressionMiddleware:
+    """
+    정책 기반 응답 압축과 압축 결과 캐시
+
+    실제 압축은 CompressMiddleware 가 하며 크기 기준과 Content-Type 목록을 정책으로
+    설정, GET 200 응답은 ETag 와 인코딩을 키로 압축 결과를 캐시하여 같은 검색 결과를
+    다시 압축하지 않음
+
+    캐시 적중 시 안쪽 계층에서 압축된 본문과 Content-Encoding 을 보내고,
+    CompressMiddleware 는 이미 인코딩된 응답을 그대로 통과시킴
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        policy: CompressionPolicy | None = None,
+        cache: CompressedCache | None = None,
+    ) -> None:
+        self.app = app
+        self.policy = policy or CompressionPolicy.from_env()
+        self.cache = cache or CompressedCache(
+            self.policy.cache_entries, self.policy.cache_bytes
+        )
+        for content_type in self.policy.allow_types:
+            add_compress_type(content_type)
+        for content_type in self.policy.deny_types:
+            remove_compress_type(content_type)
+        self.compress = CompressMiddleware(
+            self._cached,
+            minimum_size=self.policy.minimum_size,
+            zstd_level=self.policy.zstd_level,
+            brotli_quality=self.policy.brotli_quality,
+            gzip_level=self.policy.gzip_level,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding: str | None = None
+        if scope["method"] == "GET" and self.policy.cache_entries > 0:
+            encoding = self._encoding(scope)
+        if encoding is None:
+            await self.compress(scope, receive, send)
+            return
+
+        pending = _Pending(encoding)
+        storing: bool = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal storing
+            if message["type"] == "http.response.start":
+                # 캐시 적중 응답은 key 가 없으므로 다시 저장하지 않음
+                storing = pending.key is not None and (
+                    MutableHeaders(raw=message["headers"]).get("content-encoding")
+                    == encoding
+                )
+            elif storing and pending.key is not None:
+                pending.body.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self.cache.put(pending.key, b"".join(pending.body))
+            await send(message)
+
+        token = _pending.set(pending)
+        try:
+            await self.compress(scope, receive, send_wrapper)
+        finally:
+            _pending.reset(token)
+
+    @staticmethod
+    def _encoding(scope: Scope) -> str | None:
+        accept: list[str] = [
+            value.decode("latin-1")
+            for name, value in scope["headers"]
+            if name == b"accept-encoding"
+        ]
+        if not accept:
+            return None
+        accepted: frozenset[str] = parse_accept_encoding(",".join(accept))
+        return next((e for e in ENCODINGS if e in accepted), None)
+
+    async def _cached(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """CompressMiddleware 안쪽 계층, 완성된 본문의 ETag 로 캐시 조회"""
+        pending: _Pending | None = _pending.get()
+        if pending is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] == HTTP_200_OK
+            ):
+                # 본문이 한 번에 오는지 확인할 때까지 보류
+                start = message
+                return
+            if start is None:
+                await send(message)
+                return
+
+            pending_start, start = start, None
+            body: bytes = message.get("body", b"")
+            if (
+                message["type"] != "http.response.body"
+                or message.get("more_body", False)
+                or len(body) < self.policy.minimum_size
+            ):
+                await send(pending_start)
+                await send(message)
+                return
+
+            etag, generated = _etag(pending_start["headers"], body)
+            if etag is None:
+                await send(pending_start)
+                await send(message)
+                return
+            if generated:
+                pending_start["headers"].append((b"etag", etag))
+
+            key: CacheKey = (_target(scope), etag, pending.encoding)
+            if (compressed := self.cache.get(key)) is None:
+                pending.key = key
+                await send(pending_start)
+                await send(message)
+                return
+
+            await send(_encoded_start(pending_start, pending.encoding, compressed))
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
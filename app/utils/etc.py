@@ -1,11 +1,6 @@
-import io
-from os import makedirs, path
-from pathlib import Path
 from typing import Any, Literal
 from uuid import uuid4
 
-from PIL.ImageFile import Image, ImageFile
-
 from model import ProblemDetails, ResponseFormat
 
 
@@ -37,15 +32,6 @@ def problem_details_formatter(
     )
 
 
-def save_image_to_local(image_data: bytes, file_path: Path) -> None:
-    # data/images/id 폴더 생성
-    makedirs(path.dirname(file_path), exist_ok=True)
-
-    image: ImageFile = Image.open(io.BytesIO(image_data))
-
-    image.save(file_path, "PNG")
-
-
 def single_word_list_to_many_word_list(
     single_word_list: list[str],
 ) -> list[str]:
@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+from time import perf_counter
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .server_timing import handler_finished, header_value
+
+
+class CustomHeadersMiddleware:
+    """
+    모든 응답에 공통 헤더와 Server-Timing 헤더 추가
+
+    응답 본문은 감싸지 않고 http.response.start 메시지의 헤더만 수정하므로
+    스트리밍 응답도 그대로 전달됨
+    """
+
+    def __init__(self, app: ASGIApp, headers: Iterable[tuple[str, str]] = ()) -> None:
+        self.app = app
+        self.headers: list[tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started: float = perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in self.headers:
+                    headers.raw.append((name, value))
+
+                # 단계별 처리 시간, SERVER_TIMING_ENABLED=false 면 수집하지 않음
+                timings: dict[str, float] | None = handler_finished()
+                if timings is not None:
+                    headers.append(
+                        "Server-Timing", header_value(timings, perf_counter() - started)
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
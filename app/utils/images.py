@@ -0,0 +1,156 @@
+import io
+from base64 import b64encode
+from dataclasses import dataclass
+from os import environ
+from typing import Any, Literal
+
+from dotenv import load_dotenv
+from PIL import Image, ImageOps
+
+load_dotenv()
+
+# 사진 계열 원본 포맷, 나머지(PNG, GIF, BMP, TIFF, WEBP)는 그래픽으로 취급
+PHOTO_FORMATS: set[str] = {"JPEG", "MPO"}
+
+FORMAT_DETAILS: dict[str, tuple[str, str]] = {
+    "JPEG": ("image/jpeg", "jpg"),
+    "PNG": ("image/png", "png"),
+    "WEBP": ("image/webp", "webp"),
+}
+
+# 목록 화면에서 바로 표시할 인라인 미리보기 이미지 긴 변 크기
+PLACEHOLDER_DIMENSION: int = 16
+PLACEHOLDER_QUALITY: int = 40
+DOMINANT_COLOR_SAMPLE: int = 64
+DOMINANT_COLOR_PALETTE: int = 5
+
+
+@dataclass(frozen=True)
+class ImageStoragePolicy:
+    """
+    업로드 이미지 저장 정책
+
+    - max_dimension: 긴 변 최대 픽셀, 초과 시 비율 유지 축소
+    - photo_format: JPEG 원본의 저장 포맷 (JPEG 최적화 또는 손실 WEBP)
+    - graphic_format: 그 외 원본의 저장 포맷 (무손실 WEBP 또는 최적화 PNG)
+    - jpeg_quality, webp_quality: 손실 압축 품질 (1~100)
+    - webp_effort: WEBP 인코딩 노력 (0~6, 높을수록 작고 느림)
+    - png_compress_level: PNG zlib 압축 레벨 (0~9)
+    """
+
+    max_dimension: int = 1600
+    photo_format: Literal["JPEG", "WEBP"] = "JPEG"
+    graphic_format: Literal["WEBP", "PNG"] = "WEBP"
+    jpeg_quality: int = 82
+    webp_quality: int = 80
+    webp_effort: int = 4
+    png_compress_level: int = 9
+
+    @classmethod
+    def from_env(cls) -> "ImageStoragePolicy":
+        return cls(
+            max_dimension=int(environ.get("IMAGE_MAX_DIMENSION", "1600")),
+            photo_format=environ.get("IMAGE_PHOTO_FORMAT", "JPEG").upper(),  # type: ignore[arg-type]
+            graphic_format=environ.get("IMAGE_GRAPHIC_FORMAT", "WEBP").upper(),  # type: ignore[arg-type]
+            jpeg_quality=int(environ.get("IMAGE_JPEG_QUALITY", "82")),
+            webp_quality=int(environ.get("IMAGE_WEBP_QUALITY", "80")),
+            webp_effort=int(environ.get("IMAGE_WEBP_EFFORT", "4")),
+            png_compress_level=int(environ.get("IMAGE_PNG_COMPRESS_LEVEL", "9")),
+        )
+
+
+@dataclass(frozen=True)
+class EncodedImage:
+    data: bytes
+    content_type: str
+    extension: str
+    width: int
+    height: int
+    original_size: int
+    placeholder: str
+    dominant_color: str
+
+    @property
+    def stored_size(self) -> int:
+        return len(self.data)
+
+
+def _save_options(
+    target_format: str, is_photo: bool, policy: ImageStoragePolicy
+) -> dict[str, Any]:
+    if target_format == "JPEG":
+        return {"quality": policy.jpeg_quality, "optimize": True, "progressive": True}
+    if target_format == "PNG":
+        return {"optimize": True, "compress_level": policy.png_compress_level}
+    if is_photo:
+        return {"quality": policy.webp_quality, "method": policy.webp_effort}
+    # 무손실 WEBP 에서 quality 는 압축 노력 정도를 의미
+    return {"lossless": True, "quality": 100, "method": policy.webp_effort}
+
+
+def placeholder_data_uri(image: Image.Image) -> str:
+    """긴 변 16px WEBP 를 data URI 로 인코딩, 클라이언트에서 블러 처리하여 표시"""
+    thumbnail: Image.Image = image.copy()
+    thumbnail.thumbnail(
+        (PLACEHOLDER_DIMENSION, PLACEHOLDER_DIMENSION), Image.Resampling.BILINEAR
+    )
+
+    buffer = io.BytesIO()
+    thumbnail.save(buffer, "WEBP", quality=PLACEHOLDER_QUALITY, method=6)
+    return f"data:image/webp;base64,{b64encode(buffer.getvalue()).decode()}"
+
+
+def dominant_color(image: Image.Image) -> str:
+    """축소 이미지를 소수 팔레트로 양자화하여 가장 많은 색을 #rrggbb 로 반환"""
+    sample: Image.Image = image.convert("RGB")
+    sample.thumbnail(
+        (DOMINANT_COLOR_SAMPLE, DOMINANT_COLOR_SAMPLE), Image.Resampling.BILINEAR
+    )
+    quantized: Image.Image = sample.quantize(
+        colors=DOMINANT_COLOR_PALETTE, method=Image.Quantize.MEDIANCUT
+    )
+
+    _, index = max(quantized.getcolors() or [(0, 0)])
+    palette: list[int] = quantized.getpalette() or [0, 0, 0]
+    red, green, blue = palette[index * 3 : index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def encode_image(image_data: bytes, policy: ImageStoragePolicy) -> EncodedImage:
+    """
+    EXIF 방향 적용, 최대 크기 제한, 메타데이터 제거 후 정책에 따른 포맷으로 인코딩
+
+    메타데이터는 save() 에 exif, icc_profile 등을 전달하지 않는 방식으로 제거
+    목록 화면용 미리보기(placeholder)와 대표 색상도 함께 계산
+    """
+    with Image.open(io.BytesIO(image_data)) as source:
+        is_photo: bool = source.format in PHOTO_FORMATS
+        image: Image.Image = ImageOps.exif_transpose(source)
+
+    image.thumbnail(
+        (policy.max_dimension, policy.max_dimension), Image.Resampling.LANCZOS
+    )
+
+    target_format: str = policy.photo_format if is_photo else policy.graphic_format
+    has_alpha: bool = image.mode in {"RGBA", "LA", "PA"} or (
+        image.mode == "P" and "transparency" in image.info
+    )
+    if target_format == "JPEG" or not has_alpha:
+        image = image.convert("RGB") if image.mode not in {"RGB", "L"} else image
+    elif image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    buffer = io.BytesIO()
+    image.save(buffer, target_format, **_save_options(target_format, is_photo, policy))
+
+    content_type, extension = FORMAT_DETAILS[target_format]
+    return EncodedImage(
+        data=buffer.getvalue(),
+        content_type=content_type,
+        extension=extension,
+        width=image.width,
+        height=image.height,
+        original_size=len(image_data),
+        placeholder=placeholder_data_uri(image),
+        dominant_color=dominant_color(image),
+    )
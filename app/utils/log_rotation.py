@@ -0,0 +1,262 @@
+import fcntl
+import io
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from os import environ
+from pathlib import Path
+from threading import Thread
+from typing import Any, TypedDict
+
+import orjson
+import zstandard
+from dotenv import load_dotenv
+
+from .times import datetime_now
+
+load_dotenv()
+
+# Logger 의 TimeStamper 형식, 문자열 비교로 시간 순서 비교 가능
+TIMESTAMP_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+_MAX_TIMESTAMP: str = "9999-12-31 23:59:59"
+_SEGMENT_TIME_FORMAT: str = "%Y%m%dT%H%M%S"
+
+
+@dataclass(frozen=True)
+class LogRotationPolicy:
+    """
+    로그 파일 교체 정책
+
+    - max_bytes, max_age_seconds: 활성 파일이 이 크기나 기간을 넘으면 교체
+    - retention_days: 마지막 로그가 이 기간보다 오래된 압축 세그먼트 삭제
+    - zstd_level: 교체된 세그먼트 압축 수준
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    max_age_seconds: float = 86400.0
+    retention_days: float = 30.0
+    zstd_level: int = 3
+
+    @classmethod
+    def from_env(cls) -> "LogRotationPolicy":
+        return cls(
+            max_bytes=int(environ.get("LOG_ROTATE_BYTES", str(64 * 1024 * 1024))),
+            max_age_seconds=float(environ.get("LOG_ROTATE_SECONDS", "86400")),
+            retention_days=float(environ.get("LOG_RETENTION_DAYS", "30")),
+            zstd_level=int(environ.get("LOG_ZSTD_LEVEL", "3")),
+        )
+
+
+class SegmentInfo(TypedDict):
+    segment: str
+    first: str
+    last: str
+    lines: int
+    size: int
+    stored_size: int
+
+
+def _nano_timestamp(unix_nano: int) -> str:
+    return datetime.fromtimestamp(unix_nano / 1e9, tz=UTC).strftime(TIMESTAMP_FORMAT)
+
+
+def _line_times(line: bytes) -> tuple[str, str] | None:
+    """
+    한 줄의 (시작, 종료) 시각
+
+    로그는 timestamp 필드, timestamp 가 없는 OTLP 트레이스 라인은 span 시작과 종료 시각
+    """
+    try:
+        record: dict[str, Any] = orjson.loads(line)
+        if "timestamp" in record:
+            return record["timestamp"], record["timestamp"]
+        spans: list[dict[str, Any]] = [
+            span
+            for resource in record["resourceSpans"]
+            for scope in resource["scopeSpans"]
+            for span in scope["spans"]
+        ]
+        return (
+            _nano_timestamp(min(int(span["startTimeUnixNano"]) for span in spans)),
+            _nano_timestamp(max(int(span["endTimeUnixNano"]) for span in spans)),
+        )
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def first_timestamp(fd: int) -> datetime | None:
+    """열린 로그 파일의 첫 로그 시각"""
+    head: bytes = os.pread(fd, 4096, 0)
+    times: tuple[str, str] | None = (
+        _line_times(head.split(b"\n", 1)[0]) if head else None
+    )
+    if times is None:
+        return None
+    return datetime.strptime(times[0], TIMESTAMP_FORMAT).replace(tzinfo=UTC)
+
+
+def rotated_path(path: Path, now: datetime) -> Path:
+    """교체된 세그먼트 경로, 예: service.20250101T000000.jsonl"""
+    stamp: str = now.strftime(_SEGMENT_TIME_FORMAT)
+    candidate: Path = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+    counter: int = 0
+    while candidate.exists() or candidate.with_name(f"{candidate.name}.zst").exists():
+        counter += 1
+        candidate = path.with_name(f"{path.stem}.{stamp}-{counter}{path.suffix}")
+    return candidate
+
+
+class LogArchive:
+    """
+    교체된 로그 세그먼트의 압축, 보관 기간 관리, 조회
+
+    사이드카 인덱스(service.index.json)에 세그먼트별 첫/마지막 로그 시각을 기록하여
+    기간 조회 시 해당 세그먼트만 읽음
+    """
+
+    def __init__(self, path: Path, policy: LogRotationPolicy) -> None:
+        self.path = path
+        self.policy = policy
+        self.index_path: Path = path.with_name(f"{path.stem}.index.json")
+        self._lock_path: Path = path.with_name(f".{path.stem}.index.lock")
+
+    @contextmanager
+    def _locked_index(self) -> Iterator[list[SegmentInfo]]:
+        """인덱스를 워커 간 잠금 상태로 읽고, 블록 종료 시 원자적으로 교체"""
+        fd: int = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            segments: list[SegmentInfo] = self.segments()
+            yield segments
+
+            temp: Path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+            temp.write_bytes(orjson.dumps(segments, option=orjson.OPT_INDENT_2))
+            temp.replace(self.index_path)
+        finally:
+            os.close(fd)
+
+    def segments(self) -> list[SegmentInfo]:
+        try:
+            return orjson.loads(self.index_path.read_bytes())
+        except FileNotFoundError:
+            return []
+
+    def pending(self) -> list[Path]:
+        """압축되지 않은 교체 세그먼트 (압축 도중 종료된 경우 포함)"""
+        return sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}"))
+
+    def compress(self, segment: Path) -> SegmentInfo | None:
+        """
+        세그먼트를 zstd 로 압축하고 인덱스에 추가
+
+        다른 워커가 같은 세그먼트를 압축 중이면 건너뜀
+        """
+        try:
+            fd: int = os.open(segment, os.O_RDONLY)
+        except FileNotFoundError:
+            return None
+
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return None
+            if not segment.exists():
+                return None
+
+            target: Path = segment.with_name(f"{segment.name}.zst")
+            first: str | None = None
+            last: str | None = None
+            lines: int = 0
+            compressor = zstandard.ZstdCompressor(level=self.policy.zstd_level)
+            with (
+                open(fd, "rb", closefd=False) as source,
+                open(target, "wb") as out,
+                compressor.stream_writer(out) as writer,
+            ):
+                for line in source:
+                    writer.write(line)
+                    lines += 1
+                    if (times := _line_times(line)) is not None:
+                        # 트레이스는 종료 순서로 기록되므로 시작 시각이 뒤섞일 수 있음
+                        first = min(first or times[0], times[0])
+                        last = max(last or times[1], times[1])
+
+            info = SegmentInfo(
+                segment=target.name,
+                first=first or "",
+                last=last or "",
+                lines=lines,
+                size=os.fstat(fd).st_size,
+                stored_size=target.stat().st_size,
+            )
+            with self._locked_index() as segments:
+                segments.append(info)
+                segments.sort(key=lambda item: item["first"])
+            segment.unlink()
+            return info
+        finally:
+            os.close(fd)
+
+    def apply_retention(self, now: datetime | None = None) -> list[str]:
+        """보관 기간이 지난 세그먼트 삭제"""
+        cutoff: str = (
+            (now or datetime_now()) - timedelta(days=self.policy.retention_days)
+        ).strftime(TIMESTAMP_FORMAT)
+
+        with self._locked_index() as segments:
+            expired: list[SegmentInfo] = [
+                info for info in segments if info["last"] < cutoff
+            ]
+            for info in expired:
+                self.path.with_name(info["segment"]).unlink(missing_ok=True)
+                segments.remove(info)
+
+        return [info["segment"] for info in expired]
+
+    def maintain(self) -> None:
+        for segment in self.pending():
+            self.compress(segment)
+        self.apply_retention()
+
+    def maintain_in_background(self) -> Thread:
+        thread = Thread(target=self.maintain, name="log-archive", daemon=True)
+        thread.start()
+        return thread
+
+    def iter_logs(
+        self, since: datetime | None = None, until: datetime | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """기간에 해당하는 로그 조회, 인덱스로 겹치는 세그먼트만 열고 마지막으로 활성 파일 조회"""
+        start: str = since.strftime(TIMESTAMP_FORMAT) if since else ""
+        end: str = until.strftime(TIMESTAMP_FORMAT) if until else _MAX_TIMESTAMP
+
+        sources: list[Iterator[bytes]] = [
+            self._read_segment(self.path.with_name(info["segment"]))
+            for info in self.segments()
+            if info["last"] >= start and info["first"] <= end
+        ]
+        if self.path.exists():
+            sources.append(self._read_active())
+
+        for source in sources:
+            for line in source:
+                try:
+                    log: dict[str, Any] = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # 기록 중인 마지막 줄 등
+                    continue
+                if start <= log.get("timestamp", "") <= end:
+                    yield log
+
+    @staticmethod
+    def _read_segment(segment: Path) -> Iterator[bytes]:
+        with open(segment, "rb") as f:
+            reader = zstandard.ZstdDecompressor().stream_reader(f)
+            yield from io.BufferedReader(reader)
+
+    def _read_active(self) -> Iterator[bytes]:
+        with open(self.path, "rb") as f:
+            yield from f
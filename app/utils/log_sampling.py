@@ -0,0 +1,139 @@
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from os import environ
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 같은 이벤트인지 판단하는 필드, 경로 등 요청마다 다른 값은 제외하되
+# 감사 추적이 필요한 사용자 식별자는 포함하여 다른 사용자의 이벤트를 함께 억제하지 않음
+KEY_FIELDS: tuple[str, ...] = ("code", "detail", "message", "error", "user_id")
+SUPPRESSED_EVENT: str = "Repeated log events suppressed"
+
+
+@dataclass(frozen=True)
+class LogSamplingPolicy:
+    """
+    반복 로그 샘플링 정책
+
+    - window_seconds: 이벤트별 집계 윈도우 길이
+    - keep_first: 윈도우마다 항상 기록하는 처음 이벤트 수
+    - sample_every: 이후 N 개 중 1 개만 기록 (1 이면 샘플링하지 않음)
+    - levels: 샘플링 대상 로그 레벨, 로그인, 권한 변경 등 감사 로그가 있는 info 는 기본 제외
+    - max_keys: 윈도우를 추적할 최대 이벤트 수, 넘으면 레벨과 이벤트 이름만으로 묶음
+    """
+
+    window_seconds: float = 60.0
+    keep_first: int = 20
+    sample_every: int = 100
+    levels: frozenset[str] = frozenset({"debug", "warning", "error"})
+    max_keys: int = 10000
+
+    @classmethod
+    def from_env(cls) -> "LogSamplingPolicy":
+        return cls(
+            window_seconds=float(environ.get("LOG_SAMPLE_WINDOW_SECONDS", "60")),
+            keep_first=int(environ.get("LOG_SAMPLE_KEEP_FIRST", "20")),
+            sample_every=int(environ.get("LOG_SAMPLE_EVERY", "100")),
+            levels=frozenset(
+                environ.get("LOG_SAMPLE_LEVELS", "debug,warning,error").split(",")
+            ),
+            max_keys=int(environ.get("LOG_SAMPLE_MAX_KEYS", "10000")),
+        )
+
+
+@dataclass
+class _EventWindow:
+    started: float
+    level: str
+    event: str
+    example: dict[str, Any]
+    count: int = 0
+    suppressed: int = 0
+
+
+class LogSampler:
+    """
+    같은 이벤트가 반복될 때 윈도우마다 처음 keep_first 개는 모두 기록하고 이후는 샘플링
+
+    억제된 이벤트는 윈도우가 끝날 때 개수를 담은 요약 이벤트 1 개로 기록
+    """
+
+    def __init__(self, policy: LogSamplingPolicy) -> None:
+        self.policy = policy
+        self._windows: dict[tuple[str, ...], _EventWindow] = {}
+        self._lock = Lock()
+
+    def _key(
+        self, level: str, event: str, event_dict: MutableMapping[str, Any]
+    ) -> tuple[str, ...]:
+        key: tuple[str, ...] = (
+            level,
+            event,
+            *(str(event_dict.get(name, "")) for name in KEY_FIELDS),
+        )
+        if key in self._windows or len(self._windows) < self.policy.max_keys:
+            return key
+        return (level, event)
+
+    def keep(self, event_dict: MutableMapping[str, Any]) -> bool:
+        """기록 여부 판단, 샘플링 이후 기록되는 이벤트에는 sampled 필드 추가"""
+        level: str = event_dict.get("level", "")
+        if level not in self.policy.levels:
+            return True
+
+        event: str = str(event_dict.get("event", ""))
+        now: float = monotonic()
+        with self._lock:
+            key: tuple[str, ...] = self._key(level, event, event_dict)
+            window: _EventWindow | None = self._windows.get(key)
+            if window is None:
+                window = self._windows[key] = _EventWindow(
+                    now,
+                    level,
+                    event,
+                    {
+                        name: event_dict[name]
+                        for name in KEY_FIELDS
+                        if name in event_dict
+                    },
+                )
+            window.count += 1
+
+            if window.count <= self.policy.keep_first:
+                return True
+            if window.count % self.policy.sample_every == 0:
+                event_dict["sampled"] = f"1/{self.policy.sample_every}"
+                return True
+
+            window.suppressed += 1
+            return False
+
+    def summaries(self, now: float | None = None) -> list[tuple[str, dict[str, Any]]]:
+        """끝난 윈도우를 정리하고 억제된 이벤트가 있던 윈도우의 (레벨, 요약) 반환"""
+        now = monotonic() if now is None else now
+        expired: list[_EventWindow] = []
+        with self._lock:
+            for key, window in list(self._windows.items()):
+                if now - window.started >= self.policy.window_seconds:
+                    del self._windows[key]
+                    expired.append(window)
+
+        return [
+            (
+                window.level,
+                {
+                    "original_event": window.event,
+                    "count": window.count,
+                    "suppressed": window.suppressed,
+                    "window_seconds": self.policy.window_seconds,
+                    **window.example,
+                },
+            )
+            for window in expired
+            if window.suppressed
+        ]
@@ -1,9 +1,260 @@
+import atexit
 import fcntl
+import os
+from collections import deque
+from datetime import datetime
+from math import inf
+from os import environ
 from pathlib import Path
+from threading import Event, Lock, Thread
 from typing import Any, Mapping, MutableMapping  # noqa: UP035
 
 import orjson
 import structlog
+from dotenv import load_dotenv
+
+from .log_rotation import (
+    TIMESTAMP_FORMAT,
+    LogArchive,
+    LogRotationPolicy,
+    first_timestamp,
+    rotated_path,
+)
+from .log_sampling import SUPPRESSED_EVENT, LogSampler, LogSamplingPolicy
+from .times import datetime_now
+
+load_dotenv()
+
+LOG_QUEUE_SIZE: int = int(environ.get("LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_LINES: int = int(environ.get("LOG_BATCH_LINES", "512"))
+LOG_FLUSH_SECONDS: float = float(environ.get("LOG_FLUSH_SECONDS", "0.5"))
+LOG_ROTATION: LogRotationPolicy = LogRotationPolicy.from_env()
+LOG_SAMPLING: LogSamplingPolicy = LogSamplingPolicy.from_env()
+
+
+class _Flush:
+    """큐에 넣어 그 전까지의 로그가 파일에 기록될 때까지 대기하는 표식"""
+
+    def __init__(self) -> None:
+        self.done = Event()
+
+
+class LogWriter:
+    """
+    로그 라인을 큐에 모아 백그라운드 스레드에서 일괄 기록
+
+    - 호출 측(이벤트 루프)은 큐에 넣기만 하고 파일 I/O 는 하지 않음
+    - 워커별로 파일을 한 번 열어 유지, 배치당 flock 1회, write 1회
+    - 큐가 가득 차면 버리고 개수를 세어 다음 배치에 기록
+    - sampler 가 있으면 주기마다 끝난 샘플링 윈도우의 요약 이벤트를 함께 기록
+    - rotation 정책이 있으면 배치 기록 후 크기, 기간을 확인하여 세그먼트로 교체
+    - gunicorn preload 후 fork 된 워커는 큐와 스레드를 새로 생성
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Path,
+        *,
+        queue_size: int = LOG_QUEUE_SIZE,
+        batch_lines: int = LOG_BATCH_LINES,
+        flush_seconds: float = LOG_FLUSH_SECONDS,
+        rotation: LogRotationPolicy | None = None,
+        sampler: LogSampler | None = None,
+    ) -> None:
+        self.path = path
+        self.rotation = rotation
+        self.sampler = sampler
+        self._archive = LogArchive(path, rotation or LogRotationPolicy())
+        self.queue_size = queue_size
+        self.batch_lines = batch_lines
+        self.flush_seconds = flush_seconds
+        self._start_lock = Lock()
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self) -> None:
+        if getattr(self, "_fd", -1) >= 0:
+            os.close(self._fd)
+        # deque.append 는 GIL 하에서 원자적이므로 호출 측은 잠금 없이 추가
+        self._pending: deque[bytes | _Flush] = deque()
+        self._wakeup = Event()
+        self._thread: Thread | None = None
+        self._fd: int = -1
+        self._opened_at: datetime | None = None
+        self._closing: bool = False
+        self.written: int = 0
+        self.batches: int = 0
+        self.dropped: int = 0
+        self._reported_dropped: int = 0
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def write(self, line: bytes) -> None:
+        """로그 라인 1개를 큐에 추가, 블로킹하지 않음"""
+        if self._thread is None:
+            self._start()
+
+        pending: int = len(self._pending)
+        if pending >= self.queue_size:
+            self.dropped += 1
+            return
+
+        self._pending.append(line)
+        if pending + 1 == self.batch_lines:
+            self._wakeup.set()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """큐에 쌓인 로그를 기록할 때까지 대기"""
+        if self._thread is None:
+            return True
+        marker = _Flush()
+        self._pending.append(marker)
+        self._wakeup.set()
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> bool:
+        """진행 중인 샘플링 윈도우의 요약까지 기록 (프로세스 종료 시)"""
+        self._closing = True
+        return self.flush(timeout)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": len(self._pending),
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+        }
+
+    def _run(self) -> None:
+        while True:
+            # 배치 크기가 차거나 flush 요청 시 깨어나고, 아니면 주기마다 기록
+            self._wakeup.wait(self.flush_seconds)
+            self._wakeup.clear()
+
+            batch: list[bytes] = []
+            markers: list[_Flush] = []
+            while self._pending:
+                item: bytes | _Flush = self._pending.popleft()
+                if isinstance(item, _Flush):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+
+            if self.sampler is not None:
+                batch.extend(
+                    _format_line(level, SUPPRESSED_EVENT, **summary)
+                    for level, summary in self.sampler.summaries(
+                        inf if self._closing else None
+                    )
+                )
+
+            if batch or self.dropped != self._reported_dropped:
+                self._write_batch(batch)
+            for marker in markers:
+                marker.done.set()
+
+    def _write_batch(self, batch: list[bytes]) -> None:
+        dropped: int = self.dropped - self._reported_dropped
+        if dropped:
+            self._reported_dropped += dropped
+            batch.append(_format_line("warning", "Log events dropped", count=dropped))
+
+        data: bytes = b"".join(batch)
+        try:
+            fd: int = self._open_locked()
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                self._rotate_if_needed(fd)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except Exception as e:
+            print(f"Failed to write log: {e}")
+            return
+
+        self.written += len(batch)
+        self.batches += 1
+
+    def _open_locked(self) -> int:
+        """
+        활성 로그 파일을 잠근 상태로 반환
+
+        다른 워커가 파일을 교체했으면 잠근 뒤 inode 가 달라지므로 새 파일을 다시 엶
+        """
+        while True:
+            if self._fd < 0:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._fd = os.open(
+                    self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644
+                )
+                self._opened_at = None
+
+            # 다른 워커의 배치와 섞이지 않도록 배치 단위로 잠금
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._fd).st_ino:
+                    return self._fd
+            except FileNotFoundError:
+                pass
+
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = -1
+
+    def _rotate_if_needed(self, fd: int) -> None:
+        """잠금 상태에서 크기, 기간 기준을 넘은 활성 파일을 세그먼트로 교체"""
+        if self.rotation is None:
+            return
+
+        now: datetime = datetime_now()
+        if self._opened_at is None:
+            self._opened_at = first_timestamp(fd) or now
+
+        if (
+            os.fstat(fd).st_size < self.rotation.max_bytes
+            and (now - self._opened_at).total_seconds() < self.rotation.max_age_seconds
+        ):
+            return
+
+        # 다른 워커는 다음 배치에서 inode 변경을 감지하고 새 파일을 엶
+        os.rename(self.path, rotated_path(self.path, now))
+        self._archive.maintain_in_background()
+
+
+def _format_line(level: str, event: str, **details: Any) -> bytes:
+    return orjson.dumps(
+        {
+            "timestamp": datetime_now().strftime(TIMESTAMP_FORMAT),
+            "level": level,
+            "event": event,
+            "details": details,
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+_writers: dict[Path, LogWriter] = {}
+
+
+def log_writer(path: Path) -> LogWriter:
+    """경로별 LogWriter (프로세스당 1개)"""
+    writer: LogWriter | None = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = LogWriter(
+            path, rotation=LOG_ROTATION, sampler=LogSampler(LOG_SAMPLING)
+        )
+    return writer
+
+
+@atexit.register
+def _flush_all() -> None:
+    for writer in _writers.values():
+        writer.close(timeout=1.0)
 
 
 class Logger:
@@ -12,6 +263,7 @@ class Logger:
     def __init__(self, log_file: str = "service.jsonl") -> None:
         """인스턴트 초기화"""
         self.log_path: Path = Path.cwd().parent / "log" / log_file
+        self.writer: LogWriter = log_writer(self.log_path)
         self._init_log_file()
 
     def _init_log_file(self) -> None:
@@ -23,7 +275,11 @@ class Logger:
     def _format_and_write(
         self, logger: Any, name: str, event_dict: MutableMapping[str, Any]
     ) -> Mapping[str, Any]:
-        """로그 포맷팅 및 내용 쓰기"""
+        """로그 포맷팅 후 기록 큐에 추가, 샘플링으로 제외된 이벤트는 이후 처리하지 않음"""
+        sampler: LogSampler | None = self.writer.sampler
+        if sampler is not None and not sampler.keep(event_dict):
+            raise structlog.DropEvent
+
         formatted_log: dict[str, Any] = {
             "timestamp": event_dict["timestamp"],
             "level": event_dict["level"],
@@ -36,13 +292,9 @@ class Logger:
         }
 
         try:
-            with open(self.log_path, "ab") as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-
-                f.write(orjson.dumps(formatted_log))
-                f.write(b"\n")
-
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            self.writer.write(
+                orjson.dumps(formatted_log, option=orjson.OPT_APPEND_NEWLINE)
+            )
         except Exception as e:
             print(f"Failed to write log: {e}")
 
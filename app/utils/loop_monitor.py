@@ -0,0 +1,164 @@
+import os
+import sys
+import traceback
+from asyncio import AbstractEventLoop, Task, current_task, get_running_loop, sleep
+from collections import deque
+from dataclasses import dataclass
+from os import environ
+from threading import Event, Thread, get_ident
+from time import monotonic
+from typing import Any
+
+from dotenv import load_dotenv
+from structlog import BoundLogger
+
+from .logger import Logger
+from .metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_LAG, EVENT_LOOP_LAG_RECENT
+
+load_dotenv()
+logger: BoundLogger = Logger().setup()
+
+QUANTILES: tuple[float, ...] = (0.5, 0.9, 0.99, 1.0)
+
+
+@dataclass(frozen=True)
+class LoopMonitorPolicy:
+    """
+    이벤트 루프 지연 모니터 정책
+
+    - interval: 지연 측정 주기, 주기마다 sleep 이 늦게 깨어난 만큼을 지연으로 기록
+    - window: 백분위를 계산할 최근 측정 개수
+    - capture_blocking: 디버그, 카나리 배포에서만 켜는 루프 점유 스택 수집
+    - block_threshold: 이 시간 이상 루프가 응답하지 않으면 점유 중인 스택을 기록
+    """
+
+    enabled: bool = True
+    interval: float = 0.1
+    window: int = 600
+    capture_blocking: bool = False
+    block_threshold: float = 0.1
+
+    @classmethod
+    def from_env(cls) -> "LoopMonitorPolicy":
+        return cls(
+            enabled=environ.get("LOOP_MONITOR_ENABLED", "true").lower() == "true",
+            interval=float(environ.get("LOOP_MONITOR_INTERVAL", "0.1")),
+            window=int(environ.get("LOOP_MONITOR_WINDOW", "600")),
+            capture_blocking=(
+                environ.get("LOOP_BLOCK_CAPTURE", "false").lower() == "true"
+            ),
+            block_threshold=float(environ.get("LOOP_BLOCK_THRESHOLD", "0.1")),
+        )
+
+
+def percentiles(values: list[float]) -> dict[float, float]:
+    """nearest-rank 방식 백분위"""
+    ordered: list[float] = sorted(values)
+    return {
+        quantile: ordered[max(round(quantile * len(ordered)) - 1, 0)]
+        for quantile in QUANTILES
+    }
+
+
+class LoopMonitor:
+    """
+    이벤트 루프 지연 측정 및 루프를 막는 호출 감지
+
+    - 루프 안의 작업이 interval 마다 깨어나 지연을 히스토그램과 최근 백분위 게이지로 기록
+    - capture_blocking 이면 감시 스레드가 마지막 tick 이후 block_threshold 가 지나도록
+      루프가 돌아오지 않을 때 루프 스레드의 현재 스택(막고 있는 코드)을 로그로 기록
+    """
+
+    def __init__(self, policy: LoopMonitorPolicy) -> None:
+        self.policy = policy
+        self._lags: deque[float] = deque(maxlen=policy.window)
+        self._heartbeat: float = monotonic()
+        self._loop: AbstractEventLoop | None = None
+        self._loop_thread: int = 0
+        self._stop = Event()
+        self.blocked: list[dict[str, Any]] = []
+        # 감시 스레드가 늘리고 메트릭 기록은 루프에서 수행
+        self._stalls: int = 0
+        self._published_stalls: int = 0
+
+    def stats(self) -> dict[float, float]:
+        return percentiles(list(self._lags)) if self._lags else {}
+
+    def _publish(self) -> None:
+        worker: str = str(os.getpid())
+        for quantile, lag in self.stats().items():
+            EVENT_LOOP_LAG_RECENT.set((worker, str(quantile)), lag)
+
+        stalls: int = self._stalls
+        if stalls != self._published_stalls:
+            EVENT_LOOP_BLOCKED.inc((), stalls - self._published_stalls)
+            self._published_stalls = stalls
+
+    def capture(self, stalled: float) -> dict[str, Any] | None:
+        """루프 스레드의 현재 스택과 실행 중인 태스크 기록"""
+        frame: Any = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return None
+
+        # 태스크가 아닌 콜백이 루프를 막고 있으면 None
+        task: Task[Any] | None = (
+            current_task(self._loop) if self._loop is not None else None
+        )
+        task_name: str | None = task.get_name() if task is not None else None
+
+        blocked: dict[str, Any] = {
+            "blocked_ms": round(stalled * 1000, 1),
+            "task": task_name,
+            "stack": "".join(traceback.format_stack(frame)),
+        }
+        self.blocked = [*self.blocked[-19:], blocked]
+        self._stalls += 1
+        logger.warning("Event loop blocked", **blocked)
+        return blocked
+
+    def _watch(self) -> None:
+        reported: float = 0.0
+        while not self._stop.wait(self.policy.block_threshold / 2):
+            heartbeat: float = self._heartbeat
+            # 다음 tick 예정 시각부터 늦어진 시간
+            stalled: float = monotonic() - heartbeat - self.policy.interval
+            # 같은 정지는 한 번만 기록
+            if stalled >= self.policy.block_threshold and heartbeat != reported:
+                reported = heartbeat
+                self.capture(stalled)
+
+    async def run_forever(self) -> None:
+        if not self.policy.enabled:
+            return
+
+        self._loop = get_running_loop()
+        self._loop_thread = get_ident()
+        self._heartbeat = monotonic()
+        watcher: Thread | None = None
+        if self.policy.capture_blocking:
+            self._stop.clear()
+            watcher = Thread(target=self._watch, name="loop-monitor", daemon=True)
+            watcher.start()
+
+        # 약 1 초마다 백분위 게이지 갱신
+        publish_every: int = max(round(1 / self.policy.interval), 1)
+        ticks: int = 0
+        try:
+            while True:
+                started: float = monotonic()
+                await sleep(self.policy.interval)
+                self._heartbeat = now = monotonic()
+                lag: float = max(now - started - self.policy.interval, 0.0)
+                self._lags.append(lag)
+                EVENT_LOOP_LAG.observe((), lag)
+
+                ticks += 1
+                if ticks % publish_every == 0:
+                    self._publish()
+        finally:
+            self._stop.set()
+            if watcher is not None:
+                watcher.join(timeout=1.0)
+
+
+loop_monitor = LoopMonitor(LoopMonitorPolicy.from_env())
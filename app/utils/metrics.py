@@ -0,0 +1,422 @@
+import fcntl
+import os
+from asyncio import sleep, to_thread
+from bisect import bisect_left
+from collections.abc import Iterable
+from contextlib import suppress
+from os import environ
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ClassVar
+
+import orjson
+from dotenv import load_dotenv
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+load_dotenv()
+
+METRICS_DIR: Path = Path(environ.get("METRICS_DIR", "../data/.metrics"))
+METRICS_FLUSH_SECONDS: float = float(environ.get("METRICS_FLUSH_SECONDS", "1"))
+
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS: tuple[float, ...] = tuple(float(4**i * 64) for i in range(10))
+
+_ARCHIVE: str = "archive.json"
+
+type Labels = tuple[str, ...]
+
+
+class _Metric:
+    kind: ClassVar[str]
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[Labels, Any] = {}
+
+    def reset(self) -> None:
+        self._values = {}
+
+    def describe(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "help": self.documentation,
+            "labels": list(self.labelnames),
+        }
+
+    def samples(self) -> list[list[Any]]:
+        return [[list(labels), value] for labels, value in self._values.items()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """워커별 값, 수집 시 살아있는 워커의 값만 합산"""
+
+    kind = "gauge"
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+    def set(self, labels: Labels, value: float) -> None:
+        self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """
+    버킷별 개수(누적 아님), 합계, 개수를 [*buckets, +Inf, sum, count] 목록으로 보관
+
+    누적 개수는 출력 시 계산하여 관측 비용을 bisect 1회로 유지
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+
+    def observe(self, labels: Labels, value: float) -> None:
+        series: list[float] | None = self._values.get(labels)
+        if series is None:
+            series = self._values[labels] = [0.0] * (len(self.buckets) + 3)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def describe(self) -> dict[str, Any]:
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+def _merge(target: dict[str, Any], snapshot: dict[str, Any], gauges: bool) -> None:
+    """스냅숏 값을 target 에 더함, gauges=False 면 게이지 제외"""
+    for name, metric in snapshot.items():
+        if metric["kind"] == "gauge" and not gauges:
+            continue
+        merged: dict[str, Any] = target.setdefault(name, {**metric, "values": {}})
+        values: dict[Labels, Any] = merged["values"]
+        for labels, value in metric["values"]:
+            key: Labels = tuple(labels)
+            current: Any = values.get(key)
+            if current is None:
+                values[key] = list(value) if isinstance(value, list) else value
+            elif isinstance(value, list):
+                values[key] = [a + b for a, b in zip(current, value, strict=True)]
+            else:
+                values[key] = current + value
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs: str = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def render(merged: dict[str, Any]) -> str:
+    """Prometheus text exposition format 0.0.4"""
+    lines: list[str] = []
+    for name, metric in sorted(merged.items()):
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['kind']}")
+        labelnames: list[str] = metric["labels"]
+
+        for labels, value in sorted(metric["values"].items()):
+            if metric["kind"] != "histogram":
+                label_text: str = _format_labels(labelnames, labels)
+                lines.append(f"{name}{label_text} {_format_number(value)}")
+                continue
+
+            cumulative: float = 0.0
+            bounds: list[str] = [*map(_format_number, metric["buckets"]), "+Inf"]
+            for bound, count in zip(bounds, value[:-2], strict=True):
+                cumulative += count
+                label_text = _format_labels([*labelnames, "le"], [*labels, bound])
+                lines.append(f"{name}_bucket{label_text} {_format_number(cumulative)}")
+            label_text = _format_labels(labelnames, labels)
+            lines.append(f"{name}_sum{label_text} {_format_number(value[-2])}")
+            lines.append(f"{name}_count{label_text} {_format_number(value[-1])}")
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsRegistry:
+    """
+    워커별 메트릭 저장소
+
+    - 기록은 워커 메모리의 dict 갱신만 수행 (잠금, 시스템 호출 없음)
+    - 주기적으로 워커별 스냅숏 파일(<pid>.json)을 원자적으로 교체
+    - 수집 시 모든 워커 파일을 합산, 종료된 워커의 카운터, 히스토그램은 archive.json 에 합쳐 유지
+    """
+
+    def __init__(self, directory: Path = METRICS_DIR) -> None:
+        self.directory = directory
+        self._metrics: dict[str, _Metric] = {}
+        # preload 후 fork 된 워커가 마스터에서 기록된 값을 중복 집계하지 않도록 초기화
+        os.register_at_fork(after_in_child=self.reset)
+
+    def _register[M: _Metric](self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            name: {**metric.describe(), "values": metric.samples()}
+            for name, metric in self._metrics.items()
+        }
+
+    def serialize(self) -> bytes:
+        """기록 중인 dict 를 다른 스레드에서 읽지 않도록 이벤트 루프에서 직렬화"""
+        return orjson.dumps(self.snapshot())
+
+    def _write(self, data: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path: Path = self.directory / f"{os.getpid()}.json"
+        temp: Path = path.with_suffix(".tmp")
+        temp.write_bytes(data)
+        temp.replace(path)
+
+    def write_snapshot(self) -> None:
+        self._write(self.serialize())
+
+    def _read(self, path: Path) -> dict[str, Any]:
+        try:
+            return orjson.loads(path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return {}
+
+    def _collect(self, data: bytes) -> dict[str, Any]:
+        """
+        현재 워커 스냅숏(data) 기록 후 모든 워커의 스냅숏 합산
+
+        파일 잠금을 기다리고 모든 워커 파일을 읽으므로 스레드에서 호출
+        """
+        self._write(data)
+
+        lock_fd: int = os.open(self.directory / ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+            archive_path: Path = self.directory / _ARCHIVE
+            archive: dict[str, Any] = {}
+            _merge(archive, self._read(archive_path), gauges=False)
+
+            live: list[dict[str, Any]] = []
+            dead: list[Path] = []
+            for path in self.directory.glob("*.json"):
+                if path.name == _ARCHIVE:
+                    continue
+                with suppress(ValueError):
+                    if _pid_alive(int(path.stem)):
+                        live.append(self._read(path))
+                    else:
+                        dead.append(path)
+
+            # 종료된 워커 값을 archive 로 옮겨 재시작 후에도 카운터가 줄어들지 않게 함
+            if dead:
+                for path in dead:
+                    _merge(archive, self._read(path), gauges=False)
+                temp: Path = archive_path.with_suffix(".tmp")
+                temp.write_bytes(
+                    orjson.dumps(
+                        {
+                            name: {
+                                **metric,
+                                "values": [
+                                    [list(labels), value]
+                                    for labels, value in metric["values"].items()
+                                ],
+                            }
+                            for name, metric in archive.items()
+                        }
+                    )
+                )
+                temp.replace(archive_path)
+                for path in dead:
+                    path.unlink(missing_ok=True)
+        finally:
+            os.close(lock_fd)
+
+        merged: dict[str, Any] = {}
+        for name, metric in archive.items():
+            merged[name] = {**metric, "values": dict(metric["values"])}
+        for snapshot in live:
+            _merge(merged, snapshot, gauges=True)
+        return merged
+
+    async def collect(self) -> dict[str, Any]:
+        """모든 워커의 스냅숏 합산"""
+        return await to_thread(self._collect, self.serialize())
+
+    def _exposition(self, data: bytes) -> str:
+        return render(self._collect(data))
+
+    async def exposition(self) -> str:
+        return await to_thread(self._exposition, self.serialize())
+
+    async def run_forever(self, interval: float = METRICS_FLUSH_SECONDS) -> None:
+        try:
+            while True:
+                await sleep(interval)
+                await to_thread(self._write, self.serialize())
+        finally:
+            # 종료 시에는 마지막 스냅숏을 바로 기록
+            self.write_snapshot()
+
+
+metrics = MetricsRegistry()
+
+HTTP_REQUESTS = metrics.counter(
+    "http_requests_total", "HTTP requests", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = metrics.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+HTTP_RESPONSE_SIZE = metrics.histogram(
+    "http_response_size_bytes",
+    "HTTP response body size after compression",
+    ("route",),
+    SIZE_BUCKETS,
+)
+HTTP_IN_FLIGHT = metrics.gauge("http_requests_in_flight", "HTTP requests in progress")
+DB_OPERATION_DURATION = metrics.histogram(
+    "db_operation_duration_seconds",
+    "Database command latency",
+    ("database", "operation", "outcome"),
+)
+KDF_DURATION = metrics.histogram(
+    "kdf_duration_seconds",
+    "Password key derivation time waiting in the pool and deriving",
+    ("stage",),
+)
+EVENT_LOOP_LAG = metrics.histogram(
+    "event_loop_lag_seconds", "Delay of the event loop monitor tick past its interval"
+)
+EVENT_LOOP_LAG_RECENT = metrics.gauge(
+    "event_loop_lag_recent_seconds",
+    "Event loop lag percentiles over the recent window per worker",
+    ("worker", "quantile"),
+)
+EVENT_LOOP_BLOCKED = metrics.counter(
+    "event_loop_blocked_total", "Event loop stalls longer than the blocking threshold"
+)
+CACHE_REQUESTS = metrics.counter(
+    "cache_requests_total", "Cache lookups", ("cache", "result")
+)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc((cache, "hit" if hit else "miss"))
+
+
+class MetricsMiddleware:
+    """
+    라우트별 지연 시간, 상태 코드, 응답 크기, 처리 중 요청 수 기록
+
+    라우트 레이블은 경로 템플릿(/api/v1/spirits/{name})을 사용하여 레이블 수를 제한
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int = 500
+        size: int = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        started: float = perf_counter()
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route: Any = scope.get("route")
+            template: str = getattr(route, "path", "unmatched")
+            method: str = scope["method"]
+            HTTP_REQUEST_DURATION.observe((method, template), perf_counter() - started)
+            HTTP_REQUESTS.inc((method, template, str(status_code)))
+            HTTP_RESPONSE_SIZE.observe((template,), size)
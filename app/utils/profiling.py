@@ -0,0 +1,415 @@
+import os
+import random
+from asyncio import sleep, to_thread
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from os import environ
+from pathlib import Path
+from time import time
+from typing import Any
+from urllib.parse import parse_qsl
+
+from dotenv import load_dotenv
+from pyinstrument import Profiler
+from pyinstrument.frame import Frame
+from pyinstrument.renderers import ConsoleRenderer
+from pyinstrument.session import Session
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+load_dotenv()
+
+PROFILE_DIR: Path = Path(environ.get("PROFILE_DIR", "../log/profiles"))
+
+# 요청에서 실행 중인 프로파일러가 종료 시 세션을 넘길 콜백 목록
+_running: ContextVar[list[Callable[[Session], None]] | None] = ContextVar(
+    "running_profiler", default=None
+)
+
+
+@dataclass(frozen=True)
+class ContinuousProfilingPolicy:
+    """
+    상시 프로파일링 정책 (기본 비활성)
+
+    - sample_rate: 프로파일링할 요청 비율, route_rates 로 라우트별 지정 가능
+    - interval: pyinstrument 샘플링 간격
+    - max_concurrent: 워커당 동시에 프로파일링하는 요청 수
+    - rotate_seconds: 집계를 파일로 내보내는 주기
+    - retention_hours: 보관 기간이 지난 파일 삭제
+    """
+
+    enabled: bool = False
+    sample_rate: float = 0.01
+    route_rates: tuple[tuple[str, float], ...] = ()
+    interval: float = 0.001
+    max_concurrent: int = 1
+    rotate_seconds: float = 300.0
+    retention_hours: float = 24.0
+
+    @classmethod
+    def from_env(cls) -> "ContinuousProfilingPolicy":
+        # 예: PROFILE_ROUTE_RATES="/api/v1/spirits/search=0.1,/api/v1/health=0"
+        route_rates: tuple[tuple[str, float], ...] = tuple(
+            (route, float(rate))
+            for route, _, rate in (
+                item.rpartition("=")
+                for item in environ.get("PROFILE_ROUTE_RATES", "").split(",")
+                if item
+            )
+        )
+        return cls(
+            enabled=environ.get("PROFILE_CONTINUOUS", "false").lower() == "true",
+            sample_rate=float(environ.get("PROFILE_SAMPLE_RATE", "0.01")),
+            route_rates=route_rates,
+            interval=float(environ.get("PROFILE_INTERVAL", "0.001")),
+            max_concurrent=int(environ.get("PROFILE_MAX_CONCURRENT", "1")),
+            rotate_seconds=float(environ.get("PROFILE_ROTATE_SECONDS", "300")),
+            retention_hours=float(environ.get("PROFILE_RETENTION_HOURS", "24")),
+        )
+
+
+def route_template(scope: Scope) -> str:
+    """
+    요청의 경로 템플릿 (/api/v1/spirits/{name})
+
+    라우팅 후에는 scope 에 기록된 라우트를 사용하고, 라우팅 전(미들웨어)이면
+    앱 라우터의 라우트와 직접 매칭
+    """
+    route: Any = scope.get("route")
+    if route is None:
+        router: Any = getattr(scope.get("app"), "router", None)
+        for candidate in getattr(router, "routes", ()):
+            if candidate.matches(scope)[0] is Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", "unmatched")
+
+
+@contextmanager
+def shared_profile(
+    interval: float = 0.001, on_stop: Callable[[Session], None] | None = None
+) -> Iterator[None]:
+    """
+    요청 하나에서 pyinstrument 프로파일러를 하나만 실행
+
+    같은 태스크에서 프로파일러를 중첩 실행하면 pyinstrument 가 예외를 내므로, 바깥에서
+    이미 실행 중이면 새로 시작하지 않고 바깥 프로파일러 종료 시 세션을 on_stop 으로 받음
+    """
+    callbacks: list[Callable[[Session], None]] | None = _running.get()
+    if callbacks is not None:
+        if on_stop is not None:
+            callbacks.append(on_stop)
+        yield
+        return
+
+    callbacks = [] if on_stop is None else [on_stop]
+    profiler = Profiler(interval=interval, async_mode="enabled")
+    token = _running.set(callbacks)
+    profiler.start()
+    try:
+        yield
+    finally:
+        session: Session = profiler.stop()
+        _running.reset(token)
+        for callback in callbacks:
+            callback(session)
+
+
+def _frame_name(frame: Frame) -> str:
+    # collapsed stack 형식은 ';' 로 프레임을 구분
+    return f"{frame.function} ({frame.file_path_short})".replace(";", ",")
+
+
+def collapse(session: Session, *, include_await: bool = False) -> Counter[str]:
+    """
+    pyinstrument 세션을 collapsed stack(스택 -> 마이크로초)으로 변환
+
+    기본은 CPU 사용 위치를 보기 위해 await 대기 시간은 제외하고 [self] 시간만 집계,
+    include_await 이면 대기 시간도 `...;[await]` 스택으로 포함
+    """
+    stacks: Counter[str] = Counter()
+    root: Frame | None = session.root_frame()
+    if root is None:
+        return stacks
+
+    def walk(frame: Frame, path: str) -> None:
+        for child in frame.children:
+            if child.is_synthetic_leaf:
+                if child.function == "[self]":
+                    stacks[path] += round(child.time * 1_000_000)
+                elif include_await and child.function == "[await]":
+                    stacks[f"{path};[await]"] += round(child.time * 1_000_000)
+                continue
+            walk(child, f"{path};{_frame_name(child)}")
+
+    walk(root, _frame_name(root))
+    return stacks
+
+
+def to_speedscope(stacks: dict[str, Counter[str]]) -> dict[str, Any]:
+    """라우트별 collapsed stack 을 speedscope sampled 프로파일로 변환"""
+    frames: list[dict[str, str]] = []
+    frame_index: dict[str, int] = {}
+    profiles: list[dict[str, Any]] = []
+
+    for route, route_stacks in sorted(stacks.items()):
+        samples: list[list[int]] = []
+        weights: list[int] = []
+        for stack, weight in route_stacks.items():
+            indexes: list[int] = []
+            for name in stack.split(";"):
+                if name not in frame_index:
+                    frame_index[name] = len(frames)
+                    frames.append({"name": name})
+                indexes.append(frame_index[name])
+            samples.append(indexes)
+            weights.append(weight)
+
+        profiles.append(
+            {
+                "type": "sampled",
+                "name": route,
+                "unit": "microseconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }
+        )
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": frames},
+        "profiles": profiles,
+        "name": "cocktail-maker continuous profile",
+        "exporter": "cocktail-maker",
+    }
+
+
+class ContinuousProfiler:
+    """
+    라우트별 일부 요청을 pyinstrument 로 프로파일링하여 collapsed stack 으로 누적
+
+    - 요청 시작 시점에 경로 템플릿을 직접 매칭하여 라우트별 비율 결정
+    - 주기마다 워커별 파일(<시각>-<pid>.folded)로 내보내며, 각 줄은 `라우트;프레임;... 마이크로초`
+    - .folded 파일은 flamegraph.pl, speedscope 에서 바로 열 수 있음
+    """
+
+    def __init__(
+        self, policy: ContinuousProfilingPolicy, directory: Path = PROFILE_DIR
+    ) -> None:
+        self.policy = policy
+        self.directory = directory
+        self._route_rates: dict[str, float] = dict(policy.route_rates)
+        self._active: int = 0
+        self._stacks: dict[str, Counter[str]] = {}
+
+    def should_profile(self, scope: Scope) -> bool:
+        if not self.policy.enabled or self._active >= self.policy.max_concurrent:
+            return False
+        rate: float = self.policy.sample_rate
+        if self._route_rates:
+            rate = self._route_rates.get(route_template(scope), rate)
+        return random.random() < rate
+
+    @contextmanager
+    def profile(self, scope: Scope) -> Iterator[None]:
+        def record(session: Session) -> None:
+            self.record(route_template(scope), session)
+
+        self._active += 1
+        try:
+            with shared_profile(self.policy.interval, record):
+                yield
+        finally:
+            self._active -= 1
+
+    def record(self, route: str, session: Session) -> None:
+        self._stacks.setdefault(route, Counter()).update(collapse(session))
+
+    def snapshot(self) -> dict[str, Counter[str]]:
+        """이 워커에서 아직 파일로 내보내지 않은 집계"""
+        return {route: Counter(stacks) for route, stacks in self._stacks.items()}
+
+    def take(self) -> dict[str, Counter[str]]:
+        """현재 집계를 꺼내고 초기화, 요청 처리 중인 이벤트 루프에서 호출"""
+        stacks, self._stacks = self._stacks, {}
+        return stacks
+
+    def write(self, stacks: dict[str, Counter[str]]) -> Path | None:
+        """집계를 파일로 내보내고 보관 기간이 지난 파일 삭제"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        cutoff: float = time() - self.policy.retention_hours * 3600
+        for old in self.directory.glob("*.folded"):
+            if old.stat().st_mtime < cutoff:
+                old.unlink(missing_ok=True)
+
+        if not stacks:
+            return None
+
+        path: Path = self.directory / f"{int(time())}-{os.getpid()}.folded"
+        path.write_text(
+            "".join(
+                f"{route};{stack} {weight}\n"
+                for route, route_stacks in stacks.items()
+                for stack, weight in route_stacks.items()
+            )
+        )
+        return path
+
+    def load(
+        self,
+        since: float = 0.0,
+        route: str | None = None,
+        pending: dict[str, Counter[str]] | None = None,
+    ) -> dict[str, Counter[str]]:
+        """since(unix time) 이후 모든 워커가 내보낸 파일과 pending(현재 워커 집계) 합산"""
+        merged: dict[str, Counter[str]] = {}
+
+        if self.directory.exists():
+            for path in self.directory.glob("*.folded"):
+                if path.stat().st_mtime < since:
+                    continue
+                for line in path.read_text().splitlines():
+                    stack, _, weight = line.rpartition(" ")
+                    line_route, _, frames = stack.partition(";")
+                    if route is None or line_route == route:
+                        merged.setdefault(line_route, Counter())[frames] += int(weight)
+
+        for line_route, stacks in (pending or {}).items():
+            if route is None or line_route == route:
+                merged.setdefault(line_route, Counter()).update(stacks)
+        return merged
+
+    async def run_forever(self) -> None:
+        if not self.policy.enabled:
+            return
+        try:
+            while True:
+                await sleep(self.policy.rotate_seconds)
+                await to_thread(self.write, self.take())
+        finally:
+            self.write(self.take())
+
+
+continuous_profiler = ContinuousProfiler(ContinuousProfilingPolicy.from_env())
+
+
+def _print_session(session: Session) -> None:
+    # Console output
+    renderer = ConsoleRenderer(
+        color=True,
+        unicode=True,
+        show_all=False,
+        timeline=True,
+        flat=False,
+        short_mode=True,
+        time="percent_of_total",
+    )
+    print(renderer.render(session))
+
+
+class ProfilingMiddleware:
+    """
+    성능 프로파일링 미들웨어
+
+    쿼리 파라미터 ?profile=true로 요청 시 해당 요청의 성능 프로파일을 HTML로 반환
+
+    Profiler 설정 옵션:
+    - interval (float, 기본값: 0.001): 샘플링 간격 (초)
+      * 작은 값 (0.0001): 높은 정확도, 높은 오버헤드
+      * 큰 값 (0.01): 낮은 오버헤드, 낮은 정확도
+
+    - async_mode (AsyncMode, 기본값: "enabled"): async/await 추적 모드
+      * "enabled": await 지점에서 대기 시간 추적, 실제 코드 실행 시간만 측정 (권장)
+      * "disabled": async/await 지원 없이 모든 실행 추적 (이벤트 루프, 다른 코루틴 포함)
+      * "strict": 현재 async context만 엄격하게 프로파일링, 다른 context는 <out-of-context>로 표시
+
+    - use_timing_thread (bool | None, 기본값: None): 별도 타이밍 스레드 사용 여부
+      * True: 시간 측정 오버헤드가 큰 시스템에서 성능 향상을 위해 별도 스레드 사용
+      * False: 메인 스레드에서 시간 측정
+      * None: pyinstrument가 자동으로 최적 방법 선택
+
+    프로파일링 출력 형식:
+    - output_html(): 대화형 HTML 출력 (웹 브라우저에서 확인, 트리 구조 탐색 가능)
+    - output_text(): 콘솔용 텍스트 출력 (터미널에서 확인, 간단한 텍스트 형태)
+    - write_html(path): HTML 파일로 저장 (파일 시스템에 저장 후 나중에 확인)
+    - open_in_browser(): 웹 브라우저에서 자동 열기 (즉시 시각화된 결과 확인)
+    - print(): 콘솔에 직접 출력 (실시간 결과 확인)
+
+    텍스트 출력 옵션:
+    - unicode: 유니코드 문자 사용 여부 (트리 구조 표시용)
+    - color: 컬러 출력 여부 (터미널 색상 지원 시)
+    - show_all: 모든 함수 표시 여부 (기본적으로 빠른 함수는 숨김)
+    - timeline: 타임라인 뷰 표시 여부 (시간 흐름에 따른 실행 순서)
+    - time: 시간 표시 형식 ("seconds" 또는 "percent_of_total")
+    - flat: 플랫 뷰 표시 여부 (호출 스택 대신 함수별 총 시간)
+    - short_mode: 간단 모드 (요약된 출력)
+
+    상시 프로파일링:
+    - PROFILE_CONTINUOUS=true 이면 ?profile=true 가 없는 요청 중 일부를 ContinuousProfiler 로 누적
+
+    Examples:
+        # 기본 프로파일링 활성화
+        GET /api/v1/health?profile=true
+
+        # 고정밀 프로파일링 (짧은 함수 분석용)
+        profiler = Profiler(interval=0.0001, async_mode="enabled")
+
+        # 저오버헤드 프로파일링 (긴 실행 시간용)
+        profiler = Profiler(interval=0.01, async_mode="disabled")
+
+        # 엄격한 async context 프로파일링
+        profiler = Profiler(interval=0.001, async_mode="strict")
+
+        # 다양한 출력 방식 지원
+        1. HTML로 브라우저에서 확인
+        profiler.open_in_browser()
+
+        2. 파일로 저장
+        profiler.write_html("profile_result.html")
+
+        3. 콘솔에 텍스트로 출력
+        profiler.print(color=True, unicode=True)
+        - 콘솔 출력 옵션
+          * unicode: 유니코드 문자 사용 (트리 구조 표시용)
+          * color: 컬러 출력 (터미널 색상 지원 시)
+          * show_all: 모든 함수 표시 (기본적으로 빠른 함수는 숨김)
+          * timeline: 타임라인 뷰 표시 (시간 흐름에 따른 실행 순서)
+          * time: 시간 표시 형식 ("seconds" 또는 "percent_of_total")
+          * flat: 트리 구조로 호출 스택 표시
+          * short_mode: 간단 모드 (요약된 출력)
+
+        4. 문자열로 가져와서 로그에 기록
+        text_output = profiler.output_text(color=False)
+        logger.info(f"Profile result:\n{text_output}")
+    """
+
+    def __init__(
+        self, app: ASGIApp, profiler: ContinuousProfiler = continuous_profiler
+    ) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        query_string: bytes = scope["query_string"]
+        if b"profile" in query_string and ("profile", "true") in parse_qsl(
+            query_string.decode("latin-1")
+        ):
+            # 느린 요청 수집이 이미 프로파일링 중이면 그 세션을 받아 출력
+            with shared_profile(on_stop=_print_session):
+                await self.app(scope, receive, send)
+        elif self.profiler.should_profile(scope):
+            # PROFILE_CONTINUOUS=true 일 때 일부 요청을 라우트별 flame graph 로 누적
+            with self.profiler.profile(scope):
+                await self.app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
@@ -0,0 +1,135 @@
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from os import environ
+from time import perf_counter
+from typing import Any
+
+from dotenv import load_dotenv
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+load_dotenv()
+
+SERVER_TIMING_ENABLED: bool = (
+    environ.get("SERVER_TIMING_ENABLED", "true").lower() == "true"
+)
+# 헤더에 기록하는 순서
+PHASES: tuple[str, ...] = (
+    "auth",
+    "validation",
+    "db",
+    "image",
+    "serialization",
+)
+# 핸들러가 끝난 시각, 압축 시간 계산에 사용
+_HANDLER_DONE: str = "_handler_done"
+
+_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "server_timing", default=None
+)
+
+
+def record_timing(phase: str, seconds: float) -> None:
+    """진행 중인 요청의 단계별 시간 누적, 비활성이거나 요청 밖이면 무시"""
+    timings: dict[str, float] | None = _timings.get()
+    if timings is not None:
+        timings[phase] = timings.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def server_timing(phase: str) -> Iterator[None]:
+    timings: dict[str, float] | None = _timings.get()
+    if timings is None:
+        yield
+        return
+    started: float = perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + perf_counter() - started
+
+
+def timed[**P, R](
+    phase: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """코루틴 함수 전체를 phase 시간으로 기록하는 데코레이터"""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with server_timing(phase):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def header_value(timings: dict[str, float], total: float) -> str:
+    """`auth;dur=1.2, db;dur=3.4, app;dur=5.0` 형식, 시간은 밀리초"""
+    return ", ".join(
+        [
+            *(
+                f"{phase};dur={timings[phase] * 1000:.1f}"
+                for phase in PHASES
+                if phase in timings
+            ),
+            f"app;dur={total * 1000:.1f}",
+        ]
+    )
+
+
+def handler_finished() -> dict[str, float] | None:
+    """핸들러 완료 시각 기록 후 지금까지의 단계별 시간 반환"""
+    timings: dict[str, float] | None = _timings.get()
+    if timings is not None:
+        timings[_HANDLER_DONE] = perf_counter()
+    return timings
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """본문 직렬화 시간을 serialization 단계로 기록하는 ORJSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        with server_timing("serialization"):
+            return super().render(content)
+
+
+class ServerTimingMiddleware:
+    """
+    요청별 단계 시간 수집을 시작하고 압축 단계 시간을 Server-Timing 헤더에 추가
+
+    단계별 헤더는 CustomHeadersMiddleware 에서 기록하며, 압축은 그 바깥에서 일어나므로
+    압축 미들웨어를 감싸 핸들러 완료부터 응답 시작까지를 compress 로 별도 기록
+    """
+
+    def __init__(self, app: ASGIApp, enabled: bool = SERVER_TIMING_ENABLED) -> None:
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        timings: dict[str, float] = {}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                handler_done: float | None = timings.get(_HANDLER_DONE)
+                if handler_done is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f"compress;dur={(perf_counter() - handler_done) * 1000:.1f}",
+                    )
+            await send(message)
+
+        token = _timings.set(timings)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _timings.reset(token)
@@ -0,0 +1,331 @@
+import fcntl
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from time import time
+
+EMPTY_KEY: int = 0
+_RECORD_HEADER = struct.Struct("<Qd")
+# Bloom filter 세대 슬롯 헤더: 세대 번호 (0 은 미사용 슬롯)
+_GENERATION = struct.Struct("<q")
+
+# 슬라이딩 윈도우 레코드 필드: 현재 윈도우 시작 시각, 현재 윈도우 합계, 이전 윈도우 합계
+WINDOW_START, WINDOW_CURRENT, WINDOW_PREVIOUS = range(3)
+
+
+@lru_cache(maxsize=65536)
+def _key_hash(key: str) -> int:
+    # 0 은 빈 슬롯 표시용이므로 사용하지 않음
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest()) or 1
+
+
+def slide_window(values: list[float], now: float, window: float) -> float:
+    """윈도우를 현재 시각으로 이동하고 현재 윈도우 내 경과 시간 반환"""
+    current_start: float = now - now % window
+
+    if values[WINDOW_START] != current_start:
+        values[WINDOW_PREVIOUS] = (
+            values[WINDOW_CURRENT]
+            if values[WINDOW_START] == current_start - window
+            else 0.0
+        )
+        values[WINDOW_CURRENT] = 0.0
+        values[WINDOW_START] = current_start
+
+    return now - current_start
+
+
+def window_usage(values: list[float], elapsed: float, window: float) -> float:
+    """이전 윈도우 합계를 남은 비율만큼 가중한 슬라이딩 윈도우 사용량 추정"""
+    return values[WINDOW_PREVIOUS] * (1 - elapsed / window) + values[WINDOW_CURRENT]
+
+
+def window_retry_after(
+    values: list[float], elapsed: float, window: float, cost: float, limit: float
+) -> float:
+    """cost 만큼 사용할 수 있게 될 때까지 남은 시간"""
+    previous: float = values[WINDOW_PREVIOUS]
+    current: float = values[WINDOW_CURRENT]
+
+    if current + cost <= limit:
+        # 이전 윈도우 가중치가 줄어들기를 기다림
+        if not previous:
+            return 0.0
+        return max(0.0, window * (1 - (limit - current - cost) / previous) - elapsed)
+
+    # 다음 윈도우로 넘어가 현재 합계의 가중치가 줄어들기를 기다림
+    return window - elapsed + window * (1 - max(0.0, limit - cost) / current)
+
+
+class _SharedFile:
+    """
+    워커 프로세스 간 공유하는 파일 기반 mmap
+
+    preload 후 fork 된 워커가 같은 파일 디스크립터를 공유하면 flock 이 서로를 배제하지 못하므로
+    프로세스마다 파일을 새로 열어 사용
+    """
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+        self._pid: int = 0
+        self._fd: int = -1
+        self._buffer: mmap.mmap | None = None
+
+    def open(self) -> mmap.mmap:
+        if self._buffer is not None and self._pid == os.getpid():
+            return self._buffer
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < self.size:
+                os.ftruncate(self._fd, self.size)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+        self._buffer = mmap.mmap(self._fd, self.size)
+        self._pid = os.getpid()
+        return self._buffer
+
+    def acquire(self) -> mmap.mmap:
+        buffer: mmap.mmap = self.open()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return buffer
+
+    def try_acquire(self) -> mmap.mmap | None:
+        """잠금을 바로 얻지 못하면 기다리지 않고 None 반환"""
+        buffer: mmap.mmap = self.open()
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return None
+        return buffer
+
+    def release(self) -> None:
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @contextmanager
+    def locked(self) -> Iterator[mmap.mmap]:
+        buffer: mmap.mmap = self.acquire()
+        try:
+            yield buffer
+        finally:
+            self.release()
+
+
+class SharedSlotTable:
+    """
+    워커 프로세스 간 공유하는 고정 크기 해시 테이블
+
+    - 레코드: 키 해시(u64), 마지막 갱신 시각, float 필드 N 개
+    - 갱신은 flock 으로 직렬화, 탐색 범위가 모두 차 있으면 가장 오래된 레코드를 교체
+    """
+
+    def __init__(
+        self, path: Path, fields: int, slots: int = 4096, probes: int = 8
+    ) -> None:
+        self.fields = fields
+        self.slots = slots
+        self.probes = probes
+        self._record = struct.Struct(f"<Qd{fields}d")
+        self._file = _SharedFile(path, self._record.size * slots)
+
+    def _locate(self, buffer: mmap.mmap, key_hash: int) -> tuple[int, bool]:
+        """키의 레코드 오프셋과 기존 레코드 여부 반환"""
+        oldest_offset: int = -1
+        oldest_updated: float = float("inf")
+
+        for probe in range(self.probes):
+            offset: int = ((key_hash + probe) % self.slots) * self._record.size
+            stored_key, updated = _RECORD_HEADER.unpack_from(buffer, offset)
+            if stored_key == key_hash:
+                return offset, True
+            if stored_key == EMPTY_KEY:
+                return offset, False
+            if updated < oldest_updated:
+                oldest_offset, oldest_updated = offset, updated
+
+        return oldest_offset, False
+
+    def update[T](self, key: str, updater: Callable[[list[float], float], T]) -> T:
+        """
+        레코드 필드를 잠금 상태에서 갱신
+
+        updater 는 필드 목록(없던 키는 0)과 현재 시각을 받아 목록을 직접 수정하고 결과를 반환
+        """
+        key_hash: int = _key_hash(key)
+        now: float = time()
+
+        # 요청 경로에서 호출되므로 contextmanager 대신 직접 잠금
+        buffer: mmap.mmap = self._file.acquire()
+        try:
+            offset, found = self._locate(buffer, key_hash)
+            values: list[float] = (
+                list(self._record.unpack_from(buffer, offset)[2:])
+                if found
+                else [0.0] * self.fields
+            )
+            result: T = updater(values, now)
+            self._record.pack_into(buffer, offset, key_hash, now, *values)
+        finally:
+            self._file.release()
+
+        return result
+
+    def update_all[T](
+        self, keys: tuple[str, ...], updater: Callable[[list[list[float]], float], T]
+    ) -> T:
+        """여러 레코드를 한 번의 잠금으로 함께 갱신"""
+        buffer: mmap.mmap = self._file.acquire()
+        try:
+            return self._update_all(buffer, keys, updater)
+        finally:
+            self._file.release()
+
+    def try_update_all[T](
+        self, keys: tuple[str, ...], updater: Callable[[list[list[float]], float], T]
+    ) -> T | None:
+        """update_all 과 같으나 다른 워커가 잠금을 보유 중이면 갱신하지 않고 None 반환"""
+        buffer: mmap.mmap | None = self._file.try_acquire()
+        if buffer is None:
+            return None
+        try:
+            return self._update_all(buffer, keys, updater)
+        finally:
+            self._file.release()
+
+    def _update_all[T](
+        self,
+        buffer: mmap.mmap,
+        keys: tuple[str, ...],
+        updater: Callable[[list[list[float]], float], T],
+    ) -> T:
+        key_hashes: list[int] = [_key_hash(key) for key in keys]
+        now: float = time()
+
+        offsets: list[int] = []
+        records: list[list[float]] = []
+        for key_hash in key_hashes:
+            offset, found = self._locate(buffer, key_hash)
+            offsets.append(offset)
+            records.append(
+                list(self._record.unpack_from(buffer, offset)[2:])
+                if found
+                else [0.0] * self.fields
+            )
+
+        result: T = updater(records, now)
+        for key_hash, offset, values in zip(key_hashes, offsets, records, strict=True):
+            self._record.pack_into(buffer, offset, key_hash, now, *values)
+        return result
+
+    def read(self, key: str) -> list[float]:
+        key_hash: int = _key_hash(key)
+        with self._file.locked() as buffer:
+            offset, found = self._locate(buffer, key_hash)
+            if not found:
+                return [0.0] * self.fields
+            return list(self._record.unpack_from(buffer, offset)[2:])
+
+
+class SharedCounters:
+    """워커 프로세스 간 공유하는 이름 있는 u64 카운터"""
+
+    def __init__(self, path: Path, names: tuple[str, ...]) -> None:
+        self.names = names
+        self._index: dict[str, int] = {name: i for i, name in enumerate(names)}
+        self._file = _SharedFile(path, 8 * len(names))
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        offset: int = self._index[name] * 8
+        with self._file.locked() as buffer:
+            (value,) = struct.unpack_from("<Q", buffer, offset)
+            struct.pack_into("<Q", buffer, offset, value + amount)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._file.locked() as buffer:
+            values: tuple[int, ...] = struct.unpack_from(
+                f"<{len(self.names)}Q", buffer, 0
+            )
+        return dict(zip(self.names, values, strict=True))
+
+
+class SharedBloomFilter:
+    """
+    워커 프로세스 간 공유하는 Bloom filter, 만료 시각 구간(세대)별로 돌려 씀
+
+    - 항목은 만료 시각이 속한 세대의 필터에 추가하고 조회도 같은 세대에서만 확인
+    - 세대 슬롯은 링으로 재사용하며, 모든 항목이 만료된 슬롯은 다음 세대가 쓸 때 비움
+      (삭제 없이도 파일이 재시작 후 계속 쌓여 오탐률이 커지지 않음)
+    - generation_seconds 는 항목의 최대 수명 이상, 비트 수는 세대당 항목 수 기준으로 산정
+      (항목 10만 개, 2^20 bits, 해시 7개 기준 오탐률 약 1%)
+    - 비트 설정과 슬롯 초기화는 flock 으로 직렬화, 조회는 잠금 없이 mmap 을 직접 읽음
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        generation_seconds: float,
+        bits: int = 1 << 20,
+        hashes: int = 7,
+        generations: int = 3,
+    ) -> None:
+        self.generation_seconds = generation_seconds
+        self.bits = bits
+        self.hashes = hashes
+        self.generations = generations
+        self._slot_size: int = _GENERATION.size + (bits + 7) // 8
+        self._file = _SharedFile(path, self._slot_size * generations)
+
+    def _generation(self, expires_at: float) -> int:
+        return int(expires_at // self.generation_seconds)
+
+    def _positions(self, item: str) -> list[int]:
+        # 이중 해싱으로 k 개의 비트 위치 생성
+        digest: bytes = blake2b(item.encode(), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8])
+        second: int = int.from_bytes(digest[8:]) | 1
+        return [(first + i * second) % self.bits for i in range(self.hashes)]
+
+    def add(self, item: str, expires_at: float) -> None:
+        """expires_at(unix time) 까지 폐기 상태를 유지할 항목 추가, 이미 만료되었으면 무시"""
+        generation: int = self._generation(expires_at)
+        current: int = self._generation(time())
+        if generation < current:
+            return
+        if generation >= current + self.generations:
+            raise ValueError("expires_at is beyond the Bloom filter generations")
+
+        positions: list[int] = self._positions(item)
+        offset: int = (generation % self.generations) * self._slot_size
+        bits_offset: int = offset + _GENERATION.size
+        with self._file.locked() as buffer:
+            (stored,) = _GENERATION.unpack_from(buffer, offset)
+            if stored != generation:
+                # 이전 세대 항목은 모두 만료되었으므로 비우고 새 세대로 사용
+                buffer[bits_offset : offset + self._slot_size] = bytes(
+                    self._slot_size - _GENERATION.size
+                )
+                _GENERATION.pack_into(buffer, offset, generation)
+            for position in positions:
+                buffer[bits_offset + (position >> 3)] |= 1 << (position & 7)
+
+    def might_contain(self, item: str, expires_at: float) -> bool:
+        generation: int = self._generation(expires_at)
+        offset: int = (generation % self.generations) * self._slot_size
+        buffer: mmap.mmap = self._file.open()
+        (stored,) = _GENERATION.unpack_from(buffer, offset)
+        if stored != generation:
+            return False
+        bits_offset: int = offset + _GENERATION.size
+        return all(
+            buffer[bits_offset + (position >> 3)] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
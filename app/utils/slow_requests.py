@@ -0,0 +1,265 @@
+import os
+import random
+from asyncio import to_thread
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from os import environ
+from pathlib import Path
+from time import monotonic, perf_counter, time, time_ns
+from typing import Any, TypedDict
+
+import orjson
+from dotenv import load_dotenv
+from pyinstrument.session import Session
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .profiling import collapse, route_template, shared_profile
+
+load_dotenv()
+
+SLOW_REQUEST_DIR: Path = Path(environ.get("SLOW_REQUEST_DIR", "../log/slow-requests"))
+
+
+@dataclass(frozen=True)
+class SlowRequestPolicy:
+    """
+    느린 요청 수집 정책
+
+    - threshold_seconds: 느린 요청 기준, route_thresholds 로 라우트별 지정 가능
+    - armed_seconds: 느린 요청이 발생한 라우트의 프로파일링 유지 시간
+    - sample_rate: 프로파일링 중인 라우트에서 프로파일링할 요청 비율
+    - capacity: 보관할 최대 수집 건수 (모든 워커 합산, 오래된 것부터 삭제)
+    - max_commands: 요청별로 기록할 최대 DB 명령 수
+    """
+
+    enabled: bool = True
+    threshold_seconds: float = 1.0
+    route_thresholds: tuple[tuple[str, float], ...] = ()
+    armed_seconds: float = 600.0
+    sample_rate: float = 0.2
+    interval: float = 0.001
+    capacity: int = 200
+    max_commands: int = 100
+
+    @classmethod
+    def from_env(cls) -> "SlowRequestPolicy":
+        # 예: SLOW_REQUEST_ROUTE_THRESHOLDS="/api/v1/spirits=2.5,/api/v1/health=0.1"
+        route_thresholds: tuple[tuple[str, float], ...] = tuple(
+            (route, float(seconds))
+            for route, _, seconds in (
+                item.rpartition("=")
+                for item in environ.get("SLOW_REQUEST_ROUTE_THRESHOLDS", "").split(",")
+                if item
+            )
+        )
+        return cls(
+            enabled=environ.get("SLOW_REQUEST_CAPTURE", "true").lower() == "true",
+            threshold_seconds=float(environ.get("SLOW_REQUEST_SECONDS", "1.0")),
+            route_thresholds=route_thresholds,
+            armed_seconds=float(environ.get("SLOW_REQUEST_ARMED_SECONDS", "600")),
+            sample_rate=float(environ.get("SLOW_REQUEST_SAMPLE_RATE", "0.2")),
+            interval=float(environ.get("SLOW_REQUEST_PROFILE_INTERVAL", "0.001")),
+            capacity=int(environ.get("SLOW_REQUEST_CAPACITY", "200")),
+            max_commands=int(environ.get("SLOW_REQUEST_MAX_COMMANDS", "100")),
+        )
+
+
+class CommandInfo(TypedDict):
+    database: str
+    command: str
+    target: str
+    duration_ms: float
+    status: str
+
+
+class _Commands:
+    """요청 하나에서 실행된 DB 명령, max_commands 를 넘으면 개수만 셈"""
+
+    __slots__ = ("dropped", "items", "limit")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.items: list[CommandInfo] = []
+        self.dropped: int = 0
+
+
+_commands: ContextVar[_Commands | None] = ContextVar(
+    "slow_request_commands", default=None
+)
+
+
+def capturing_commands() -> bool:
+    return _commands.get() is not None
+
+
+def record_command(
+    database: str, command: str, target: str, duration: float, status: str
+) -> None:
+    """진행 중인 요청에 DB 명령 기록, 요청 밖(백그라운드 작업 등)이면 무시"""
+    commands: _Commands | None = _commands.get()
+    if commands is None:
+        return
+    if len(commands.items) >= commands.limit:
+        commands.dropped += 1
+        return
+    commands.items.append(
+        {
+            "database": database,
+            "command": command,
+            "target": target,
+            "duration_ms": round(duration * 1000, 3),
+            "status": status,
+        }
+    )
+
+
+class SlowRequestRecorder:
+    """
+    모든 요청의 처리 시간을 재고 라우트별 기준을 넘으면 DB 명령과 함께 기록
+
+    - 처음 느린 요청이 발생하면 해당 라우트를 armed_seconds 동안 프로파일링 대상으로 지정
+    - 이후 그 라우트의 일부 요청만 pyinstrument 로 프로파일링하여 느린 경우 프로파일 첨부
+    - 수집 결과는 <시각>-<pid>.json 파일로 저장하며 capacity 를 넘으면 오래된 것부터 삭제
+    """
+
+    def __init__(
+        self, policy: SlowRequestPolicy, directory: Path = SLOW_REQUEST_DIR
+    ) -> None:
+        self.policy = policy
+        self.directory = directory
+        self._thresholds: dict[str, float] = dict(policy.route_thresholds)
+        self._armed: dict[str, float] = {}
+        self._profiling: bool = False
+
+    def threshold(self, route: str) -> float:
+        return self._thresholds.get(route, self.policy.threshold_seconds)
+
+    def should_profile(self, route: str) -> bool:
+        """이전에 느렸던 라우트만 일부 프로파일링, 워커당 1 개씩"""
+        if self._profiling:
+            return False
+        armed_until: float | None = self._armed.get(route)
+        if armed_until is None:
+            return False
+        if armed_until < monotonic():
+            del self._armed[route]
+            return False
+        return random.random() < self.policy.sample_rate
+
+    def arm(self, route: str) -> None:
+        self._armed[route] = monotonic() + self.policy.armed_seconds
+
+    @contextmanager
+    def profile(self, scope: Scope) -> Iterator[list[Session]]:
+        """프로파일링 대상이면 종료 후 세션이 담기는 목록 반환"""
+        sessions: list[Session] = []
+        # 라우팅 전이므로 경로 템플릿은 라우터와 직접 매칭, 대상이 있을 때만 계산
+        if not self._armed or not self.should_profile(route_template(scope)):
+            yield sessions
+            return
+        self._profiling = True
+        try:
+            with shared_profile(self.policy.interval, sessions.append):
+                yield sessions
+        finally:
+            self._profiling = False
+
+    @contextmanager
+    def commands(self) -> Iterator[_Commands]:
+        commands = _Commands(self.policy.max_commands)
+        token = _commands.set(commands)
+        try:
+            yield commands
+        finally:
+            _commands.reset(token)
+
+    def store(self, capture: dict[str, Any]) -> Path:
+        """수집 결과 저장 후 capacity 를 넘는 오래된 파일 삭제"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path: Path = self.directory / f"{time_ns()}-{os.getpid()}.json"
+        path.write_bytes(orjson.dumps(capture))
+
+        files: list[Path] = sorted(self.directory.glob("*.json"))
+        for old in files[: max(len(files) - self.policy.capacity, 0)]:
+            old.unlink(missing_ok=True)
+        return path
+
+    def load(self, route: str | None = None, limit: int = 50) -> list[dict[str, Any]]:
+        """모든 워커의 수집 결과를 최신순으로 반환"""
+        if not self.directory.exists():
+            return []
+
+        captures: list[dict[str, Any]] = []
+        for path in sorted(self.directory.glob("*.json"), reverse=True):
+            try:
+                capture: dict[str, Any] = orjson.loads(path.read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                # 다른 워커가 삭제 중이거나 쓰는 중인 파일
+                continue
+            if route is None or capture["route"] == route:
+                captures.append(capture)
+                if len(captures) >= limit:
+                    break
+        return captures
+
+
+slow_requests = SlowRequestRecorder(SlowRequestPolicy.from_env())
+
+
+class SlowRequestMiddleware:
+    """느린 요청 수집 ASGI 미들웨어"""
+
+    def __init__(
+        self, app: ASGIApp, recorder: SlowRequestRecorder = slow_requests
+    ) -> None:
+        self.app = app
+        self.recorder = recorder
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        recorder: SlowRequestRecorder = self.recorder
+        if scope["type"] != "http" or not recorder.policy.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status_code: int = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with (
+            recorder.profile(scope) as sessions,
+            recorder.commands() as commands,
+        ):
+            started: float = perf_counter()
+            await self.app(scope, receive, send_wrapper)
+            elapsed: float = perf_counter() - started
+
+        route: str = route_template(scope)
+        threshold: float = recorder.threshold(route)
+        if elapsed < threshold:
+            return
+
+        recorder.arm(route)
+        capture: dict[str, Any] = {
+            "timestamp": time(),
+            "pid": os.getpid(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route,
+            "status": status_code,
+            "duration_ms": round(elapsed * 1000, 3),
+            "threshold_ms": round(threshold * 1000, 3),
+            "commands": commands.items,
+            "dropped_commands": commands.dropped,
+            # 대기 시간이 원인인 경우가 많아 await 시간도 포함
+            "profile": (
+                collapse(sessions[0], include_await=True) if sessions else None
+            ),
+        }
+        # 응답 전송 후이므로 파일 쓰기만 스레드로 넘김
+        await to_thread(recorder.store, capture)
@@ -0,0 +1,320 @@
+import random
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from os import environ
+from pathlib import Path
+from time import time_ns
+from typing import Any, Literal
+
+import orjson
+from dotenv import load_dotenv
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .logger import log_writer
+from .profiling import route_template
+
+load_dotenv()
+
+SpanKind = Literal["INTERNAL", "SERVER", "CLIENT"]
+
+# OTLP 의 SpanKind, StatusCode 열거값
+_SPAN_KIND: dict[SpanKind, int] = {"INTERNAL": 1, "SERVER": 2, "CLIENT": 3}
+_STATUS_CODE: dict[str, int] = {"UNSET": 0, "OK": 1, "ERROR": 2}
+
+
+@dataclass(frozen=True)
+class TracingPolicy:
+    """
+    트레이싱 정책 (기본 비활성)
+
+    - sample_rate: traceparent 가 없는 요청의 헤드 샘플링 비율,
+      traceparent 가 있으면 상위 서비스의 sampled 플래그를 따름
+    - export_path: OTLP JSON 형식으로 트레이스를 한 줄씩 기록할 파일
+    """
+
+    enabled: bool = False
+    sample_rate: float = 0.1
+    service_name: str = "cocktail-maker"
+    export_path: Path = Path("../log/traces.jsonl")
+
+    @classmethod
+    def from_env(cls) -> "TracingPolicy":
+        return cls(
+            enabled=environ.get("TRACING_ENABLED", "false").lower() == "true",
+            sample_rate=float(environ.get("TRACE_SAMPLE_RATE", "0.1")),
+            service_name=environ.get("TRACE_SERVICE_NAME", "cocktail-maker"),
+            export_path=Path(environ.get("TRACE_EXPORT_PATH", "../log/traces.jsonl")),
+        )
+
+
+def _attribute_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+@dataclass(slots=True)
+class Span:
+    """OpenTelemetry 데이터 모델의 span, 트레이스에 샘플링된 경우에만 생성"""
+
+    trace: "_Trace"
+    name: str
+    span_id: str
+    parent_span_id: str
+    kind: SpanKind = "INTERNAL"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time: int = field(default_factory=time_ns)
+    end_time: int = 0
+    status: str = "UNSET"
+    status_message: str = ""
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "ERROR"
+        self.status_message = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+
+    def to_otlp(self) -> dict[str, Any]:
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND[self.kind],
+            "startTimeUnixNano": str(self.start_time),
+            "endTimeUnixNano": str(self.end_time),
+            "attributes": [
+                {"key": key, "value": _attribute_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {
+                "code": _STATUS_CODE[self.status],
+                "message": self.status_message,
+            },
+        }
+
+
+@dataclass(slots=True)
+class _Trace:
+    """요청 하나의 샘플링된 트레이스, 루트 span 이 끝나면 한 번에 내보냄"""
+
+    trace_id: str
+    spans: list[Span] = field(default_factory=list)
+    exported: bool = False
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(header: str) -> tuple[str, str, bool] | None:
+    """W3C traceparent 에서 (trace_id, parent_span_id, sampled) 추출, 형식이 틀리면 None"""
+    parts: list[str] = header.strip().split("-")
+    if len(parts) != 4:  # noqa: PLR2004
+        return None
+    version, trace_id, span_id, flags = parts
+    if (
+        len(version) != 2  # noqa: PLR2004
+        or version == "ff"
+        or len(trace_id) != 32  # noqa: PLR2004
+        or len(span_id) != 16  # noqa: PLR2004
+        or len(flags) != 2  # noqa: PLR2004
+        or trace_id == "0" * 32
+        or span_id == "0" * 16
+    ):
+        return None
+    try:
+        int(trace_id, 16)
+        int(span_id, 16)
+        sampled: bool = bool(int(flags, 16) & 1)
+    except ValueError:
+        return None
+    return trace_id.lower(), span_id.lower(), sampled
+
+
+class Tracer:
+    """
+    샘플링된 요청 안에서만 span 을 기록하는 트레이서
+
+    - 요청 진입 시 샘플링 여부를 결정하고(헤드 샘플링) 현재 span 을 contextvar 로 전달
+    - 샘플링되지 않은 요청에서는 span 을 만들지 않고 contextvar 조회 1 회로 끝남
+    - 루트 span 이 끝나면 트레이스 전체를 OTLP JSON(resourceSpans) 한 줄로 기록
+    """
+
+    def __init__(self, policy: TracingPolicy) -> None:
+        self.policy = policy
+        self._resource: dict[str, Any] = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": policy.service_name}}
+            ]
+        }
+
+    def start_trace(
+        self, name: str, traceparent: str | None, attributes: dict[str, Any]
+    ) -> Span | None:
+        """요청의 루트 span 시작, 샘플링되지 않으면 None"""
+        parent: tuple[str, str, bool] | None = (
+            parse_traceparent(traceparent) if traceparent else None
+        )
+        if parent is None:
+            if random.random() >= self.policy.sample_rate:
+                return None
+            trace_id, parent_span_id = random.randbytes(16).hex(), ""
+        else:
+            trace_id, parent_span_id, sampled = parent
+            if not sampled:
+                return None
+
+        return Span(
+            _Trace(trace_id),
+            name,
+            random.randbytes(8).hex(),
+            parent_span_id,
+            "SERVER",
+            attributes,
+        )
+
+    def begin(
+        self, name: str, kind: SpanKind = "INTERNAL", **attributes: Any
+    ) -> Span | None:
+        """
+        현재 span 의 하위 span 시작, 현재 span 으로 지정하지는 않음
+
+        드라이버 이벤트처럼 시작과 끝이 다른 콜백인 경우에 사용하며 반드시 end 로 종료
+        """
+        parent: Span | None = _current_span.get()
+        if parent is None:
+            return None
+        return Span(
+            parent.trace,
+            name,
+            random.randbytes(8).hex(),
+            parent.span_id,
+            kind,
+            attributes,
+        )
+
+    def end(self, span: Span, error: BaseException | None = None) -> None:
+        span.end_time = time_ns()
+        if error is not None:
+            span.set_error(error)
+        trace: _Trace = span.trace
+        trace.spans.append(span)
+        if trace.exported:
+            # 루트 span 종료 후 끝난 백그라운드 작업의 span 은 따로 기록
+            self._export([span])
+
+    @contextmanager
+    def span(
+        self, name: str, kind: SpanKind = "INTERNAL", **attributes: Any
+    ) -> Iterator[Span | None]:
+        """하위 span 을 만들고 블록 안에서 현재 span 으로 지정"""
+        span: Span | None = self.begin(name, kind, **attributes)
+        if span is None:
+            yield None
+            return
+
+        token = _current_span.set(span)
+        error: BaseException | None = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end(span, error)
+
+    @contextmanager
+    def activate(self, span: Span) -> Iterator[Span]:
+        """루트 span 을 현재 span 으로 지정하고 블록이 끝나면 트레이스 전체를 내보냄"""
+        token = _current_span.set(span)
+        error: BaseException | None = None
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end(span, error)
+            span.trace.exported = True
+            self._export(span.trace.spans)
+
+    def _export(self, spans: list[Span]) -> None:
+        log_writer(self.policy.export_path).write(
+            orjson.dumps(
+                {
+                    "resourceSpans": [
+                        {
+                            "resource": self._resource,
+                            "scopeSpans": [
+                                {
+                                    "scope": {"name": self.policy.service_name},
+                                    "spans": [span.to_otlp() for span in spans],
+                                }
+                            ],
+                        }
+                    ]
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+
+
+tracer = Tracer(TracingPolicy.from_env())
+
+
+def traceparent(span: Span) -> str:
+    return f"00-{span.trace.trace_id}-{span.span_id}-01"
+
+
+class TracingMiddleware:
+    """요청마다 SERVER span 생성, 샘플링된 요청의 응답에는 traceparent 헤더 추가"""
+
+    def __init__(self, app: ASGIApp, tracer: Tracer = tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.tracer.policy.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        header: str | None = None
+        for key, value in scope["headers"]:
+            if key == b"traceparent":
+                header = value.decode("latin-1")
+                break
+
+        root: Span | None = self.tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            header,
+            {"http.request.method": scope["method"], "url.path": scope["path"]},
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.attributes["http.response.status_code"] = message["status"]
+                if message["status"] >= 500:  # noqa: PLR2004
+                    root.status = "ERROR"
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"traceparent", traceparent(root).encode()),
+                ]
+            await send(message)
+
+        with self.tracer.activate(root):
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route: str = route_template(scope)
+                root.name = f"{scope['method']} {route}"
+                root.attributes["http.route"] = route
@@ -0,0 +1,102 @@
+"""
+검색 결과 크기 응답의 압축 비용 측정 (매번 압축 vs 압축 결과 캐시)
+
+사용법 (app 디렉터리에서 실행):
+    python ../benchmarks/compression.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, str(Path.cwd()))
+
+import orjson
+from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette_compress import CompressMiddleware
+
+from utils.compression import CompressionMiddleware, CompressionPolicy
+
+NUMBER: int = 2_000
+# 검색 결과 한 페이지와 비슷한 크기의 JSON
+PAGE: bytes = orjson.dumps(
+    {
+        "code": 200,
+        "data": {
+            "total": 1000,
+            "items": [
+                {"name": f"spirit-{i}", "abv": 40.0, "origin": "Scotland"}
+                for i in range(100)
+            ],
+        },
+    }
+)
+TINY: bytes = orjson.dumps({"code": 200, "data": {"status": "ok"}})
+
+
+def endpoint(body: bytes) -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+async def best_us(app: ASGIApp, encoding: bytes) -> float:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/spirits",
+        "query_string": b"name=whisky",
+        "headers": [(b"accept-encoding", encoding)],
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_: dict[str, Any]) -> None:
+        return None
+
+    best: float = float("inf")
+    for _ in range(5):
+        started: float = perf_counter()
+        for _ in range(NUMBER):
+            await app(dict(scope), receive, send)
+        best = min(best, perf_counter() - started)
+    return best / NUMBER * 1_000_000
+
+
+async def main() -> None:
+    print(f"page {len(PAGE)} bytes, tiny {len(TINY)} bytes")
+    for encoding in (b"zstd", b"br", b"gzip"):
+        for name, body in (("page", PAGE), ("tiny", TINY)):
+            before: float = await best_us(
+                CompressMiddleware(
+                    endpoint(body),
+                    minimum_size=1,
+                    zstd_level=4,
+                    brotli_quality=4,
+                    gzip_level=6,
+                ),
+                encoding,
+            )
+            after: float = await best_us(
+                CompressionMiddleware(endpoint(body), policy=CompressionPolicy()),
+                encoding,
+            )
+            print(
+                f"{encoding.decode():>4} {name}: "
+                f"every request {before:7.2f} us, policy+cache {after:7.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
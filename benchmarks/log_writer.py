@@ -0,0 +1,65 @@
+"""
+로그 기록 처리량 측정 (이벤트마다 open + flock 하던 방식과 배치 기록 비교)
+
+사용법 (app 디렉터리에서 실행):
+    python ../benchmarks/log_writer.py
+"""
+
+import fcntl
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+sys.path.insert(0, str(Path.cwd()))
+
+import orjson
+
+from utils.logger import LogWriter
+
+NUMBER: int = 50_000
+LOG: dict[str, object] = {
+    "timestamp": "2025-01-01 00:00:00",
+    "level": "error",
+    "event": "HTTP exception occurred",
+    "details": {"status_code": 404, "path": "/api/v1/spirits/unknown"},
+}
+
+
+def write_per_event(path: Path) -> None:
+    """배치 기록 도입 전 Logger._format_and_write 의 파일 기록"""
+    with open(path, "ab") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+        f.write(orjson.dumps(LOG))
+        f.write(b"\n")
+
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        before_path = Path(directory) / "before.jsonl"
+        started: float = perf_counter()
+        for _ in range(NUMBER):
+            write_per_event(before_path)
+        before: float = perf_counter() - started
+
+        writer = LogWriter(Path(directory) / "after.jsonl", queue_size=NUMBER)
+        started = perf_counter()
+        for _ in range(NUMBER):
+            writer.write(orjson.dumps(LOG, option=orjson.OPT_APPEND_NEWLINE))
+        enqueued: float = perf_counter() - started
+        writer.flush(timeout=None)
+        after: float = perf_counter() - started
+
+        stats: dict[str, int] = writer.stats()
+
+    print(f"before (open + flock per event): {NUMBER / before:10,.0f} events/s")
+    print(f"after  (caller, enqueue only)  : {NUMBER / enqueued:10,.0f} events/s")
+    print(f"after  (until flushed to disk) : {NUMBER / after:10,.0f} events/s")
+    print(f"batches: {stats['batches']}, dropped: {stats['dropped']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+요청당 메트릭 기록 오버헤드 측정 (MetricsMiddleware 유무 비교)
+
+사용법 (app 디렉터리에서 실행):
+    python ../benchmarks/metrics.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, str(Path.cwd()))
+
+from starlette.types import Receive, Scope, Send
+
+from utils.metrics import MetricsMiddleware
+
+NUMBER: int = 100_000
+
+
+class Route:
+    path: str = "/api/v1/spirits/{name}"
+
+
+async def endpoint(scope: Scope, _: Receive, send: Send) -> None:
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"name":"gin"}'})
+
+
+async def best_us(app: Any) -> float:
+    scope: dict[str, Any] = {"type": "http", "method": "GET", "path": "/"}
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b""}
+
+    async def send(_: dict[str, Any]) -> None:
+        return None
+
+    best: float = float("inf")
+    for _ in range(5):
+        started: float = perf_counter()
+        for _ in range(NUMBER):
+            await app(dict(scope), receive, send)
+        best = min(best, perf_counter() - started)
+    return best / NUMBER * 1_000_000
+
+
+async def main() -> None:
+    before: float = await best_us(endpoint)
+    after: float = await best_us(MetricsMiddleware(endpoint))
+
+    print(f"without metrics: {before:6.2f} us/request")
+    print(f"with metrics   : {after:6.2f} us/request")
+    print(f"overhead       : {after - before:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
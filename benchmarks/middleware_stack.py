@@ -0,0 +1,70 @@
+"""
+전체 미들웨어 스택의 요청당 오버헤드 측정 (라우터 직접 호출과 비교)
+
+사용법 (app 디렉터리에서 실행):
+    python ../benchmarks/middleware_stack.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, str(Path.cwd()))
+
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from starlette.types import ASGIApp
+
+from main import cocktail_maker
+
+NUMBER: int = 5_000
+
+
+async def best_us(app: ASGIApp) -> float:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/health",
+        "raw_path": b"/api/v1/health",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"localhost"),
+            (b"accept-encoding", b"gzip, br, zstd"),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+        "app": cocktail_maker,
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_: dict[str, Any]) -> None:
+        return None
+
+    best: float = float("inf")
+    for _ in range(5):
+        started: float = perf_counter()
+        for _ in range(NUMBER):
+            await app(dict(scope), receive, send)
+        best = min(best, perf_counter() - started)
+    return best / NUMBER * 1_000_000
+
+
+async def main() -> None:
+    # FastAPI 가 항상 추가하는 최소 구성
+    router: float = await best_us(AsyncExitStackMiddleware(cocktail_maker.router))
+    stack: float = await best_us(cocktail_maker)
+
+    print(f"router only      : {router:7.2f} us/request")
+    print(f"middleware stack : {stack:7.2f} us/request")
+    print(f"overhead         : {stack - router:7.2f} us/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
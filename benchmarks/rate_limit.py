@@ -0,0 +1,37 @@
+"""
+API 키 요청 제한의 요청당 오버헤드 측정
+
+사용법 (app 디렉터리에서 실행):
+    python ../benchmarks/rate_limit.py
+"""
+
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import repeat
+
+sys.path.insert(0, str(Path.cwd()))
+
+from auth.rate_limit import APIRateLimiter, RateLimitPolicy
+
+NUMBER: int = 50_000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory:
+        limiter = APIRateLimiter(
+            RateLimitPolicy(key_limit=10**12, route_limit=10**12),
+            Path(directory) / "rate-limit",
+        )
+        keys: list[str] = [f"key-{i}" for i in range(100)]
+
+        def take() -> None:
+            for key in keys:
+                limiter.try_take(key, "spirits", 5)
+
+        best: float = min(repeat(take, number=NUMBER // len(keys), repeat=5))
+        print(f"rate limit check: {best / NUMBER * 1_000_000:6.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+카탈로그 라우트에서 SuperTokens 미들웨어 전역 적용과 /auth 마운트의 요청당 오버헤드 비교
+
+사용법 (app 디렉터리에서 실행, .env 의 SUPERTOKEN_API_KEY 사용):
+    python ../benchmarks/supertokens_middleware.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+sys.path.insert(0, str(Path.cwd()))
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp
+from supertokens_python.framework.fastapi import get_middleware
+
+from auth.supertokens import SUPERTOKENS_BASE_PATH, supertokens_app
+
+NUMBER: int = 20_000
+
+
+def catalog_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/spirits/{name}")
+    async def spirits(name: str) -> dict[str, str]:
+        return {"name": name}
+
+    return app
+
+
+async def best_us(app: ASGIApp) -> float:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/spirits/gin",
+        "raw_path": b"/api/v1/spirits/gin",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_: dict[str, Any]) -> None:
+        return None
+
+    best: float = float("inf")
+    for _ in range(5):
+        started: float = perf_counter()
+        for _ in range(NUMBER):
+            await app(dict(scope), receive, send)
+        best = min(best, perf_counter() - started)
+    return best / NUMBER * 1_000_000
+
+
+async def main() -> None:
+    # 전역 미들웨어 비교를 위해 SDK 초기화
+    supertokens_app._build()
+
+    mounted = catalog_app()
+    mounted.mount(SUPERTOKENS_BASE_PATH, supertokens_app)
+
+    global_middleware = catalog_app()
+    global_middleware.add_middleware(get_middleware())
+
+    before: float = await best_us(global_middleware)
+    after: float = await best_us(mounted)
+
+    print(f"before (global middleware): {before:8.2f} us/request")
+    print(f"after  (mounted on /auth) : {after:8.2f} us/request")
+    print(f"removed per catalog request: {before - after:8.2f} us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
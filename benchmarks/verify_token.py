@@ -0,0 +1,64 @@
+"""
+VerifyToken 요청당 인증 오버헤드 측정 (캐시 도입 전후 비교)
+
+사용법 (app 디렉터리에서 실행, .env 의 SECRET_KEY, SECRET_ALGORITHM 사용):
+    python ../benchmarks/verify_token.py
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+from timeit import repeat
+from typing import Any
+
+sys.path.insert(0, str(Path.cwd()))
+
+import jwt
+from fastapi.security import HTTPAuthorizationCredentials
+
+from auth.jwt import ALGORITHM, SECRET_KEY, PublishToken, VerifyToken
+from auth.roles import check_roles
+from utils import datetime_now, unix_to_datetime
+
+NUMBER: int = 20_000
+
+
+def verify_without_cache(token: str, required_roles: list[str]) -> None:
+    """캐시 도입 전 VerifyToken.verify 와 동일한 검증 절차"""
+    payload: dict[str, Any] = jwt.decode(
+        token, SECRET_KEY, ALGORITHM, audience="cocktail-maker.co.kr"
+    )
+    now: datetime = datetime_now()
+    if unix_to_datetime(payload["exp"]) <= now:
+        raise jwt.InvalidTokenError("Token has expired")
+    if unix_to_datetime(payload["nbf"]) > now:
+        raise jwt.InvalidTokenError("Token is not yet valid")
+    if unix_to_datetime(payload["iat"]) > now:
+        raise jwt.InvalidTokenError("Token issued in the future")
+    if payload["iss"] != "cocktail-maker.co.kr/api":
+        raise jwt.InvalidTokenError("Invalid issuer")
+    if payload["type"] != "access":
+        raise jwt.InvalidTokenError("Invalid token type")
+    if not check_roles(payload["roles"], required_roles):
+        raise PermissionError
+
+
+def best_us(statement: Any) -> float:
+    return min(repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1_000_000
+
+
+def main() -> None:
+    token: str = PublishToken.sign_in_token("benchuser", ["user"])["accessToken"]
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    verify = VerifyToken()(["admin", "user"])
+
+    before: float = best_us(lambda: verify_without_cache(token, ["admin", "user"]))
+    after: float = best_us(lambda: verify(credentials))
+
+    print(f"before (decode every request): {before:8.2f} us/request")
+    print(f"after  (verified-token cache): {after:8.2f} us/request")
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
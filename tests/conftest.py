@@ -1,9 +1,31 @@
-from os import chdir
+from os import chdir, environ
 from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
 
 # change directory to app directory
 chdir(Path(__file__).parent.parent / "app")
 
+# 테스트 중 생성되는 공유 상태 파일과 수집 결과는 작업 트리 대신 임시 디렉터리에 기록
+RUNTIME_DIR: Path = Path(mkdtemp(prefix="cocktail-maker-test-"))
+environ.update(
+    {
+        "SLOW_REQUEST_DIR": str(RUNTIME_DIR / "slow-requests"),
+        "PROFILE_DIR": str(RUNTIME_DIR / "profiles"),
+        "TRACE_EXPORT_PATH": str(RUNTIME_DIR / "traces.jsonl"),
+        "METRICS_DIR": str(RUNTIME_DIR / ".metrics"),
+        "LOGIN_THROTTLE_PATH": str(RUNTIME_DIR / ".login-throttle"),
+        "RATE_LIMIT_PATH": str(RUNTIME_DIR / ".rate-limit"),
+        "ROLE_VERSIONS_PATH": str(RUNTIME_DIR / ".role-versions"),
+        "REVOCATION_BLOOM_PATH": str(RUNTIME_DIR / ".revoked-refresh-tokens"),
+        "IMAGE_GC_LOCK_PATH": str(RUNTIME_DIR / ".image-gc.lock"),
+    }
+)
+
 from main import cocktail_maker  # noqa: E402 # type: ignore[import]
 
 api_service = cocktail_maker
+
+
+def pytest_sessionfinish() -> None:
+    rmtree(RUNTIME_DIR, ignore_errors=True)
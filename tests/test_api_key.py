@@ -0,0 +1,92 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from auth.api_key import (  # type: ignore[import]
+    APIKeyStore,
+    APIKeyUsage,
+    VerifyAPIKey,
+    key_index,
+)
+from auth.public_api import hex_setting  # type: ignore[import]
+from model import ApiKeyPublish  # type: ignore[import]
+
+UNAUTHORIZED = 401
+
+
+def _mock_conn(collection: AsyncMock):  # noqa: ANN202
+    @asynccontextmanager
+    async def conn(_: str):  # noqa: ANN202
+        yield collection
+
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_registered_key_verifies_with_single_cached_lookup() -> None:
+    """Test that only the HMAC index is stored and repeat lookups hit the cache"""
+    collection = AsyncMock()
+    store = APIKeyStore()
+    api_key = "sk-cm-example"
+
+    with patch("auth.api_key.mongodb_conn", _mock_conn(collection)):
+        await store.register(api_key, ApiKeyPublish(domain="bar.kr", purpose="menu"))
+        stored = collection.insert_one.await_args.args[0]
+        assert api_key not in stored.values()
+        assert stored["key_hash"] == key_index(api_key)
+
+        collection.find_one.return_value = {"domain": "bar.kr", "purpose": "menu"}
+        first = await store.lookup(key_index(api_key))
+        second = await store.lookup(key_index(api_key))
+
+    assert first == second
+    assert first is not None
+    assert first.domain == "bar.kr"
+    collection.find_one.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_or_malformed_key_is_rejected() -> None:
+    """Test that keys without the prefix or without a stored index get 401"""
+    verify = VerifyAPIKey()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await verify("not-a-key")
+    assert exc_info.value.status_code == UNAUTHORIZED
+
+    with (
+        patch("auth.api_key.api_key_store.lookup", AsyncMock(return_value=None)),
+        pytest.raises(HTTPException),
+    ):
+        await verify("sk-cm-unknown")
+
+
+@pytest.mark.asyncio
+async def test_usage_is_flushed_as_one_batched_write() -> None:
+    """Test that many requests become a single bulk_write with summed counts"""
+    collection = AsyncMock()
+    usage = APIKeyUsage()
+    for _ in range(5):
+        usage.record("key-a")
+    usage.record("key-b")
+
+    with patch("auth.api_key.mongodb_conn", _mock_conn(collection)):
+        assert await usage.flush() == 2  # noqa: PLR2004
+        assert await usage.flush() == 0
+
+    collection.bulk_write.assert_awaited_once()
+    operations = collection.bulk_write.await_args.args[0]
+    increments = {
+        op._filter["key_hash"]: op._doc["$inc"]["usage_count"] for op in operations
+    }
+    assert increments == {"key-a": 5, "key-b": 1}
+
+
+def test_invalid_master_key_reports_setting_name() -> None:
+    """Test that a missing or non-hex key fails with a configuration error on use"""
+    assert hex_setting("PUBLIC_API_MASTER_KEY", "0a0b") == b"\x0a\x0b"
+    for value in ("", "not-hex"):
+        with pytest.raises(RuntimeError, match="PUBLIC_API_MASTER_KEY"):
+            hex_setting("PUBLIC_API_MASTER_KEY", value)
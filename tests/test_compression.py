@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.testclient import TestClient
+
+from utils.compression import (  # type: ignore[import]
+    CompressedCache,
+    CompressionMiddleware,
+    CompressionPolicy,
+)
+
+ZSTD: dict[str, str] = {"Accept-Encoding": "zstd"}
+
+
+def _client(policy: CompressionPolicy) -> tuple[TestClient, CompressionMiddleware]:
+    app = FastAPI()
+    page: list[dict[str, str]] = [{"name": f"spirit-{i}"} for i in range(200)]
+
+    @app.get("/search")
+    async def search() -> ORJSONResponse:
+        return ORJSONResponse(page)
+
+    @app.get("/tiny")
+    async def tiny() -> ORJSONResponse:
+        return ORJSONResponse({"ok": True})
+
+    @app.get("/font")
+    async def font() -> Response:
+        return Response(b"\0" * 4096, media_type="font/x-woff")
+
+    app.add_middleware(CompressionMiddleware, policy=policy)
+    client = TestClient(app)
+    client.get("/tiny")  # 미들웨어 스택 생성
+    middleware = app.middleware_stack
+    while not isinstance(middleware, CompressionMiddleware):
+        middleware = middleware.app  # type: ignore[union-attr]
+    return client, middleware
+
+
+def test_small_and_denied_bodies_are_not_compressed() -> None:
+    """Test that the size threshold and deny list skip compression"""
+    client, _ = _client(CompressionPolicy(minimum_size=100))
+
+    tiny = client.get("/tiny", headers=ZSTD)
+    font = client.get("/font", headers=ZSTD)
+    search = client.get("/search", headers=ZSTD)
+
+    assert "content-encoding" not in tiny.headers
+    assert "content-encoding" not in font.headers
+    assert search.headers["content-encoding"] == "zstd"
+
+
+def test_hot_page_is_compressed_once_per_encoding() -> None:
+    """Test that repeated GETs reuse the cached compressed body"""
+    client, middleware = _client(CompressionPolicy(minimum_size=100))
+    responder = middleware.compress._zstd
+
+    with patch.object(responder, "oneshot", wraps=responder.oneshot) as oneshot:
+        responses = [client.get("/search", headers=ZSTD) for _ in range(3)]
+
+    assert oneshot.call_count == 1
+    assert len(middleware.cache) == 1
+    assert len({r.headers["etag"] for r in responses}) == 1
+    assert all(r.headers["content-encoding"] == "zstd" for r in responses)
+    assert responses[2].json() == responses[0].json()
+
+    gzip = client.get("/search", headers={"Accept-Encoding": "gzip"})
+    assert gzip.headers["content-encoding"] == "gzip"
+    assert gzip.json() == responses[0].json()
+    assert len(middleware.cache) == 2  # noqa: PLR2004
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    """Test that the byte budget evicts the least recently used body"""
+    cache = CompressedCache(max_entries=10, max_bytes=10)
+    cache.put(("/a", "1", "br"), b"aaaa")
+    cache.put(("/b", "1", "br"), b"bbbb")
+    assert cache.get(("/a", "1", "br")) == b"aaaa"
+
+    cache.put(("/c", "1", "br"), b"cccc")
+
+    assert cache.get(("/b", "1", "br")) is None
+    assert cache.get(("/a", "1", "br")) == b"aaaa"
+    assert cache.size == 8  # noqa: PLR2004
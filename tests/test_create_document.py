@@ -0,0 +1,80 @@
+import io
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId
+from PIL import Image
+
+from query.queries import CreateIngredient  # type: ignore[import]
+
+
+def _mock_conn(collection: AsyncMock):  # noqa: ANN202
+    @asynccontextmanager
+    async def conn(_: str):  # noqa: ANN202
+        yield collection
+
+    return conn
+
+
+def _png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_create_document_single_insert_with_image_paths() -> None:
+    """Test that the document is inserted once with a client-side id and image paths"""
+    collection = AsyncMock()
+    item = {
+        "name": "토닉워터",
+        "brand": ["fever-tree"],
+        "kind": "soda",
+        "description": "test",
+        "created_at": datetime.now(tz=UTC),
+    }
+
+    with (
+        patch("query.query_parents.mongodb_conn", _mock_conn(collection)),
+        patch(
+            "query.query_child.Images.write_image_files", new_callable=AsyncMock
+        ) as mock_write,
+    ):
+        document_id = await CreateIngredient(item, _png_bytes()).save()  # type: ignore[arg-type]
+
+    collection.insert_one.assert_awaited_once()
+    collection.update_one.assert_not_called()
+
+    inserted = collection.insert_one.await_args.args[0]
+    assert inserted["_id"] == ObjectId(document_id)
+    assert inserted["main_image"] == f"ingredient/{document_id}/main_image.webp"
+    assert inserted["image_info"]["main_image"]["content_type"] == "image/webp"
+    assert "sub_image_1" not in inserted
+
+    mock_write.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_document_removed_when_image_write_fails() -> None:
+    """Test that the inserted document is removed when image persistence fails"""
+    collection = AsyncMock()
+    storage = AsyncMock()
+    item = {"name": "토닉워터", "created_at": datetime.now(tz=UTC)}
+
+    with (
+        patch("query.query_parents.mongodb_conn", _mock_conn(collection)),
+        patch("query.query_parents.get_image_storage", return_value=storage),
+        patch(
+            "query.query_child.Images.write_image_files",
+            new_callable=AsyncMock,
+            side_effect=OSError("disk full"),
+        ),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        await CreateIngredient(item, _png_bytes()).save()  # type: ignore[arg-type]
+
+    inserted = collection.insert_one.await_args.args[0]
+    collection.delete_one.assert_awaited_once_with({"_id": inserted["_id"]})
+    storage.delete_prefix.assert_awaited_once_with(f"ingredient/{inserted['_id']}/")
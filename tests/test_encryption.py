@@ -1,8 +1,18 @@
+import asyncio
 from base64 import urlsafe_b64decode
 
 import pytest
+from fastapi import HTTPException, status
 
-from auth.encryption import Encryption  # type: ignore[import]
+from auth.calibrate import calibrate  # type: ignore[import]
+from auth.encryption import (  # type: ignore[import]
+    Encryption,
+    KDFParams,
+    KeyDerivationPool,
+)
+
+LEGACY_KEY_LENGTH = 32
+MIN_ITERATIONS = 20_000
 
 
 class TestEncryption:
@@ -146,3 +156,64 @@ class TestEncryption:
         """Test passwords with non-bytes salt."""
         with pytest.raises(TypeError):
             Encryption.passwords("test_password", "not_bytes")
+
+
+class TestKeyDerivationPool:
+    @pytest.mark.asyncio
+    async def test_passwords_async_matches_sync(self) -> None:
+        """Test that offloaded key derivation returns the same hash."""
+        salt = b"j" * Encryption.SALT_LENGTH
+
+        result = await Encryption.passwords_async("test_password", salt)
+
+        assert result == Encryption.passwords("test_password", salt)
+
+    @pytest.mark.asyncio
+    async def test_pool_rejects_when_saturated(self) -> None:
+        """Test that requests beyond max_pending are rejected instead of queued."""
+        pool = KeyDerivationPool(max_workers=1, max_pending=1)
+        salt = b"k" * Encryption.SALT_LENGTH
+
+        first = asyncio.create_task(pool.run(Encryption.passwords, "password", salt))
+        await asyncio.sleep(0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(Encryption.passwords, "password", salt)
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+
+        await first
+        stats = pool.stats()
+        assert (stats.completed, stats.rejected, stats.in_flight) == (1, 1, 0)
+
+
+class TestKDFParams:
+    def test_legacy_users_use_baseline_params(self) -> None:
+        """Test that users without stored params verify with the original scheme."""
+        salt = b"l" * Encryption.SALT_LENGTH
+        legacy = KDFParams.from_document(None)
+
+        assert legacy == KDFParams(
+            "pbkdf2-sha3-256", Encryption.ITERATIONS, LEGACY_KEY_LENGTH
+        )
+        assert Encryption.passwords("pw", salt, legacy) == Encryption.passwords(
+            "pw", salt
+        )
+
+    def test_params_roundtrip_and_change_hash(self) -> None:
+        """Test that stored params are restored and alter the derived key."""
+        salt = b"m" * Encryption.SALT_LENGTH
+        params = KDFParams("pbkdf2-sha256", 1_000)
+
+        assert KDFParams.from_document(params.to_document()) == params
+        assert Encryption.needs_rehash(params)
+        assert (
+            Encryption.passwords("pw", salt, params)["encrypted_password"]
+            != Encryption.passwords("pw", salt)["encrypted_password"]
+        )
+
+    def test_calibrate_respects_minimum_iterations(self) -> None:
+        """Test that calibration never goes below the configured floor."""
+        result = calibrate(target_ms=0.001, min_iterations=MIN_ITERATIONS)
+
+        assert result.params.iterations == MIN_ITERATIONS
+        assert result.measured_ms > 0
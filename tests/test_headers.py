@@ -0,0 +1,36 @@
+from collections.abc import AsyncIterator
+
+from fastapi import FastAPI, status
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from conftest import api_service
+from utils.headers import CustomHeadersMiddleware  # type: ignore[import]
+
+
+def test_streaming_response_keeps_chunks_and_gets_headers() -> None:
+    """Test that custom headers are added without buffering a streaming body"""
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            for index in range(3):
+                yield f"chunk-{index};".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(CustomHeadersMiddleware, headers=[("X-Server-Version", "1.0")])
+
+    with TestClient(app).stream("GET", "/stream") as response:
+        assert response.headers["x-server-version"] == "1.0"
+        assert b"".join(response.iter_bytes()) == b"chunk-0;chunk-1;chunk-2;"
+
+
+def test_profile_query_returns_regular_response() -> None:
+    """Test that ?profile=true still returns the endpoint response"""
+    response = TestClient(api_service).get("/api/v1/health?profile=true")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"status": "ok"}
+    assert response.headers["x-server-version"] == api_service.version
@@ -0,0 +1,45 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from conftest import api_service
+from query import health  # type: ignore[import]
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_makes_service_unready() -> None:
+    """Test that a failing Mongo ping is cached and reported as not ready"""
+    probe = health.ReadinessProbe(interval=10)
+    assert probe.report()[0] is False
+
+    with patch.object(
+        probe, "_mongodb", AsyncMock(side_effect=ConnectionError("refused"))
+    ):
+        checks = await probe.probe()
+
+    assert checks["mongodb"]["ok"] is False
+    assert "refused" in checks["mongodb"]["error"]
+    assert checks["sqlite"]["ok"] is True
+
+    ready, report = probe.report()
+    assert ready is False
+    assert report["checks"]["mongodb"]["ok"] is False
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_serves_cached_probe() -> None:
+    """Test that polling /ready does not ping Mongo again"""
+    ping = AsyncMock(return_value={})
+    with (
+        patch.object(health.readiness, "_mongodb", ping),
+        patch.object(health.readiness, "_storage", AsyncMock(return_value={})),
+    ):
+        await health.readiness.probe()
+        client = TestClient(api_service)
+        responses = [client.get("/api/v1/ready") for _ in range(3)]
+
+    assert ping.await_count == 1
+    assert all(r.status_code == status.HTTP_200_OK for r in responses)
+    assert responses[0].json()["data"]["checks"]["mongodb"]["ok"] is True
@@ -0,0 +1,62 @@
+import base64
+import io
+
+from PIL import Image
+
+from utils import ImageStoragePolicy, encode_image  # type: ignore[import]
+from utils.images import PLACEHOLDER_DIMENSION  # type: ignore[import]
+
+EXIF_ORIENTATION = 0x0112
+ROTATE_90_CW = 6
+
+
+def _encode_source(image: Image.Image, image_format: str, **options: object) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **options)
+    return buffer.getvalue()
+
+
+def test_photo_is_resized_rotated_and_stripped() -> None:
+    """Test that JPEG uploads get EXIF orientation applied, capped and stripped"""
+    exif = Image.Exif()
+    exif[EXIF_ORIENTATION] = ROTATE_90_CW
+    source = _encode_source(
+        Image.new("RGB", (400, 200), "blue"), "JPEG", exif=exif.tobytes()
+    )
+
+    encoded = encode_image(source, ImageStoragePolicy(max_dimension=100))
+
+    assert encoded.content_type == "image/jpeg"
+    assert (encoded.width, encoded.height) == (50, 100)
+    with Image.open(io.BytesIO(encoded.data)) as stored:
+        assert stored.size == (50, 100)
+        assert EXIF_ORIENTATION not in stored.getexif()
+
+
+def test_graphic_is_stored_as_lossless_webp() -> None:
+    """Test that PNG uploads are re-encoded as lossless WebP keeping alpha"""
+    source = _encode_source(Image.new("RGBA", (64, 64), (255, 0, 0, 128)), "PNG")
+
+    encoded = encode_image(source, ImageStoragePolicy())
+
+    assert encoded.content_type == "image/webp"
+    assert encoded.extension == "webp"
+    assert encoded.original_size == len(source)
+    with Image.open(io.BytesIO(encoded.data)) as stored:
+        assert stored.mode == "RGBA"
+        assert stored.getpixel((0, 0)) == (255, 0, 0, 128)
+
+
+def test_placeholder_and_dominant_color() -> None:
+    """Test that a tiny inline placeholder and the dominant color are computed"""
+    image = Image.new("RGB", (300, 200), (200, 30, 30))
+    image.paste((0, 0, 255), (0, 0, 30, 30))
+    source = _encode_source(image, "PNG")
+
+    encoded = encode_image(source, ImageStoragePolicy())
+
+    assert encoded.dominant_color == "#c81e1e"
+    assert encoded.placeholder.startswith("data:image/webp;base64,")
+    placeholder = base64.b64decode(encoded.placeholder.split(",", 1)[1])
+    with Image.open(io.BytesIO(placeholder)) as preview:
+        assert max(preview.size) == PLACEHOLDER_DIMENSION
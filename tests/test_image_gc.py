@@ -0,0 +1,65 @@
+from os import utime
+from pathlib import Path
+from time import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from query.image_gc import OrphanImageGC  # type: ignore[import]
+from storage import LocalImageStorage  # type: ignore[import]
+
+LIVE_ID = "507f1f77bcf86cd799439011"
+ORPHAN_ID = "507f1f77bcf86cd799439012"
+RECENT_ORPHAN_ID = "507f1f77bcf86cd799439013"
+IMAGE_SIZE = 100
+
+
+def _make_image_dir(root: Path, collection: str, name: str, age: float) -> Path:
+    directory = root / collection / name
+    directory.mkdir(parents=True)
+    (directory / "main_image.png").write_bytes(b"x" * IMAGE_SIZE)
+    mtime = time() - age
+    utime(directory, (mtime, mtime))
+    return directory
+
+
+@pytest.mark.asyncio
+async def test_orphan_image_gc_reclaims_only_orphans(tmp_path: Path) -> None:
+    """Test that only old directories without a matching document are removed"""
+    live = _make_image_dir(tmp_path, "liqueur", LIVE_ID, 3600)
+    orphan = _make_image_dir(tmp_path, "liqueur", ORPHAN_ID, 3600)
+    recent = _make_image_dir(tmp_path, "liqueur", RECENT_ORPHAN_ID, 0)
+    unknown = _make_image_dir(tmp_path, "liqueur", "not-an-object-id", 3600)
+
+    gc = OrphanImageGC(
+        storage=LocalImageStorage(tmp_path),
+        lock_path=tmp_path / ".gc.lock",
+        grace_seconds=600,
+    )
+
+    with patch.object(
+        OrphanImageGC, "_existing_ids", new_callable=AsyncMock, return_value={LIVE_ID}
+    ) as mock_existing:
+        report = await gc.run_once()
+
+    assert live.exists()
+    assert not orphan.exists()
+    assert recent.exists()
+    assert unknown.exists()
+
+    assert report.orphans == 1
+    assert report.reclaimed_bytes == IMAGE_SIZE
+    assert report.collections["liqueur"] == 1
+    mock_existing.assert_awaited_once()
+
+
+def test_orphan_image_gc_single_leader(tmp_path: Path) -> None:
+    """Test that only one GC instance holds the leader lock"""
+    storage = LocalImageStorage(tmp_path)
+    leader = OrphanImageGC(storage=storage, lock_path=tmp_path / ".gc.lock")
+    follower = OrphanImageGC(storage=storage, lock_path=tmp_path / ".gc.lock")
+
+    assert leader.acquire_leader_lock()
+    assert not follower.acquire_leader_lock()
+    # 이미 락을 보유한 인스턴스는 계속 리더로 유지
+    assert leader.acquire_leader_lock()
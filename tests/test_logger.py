@@ -0,0 +1,164 @@
+import fcntl
+import os
+from datetime import UTC, datetime
+from pathlib import Path
+from time import sleep
+
+import orjson
+
+from utils.log_rotation import LogArchive, LogRotationPolicy  # type: ignore[import]
+from utils.log_sampling import (  # type: ignore[import]
+    SUPPRESSED_EVENT,
+    LogSampler,
+    LogSamplingPolicy,
+)
+from utils.logger import LogWriter  # type: ignore[import]
+
+LINES = 100
+QUEUE_SIZE = 2
+WRITES = 5
+
+
+def _lines(path: Path) -> list[dict]:
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+def test_writer_batches_lines_in_order(tmp_path: Path) -> None:
+    """Test that queued lines are written in order with a single batch"""
+    path = tmp_path / "service.jsonl"
+    writer = LogWriter(path, flush_seconds=60)
+
+    for i in range(LINES):
+        writer.write(orjson.dumps({"event": i}, option=orjson.OPT_APPEND_NEWLINE))
+    assert writer.flush()
+
+    assert [line["event"] for line in _lines(path)] == list(range(LINES))
+    assert writer.stats()["batches"] == 1
+    assert writer.stats()["written"] == LINES
+
+
+def test_full_queue_drops_and_reports_count(tmp_path: Path) -> None:
+    """Test that a full queue never blocks the caller and the drop count is logged"""
+    path = tmp_path / "service.jsonl"
+    writer = LogWriter(path, queue_size=QUEUE_SIZE, batch_lines=1, flush_seconds=60)
+
+    # 다른 워커가 파일을 잠근 상태로 두어 기록 스레드를 첫 배치에서 대기시킴
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        writer.write(b'{"event":"first"}\n')
+        while writer.stats()["queued"]:
+            sleep(0.001)
+        for _ in range(WRITES):
+            writer.write(b'{"event":"queued"}\n')
+        assert writer.stats()["dropped"] == WRITES - QUEUE_SIZE
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    assert writer.flush()
+    lines = _lines(path)
+    assert [line["event"] for line in lines].count("queued") == QUEUE_SIZE
+    assert [line["details"] for line in lines if "details" in line] == [
+        {"count": WRITES - QUEUE_SIZE}
+    ]
+
+
+def _line(timestamp: str, event: str) -> bytes:
+    return orjson.dumps(
+        {"timestamp": timestamp, "level": "info", "event": event, "details": {}},
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+
+
+def test_rotated_segments_are_compressed_and_indexed(tmp_path: Path) -> None:
+    """Test that a full log file is rotated, compressed and indexed by time range"""
+    path = tmp_path / "service.jsonl"
+    policy = LogRotationPolicy(max_bytes=1, retention_days=36500)
+    writer = LogWriter(path, flush_seconds=60, rotation=policy)
+    archive = LogArchive(path, policy)
+
+    for day in (1, 2, 3):
+        writer.write(_line(f"2025-01-0{day} 12:00:00", f"day {day}"))
+        assert writer.flush()
+
+    # 교체 시 시작된 백그라운드 압축이 잠근 세그먼트는 끝날 때까지 다시 시도
+    while archive.pending():
+        archive.maintain()
+        sleep(0.01)
+
+    segments = archive.segments()
+    assert [(info["first"], info["last"]) for info in segments] == [
+        (f"2025-01-0{day} 12:00:00", f"2025-01-0{day} 12:00:00") for day in (1, 2, 3)
+    ]
+    assert all(info["segment"].endswith(".jsonl.zst") for info in segments)
+    assert not archive.pending()
+
+    logs = archive.iter_logs(
+        since=datetime(2025, 1, 2, tzinfo=UTC), until=datetime(2025, 1, 3, tzinfo=UTC)
+    )
+    assert [log["event"] for log in logs] == ["day 2"]
+
+
+def test_retention_removes_expired_segments(tmp_path: Path) -> None:
+    """Test that segments older than the retention period are deleted"""
+    path = tmp_path / "service.jsonl"
+    policy = LogRotationPolicy(retention_days=7)
+    archive = LogArchive(path, policy)
+
+    for day in (1, 20):
+        segment = path.with_name(f"service.202501{day:02d}T000000.jsonl")
+        segment.write_bytes(_line(f"2025-01-{day:02d} 00:00:00", "event"))
+    for segment in archive.pending():
+        archive.compress(segment)
+    assert len(archive.segments()) == len((1, 20))
+
+    expired = archive.apply_retention(now=datetime(2025, 1, 21, tzinfo=UTC))
+    assert expired == ["service.20250101T000000.jsonl.zst"]
+    assert [info["first"] for info in archive.segments()] == ["2025-01-20 00:00:00"]
+    assert not path.with_name(expired[0]).exists()
+
+
+def test_sampler_keeps_first_events_then_samples() -> None:
+    """Test that repeated events are sampled after the first N per window"""
+    sampler = LogSampler(LogSamplingPolicy(keep_first=3, sample_every=10))
+    event = {"level": "warning", "event": "HTTP client error", "code": 404}
+
+    kept = [sampler.keep({**event, "path": f"/spirits/{i}"}) for i in range(30)]
+    assert kept.count(True) == len([1, 2, 3, 10, 20, 30])
+    assert sampler.keep({"level": "critical", "event": "HTTP client error"})
+    assert sampler.keep({**event, "code": 500})
+
+
+def test_sampler_keeps_audit_events_by_default() -> None:
+    """Test that info events and different users are never sampled together"""
+    sampler = LogSampler(LogSamplingPolicy(keep_first=1, sample_every=1000))
+    signed_in = {"level": "info", "event": "User signed in", "user_id": "tester"}
+    denied = {"level": "warning", "event": "Role change denied"}
+
+    assert all(sampler.keep(dict(signed_in)) for _ in range(30))
+    assert sampler.keep({**denied, "user_id": "a"})
+    assert sampler.keep({**denied, "user_id": "b"})
+    assert not sampler.keep({**denied, "user_id": "a"})
+
+
+def test_suppressed_events_are_summarized(tmp_path: Path) -> None:
+    """Test that suppressed events are written as one summary with counts"""
+    path = tmp_path / "service.jsonl"
+    sampler = LogSampler(LogSamplingPolicy(keep_first=1, sample_every=1000))
+    writer = LogWriter(path, flush_seconds=60, sampler=sampler)
+
+    for _ in range(50):
+        if sampler.keep({"level": "error", "event": "HTTP server error", "code": 503}):
+            writer.write(_line("2025-01-01 00:00:00", "HTTP server error"))
+    assert writer.close()
+
+    lines = _lines(path)
+    assert [line["event"] for line in lines] == [
+        "HTTP server error",
+        SUPPRESSED_EVENT,
+    ]
+    assert lines[1]["level"] == "error"
+    assert lines[1]["details"]["count"] == 50  # noqa: PLR2004
+    assert lines[1]["details"]["suppressed"] == 49  # noqa: PLR2004
+    assert lines[1]["details"]["code"] == 503  # noqa: PLR2004
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+from auth.throttle import LoginThrottle, LoginThrottlePolicy  # type: ignore[import]
+
+TOO_MANY_REQUESTS = 429
+BACKOFF_SECONDS = 30
+REJECTED_ATTEMPTS = 5
+
+
+def _throttle(path: Path, **policy: float) -> LoginThrottle:
+    return LoginThrottle(LoginThrottlePolicy(**policy), path / "throttle", slots=64)  # type: ignore[arg-type]
+
+
+def test_ip_limit_is_shared_between_instances(tmp_path: Path) -> None:
+    """Test that attempts counted by one worker are visible to another"""
+    worker_a = _throttle(tmp_path, ip_limit=3, account_limit=100)
+    worker_b = _throttle(tmp_path, ip_limit=3, account_limit=100)
+
+    worker_a.check("alice", "10.0.0.1")
+    worker_b.check("bob", "10.0.0.1")
+    worker_a.check("carol", "10.0.0.1")
+
+    with pytest.raises(HTTPException) as exc_info:
+        worker_b.check("dave", "10.0.0.1")
+
+    assert exc_info.value.status_code == TOO_MANY_REQUESTS
+    assert int(exc_info.value.headers["Retry-After"]) >= 1
+    worker_b.check("dave", "10.0.0.2")
+    assert worker_a.stats()["rejected_ip"] == 1
+
+
+def test_account_backoff_after_repeated_failures(tmp_path: Path) -> None:
+    """Test that failures beyond the free allowance block the account"""
+    throttle = _throttle(
+        tmp_path, free_failures=2, backoff_base_seconds=BACKOFF_SECONDS
+    )
+
+    for _ in range(2):
+        throttle.check("alice", "10.0.0.1")
+        throttle.record_failure("alice")
+    throttle.check("alice", "10.0.0.1")
+    throttle.record_failure("alice")
+
+    with pytest.raises(HTTPException) as exc_info:
+        throttle.check("alice", "10.0.0.9")
+    assert int(exc_info.value.headers["Retry-After"]) == BACKOFF_SECONDS
+
+    throttle.check("bob", "10.0.0.1")
+    throttle.record_success("alice")
+    throttle.check("alice", "10.0.0.1")
+    assert throttle.stats()["rejected_backoff"] == 1
+
+
+def test_blocked_account_does_not_drain_ip_budget(tmp_path: Path) -> None:
+    """Test that attempts rejected for the account are not charged to the IP"""
+    throttle = _throttle(tmp_path, ip_limit=3, account_limit=1)
+    throttle.check("alice", "10.0.0.1")
+
+    for _ in range(REJECTED_ATTEMPTS):
+        with pytest.raises(HTTPException):
+            throttle.check("alice", "10.0.0.1")
+
+    throttle.check("bob", "10.0.0.1")
+    throttle.check("carol", "10.0.0.1")
+    assert throttle.stats()["rejected_account"] == REJECTED_ATTEMPTS
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.loop_monitor import (  # type: ignore[import]
+    LoopMonitor,
+    LoopMonitorPolicy,
+    percentiles,
+)
+
+
+def test_percentiles_use_nearest_rank() -> None:
+    """Test that percentiles pick observed values by nearest rank"""
+    lags = [float(value) for value in range(1, 101)]
+    assert percentiles(lags) == {0.5: 50.0, 0.9: 90.0, 0.99: 99.0, 1.0: 100.0}
+
+
+def _blocking_call() -> None:
+    time.sleep(0.2)
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_is_measured_and_captured() -> None:
+    """Test that a blocking call shows up as lag and its stack is captured"""
+    monitor = LoopMonitor(
+        LoopMonitorPolicy(interval=0.01, capture_blocking=True, block_threshold=0.05)
+    )
+    task = asyncio.create_task(monitor.run_forever())
+    await asyncio.sleep(0.05)
+
+    _blocking_call()
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert monitor.stats()[1.0] >= 0.1  # noqa: PLR2004
+    [blocked] = monitor.blocked
+    assert "_blocking_call" in blocked["stack"]
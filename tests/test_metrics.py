@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from conftest import api_service
+from utils.metrics import MetricsRegistry, render  # type: ignore[import]
+
+# 실행 중이 아닌 워커 pid (Linux pid_max 초과)
+DEAD_PID = 2**22 + 1
+
+
+@pytest.mark.asyncio
+async def test_histogram_renders_cumulative_buckets(tmp_path: Path) -> None:
+    """Test that histogram buckets are rendered cumulatively with sum and count"""
+    registry = MetricsRegistry(tmp_path)
+    histogram = registry.histogram("latency_seconds", "Latency", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(("/spirits",), value)
+
+    text = render(await registry.collect())
+
+    assert 'latency_seconds_bucket{route="/spirits",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{route="/spirits",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/spirits",le="+Inf"} 4' in text
+    assert 'latency_seconds_sum{route="/spirits"} 6.05' in text
+    assert 'latency_seconds_count{route="/spirits"} 4' in text
+
+
+@pytest.mark.asyncio
+async def test_collect_merges_workers_and_archives_dead_ones(tmp_path: Path) -> None:
+    """Test that counters survive worker exit while gauges only count live workers"""
+    registry = MetricsRegistry(tmp_path)
+    requests = registry.counter("requests_total", "Requests", ("route",))
+    in_flight = registry.gauge("in_flight", "In flight")
+    requests.inc(("/spirits",), 2)
+    in_flight.inc()
+
+    # 종료된 다른 워커의 스냅숏
+    dead_snapshot = {
+        "requests_total": {
+            "kind": "counter",
+            "help": "Requests",
+            "labels": ["route"],
+            "values": [[["/spirits"], 3.0]],
+        },
+        "in_flight": {
+            "kind": "gauge",
+            "help": "In flight",
+            "labels": [],
+            "values": [[[], 5.0]],
+        },
+    }
+    (tmp_path / f"{DEAD_PID}.json").write_bytes(orjson.dumps(dead_snapshot))
+
+    merged = await registry.collect()
+    assert merged["requests_total"]["values"] == {("/spirits",): 5.0}
+    assert merged["in_flight"]["values"] == {(): 1.0}
+    assert not (tmp_path / f"{DEAD_PID}.json").exists()
+
+    # archive 로 옮긴 뒤에도 카운터 합계 유지
+    assert (await registry.collect())["requests_total"]["values"] == {
+        ("/spirits",): 5.0
+    }
+
+
+def test_metrics_endpoint_exposes_request_metrics() -> None:
+    """Test that /metrics reports per-route request counts and latency"""
+    client = TestClient(api_service)
+    assert client.get("/api/v1/health").status_code == status.HTTP_200_OK
+
+    response = client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/api/v1/health",status="200"}'
+        in response.text
+    )
+    assert "http_request_duration_seconds_bucket" in response.text
@@ -0,0 +1,42 @@
+import re
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from query.migrate_images import (  # type: ignore[import]
+    IMAGE_FIELDS,
+    migrate_legacy_image_keys,
+)
+
+DOCUMENT_ID = "507f1f77bcf86cd799439011"
+COLLECTIONS = 4
+KEY = f"spirits/{DOCUMENT_ID}/main_image.png"
+LEGACY_PATH = f"../data/images/{KEY}"
+
+
+def _mock_conn(collection: AsyncMock):  # noqa: ANN202
+    @asynccontextmanager
+    async def conn(_: str):  # noqa: ANN202
+        yield collection
+
+    return conn
+
+
+@pytest.mark.asyncio
+async def test_legacy_image_paths_are_migrated_to_keys() -> None:
+    """Test that only legacy local paths are rewritten with the prefix stripped"""
+    collection = AsyncMock()
+    collection.update_many.return_value = MagicMock(modified_count=1)
+
+    with patch("query.migrate_images.mongodb_conn", _mock_conn(collection)):
+        migrated = await migrate_legacy_image_keys()
+
+    assert migrated == COLLECTIONS * len(IMAGE_FIELDS)
+    query, pipeline = collection.update_many.await_args_list[0].args
+    pattern = query["main_image"]["$regex"]
+    assert re.match(pattern, LEGACY_PATH)
+    assert not re.match(pattern, KEY)
+
+    _, start, _ = pipeline[0]["$set"]["main_image"]["$substrCP"]
+    assert LEGACY_PATH[start:] == KEY
@@ -0,0 +1,88 @@
+from collections import Counter
+from pathlib import Path
+from time import perf_counter
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from utils.profiling import (  # type: ignore[import]
+    ContinuousProfiler,
+    ContinuousProfilingPolicy,
+    to_speedscope,
+)
+
+
+def _busy() -> None:
+    deadline: float = perf_counter() + 0.02
+    while perf_counter() < deadline:
+        pass
+
+
+def _app(profiler: ContinuousProfiler) -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def profile(request: Request, call_next) -> Response:  # noqa: ANN001
+        if profiler.should_profile(request.scope):
+            with profiler.profile(request.scope):
+                return await call_next(request)
+        return await call_next(request)
+
+    @app.get("/items/{name}")
+    async def item(name: str) -> dict[str, str]:
+        _busy()
+        return {"name": name}
+
+    return app
+
+
+def test_profiles_are_aggregated_per_route_template(tmp_path: Path) -> None:
+    """Test that profiled requests are merged under the route template"""
+    profiler = ContinuousProfiler(
+        ContinuousProfilingPolicy(enabled=True, sample_rate=1.0), tmp_path
+    )
+    client = TestClient(_app(profiler))
+    client.get("/items/gin")
+    client.get("/items/rum")
+
+    stacks = profiler.snapshot()
+    assert list(stacks) == ["/items/{name}"]
+    assert any("_busy" in stack for stack in stacks["/items/{name}"])
+
+
+def test_route_rate_applies_to_unseen_path_parameters(tmp_path: Path) -> None:
+    """Test that a per-route rate is resolved from the route template up front"""
+    profiler = ContinuousProfiler(
+        ContinuousProfilingPolicy(
+            enabled=True, sample_rate=0.0, route_rates=(("/items/{name}", 1.0),)
+        ),
+        tmp_path,
+    )
+    client = TestClient(_app(profiler))
+    client.get("/items/gin")
+    client.get("/items/rum")
+    client.get("/missing")
+
+    assert list(profiler.snapshot()) == ["/items/{name}"]
+
+
+def test_rotated_files_are_loaded_with_pending_stacks(tmp_path: Path) -> None:
+    """Test that rotated collapsed files merge with the current worker's stacks"""
+    profiler = ContinuousProfiler(ContinuousProfilingPolicy(enabled=True), tmp_path)
+    profiler.write({"/spirits": Counter({"main;search": 300, "main": 100})})
+    pending = {"/spirits": Counter({"main;search": 200}), "/health": Counter({"a": 5})}
+
+    merged = profiler.load(pending=pending)
+    assert merged["/spirits"] == Counter({"main;search": 500, "main": 100})
+    assert profiler.load(route="/health", pending=pending) == {
+        "/health": Counter({"a": 5})
+    }
+
+    speedscope = to_speedscope(merged)
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    spirits = next(p for p in speedscope["profiles"] if p["name"] == "/spirits")
+    assert spirits["endValue"] == sum(merged["/spirits"].values())
+    assert [[frames[i] for i in sample] for sample in spirits["samples"]] == [
+        ["main", "search"],
+        ["main"],
+    ]
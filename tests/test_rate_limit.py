@@ -0,0 +1,99 @@
+import asyncio
+import fcntl
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException, Response
+
+from auth.api_key import APIKeyInfo  # type: ignore[import]
+from auth.rate_limit import (  # type: ignore[import]
+    APIRateLimiter,
+    RateLimit,
+    RateLimitPolicy,
+)
+
+SEARCH_COST = 5
+
+
+def _limiter(path: Path, key_limit: int, route_limit: int) -> APIRateLimiter:
+    return APIRateLimiter(
+        RateLimitPolicy(
+            window_seconds=60, key_limit=key_limit, route_limit=route_limit
+        ),
+        path / "rate-limit",
+        slots=64,
+    )
+
+
+def test_weighted_requests_exhaust_route_limit(tmp_path: Path) -> None:
+    """Test that costly requests consume the route budget faster than cheap ones"""
+    limiter = _limiter(tmp_path, key_limit=100, route_limit=10)
+
+    first = limiter.take("key", "spirits", SEARCH_COST)
+    second = limiter.take("key", "spirits", SEARCH_COST)
+    rejected = limiter.take("key", "spirits", SEARCH_COST)
+
+    assert first.allowed
+    assert second.allowed
+    assert second.remaining == 0
+    assert not rejected.allowed
+    assert int(rejected.headers(60)["Retry-After"]) >= 1
+    assert limiter.take("key", "liqueur", 1).allowed
+
+
+def test_key_limit_is_shared_across_routes_and_workers(tmp_path: Path) -> None:
+    """Test that the per-key budget spans routes and is shared between workers"""
+    worker_a = _limiter(tmp_path, key_limit=6, route_limit=100)
+    worker_b = _limiter(tmp_path, key_limit=6, route_limit=100)
+
+    assert worker_a.take("key", "spirits", SEARCH_COST).allowed
+    decision = worker_b.take("key", "liqueur", SEARCH_COST)
+
+    assert not decision.allowed
+    assert decision.headers(60)["RateLimit-Limit"] == "6"
+    assert worker_b.take("other-key", "liqueur", SEARCH_COST).allowed
+
+
+@pytest.mark.asyncio
+async def test_search_and_detail_routes_have_independent_budgets(
+    tmp_path: Path,
+) -> None:
+    """Test that exhausting the search budget leaves the detail route usable"""
+    limiter = _limiter(tmp_path, key_limit=100, route_limit=SEARCH_COST)
+    api_key = APIKeyInfo("key", "example.com", "test")
+    search = RateLimit("spirits", "search")
+    detail = RateLimit("spirits", "detail")
+
+    with patch("auth.rate_limit.api_rate_limiter", limiter):
+        await search(Response(), api_key)
+        with pytest.raises(HTTPException):
+            await search(Response(), api_key)
+
+        assert await detail(Response(), api_key) == api_key
+
+
+@pytest.mark.asyncio
+async def test_contended_lock_is_awaited_off_the_event_loop(tmp_path: Path) -> None:
+    """Test that a lock held by another worker does not block the event loop"""
+    limiter = _limiter(tmp_path, key_limit=100, route_limit=100)
+    api_key = APIKeyInfo("key", "example.com", "test")
+    assert limiter.take("other-key", "spirits", 1).allowed
+
+    # 다른 워커처럼 별도로 연 파일로 잠금 보유
+    fd = os.open(tmp_path / "rate-limit", os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        assert limiter.try_take("key", "spirits", 1) is None
+        with patch("auth.rate_limit.api_rate_limiter", limiter):
+            task = asyncio.create_task(
+                RateLimit("spirits", "detail")(Response(), api_key)
+            )
+            await asyncio.sleep(0.05)
+            assert not task.done()
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+    assert await task == api_key
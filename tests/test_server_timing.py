@@ -0,0 +1,41 @@
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from auth.jwt import PublishToken  # type: ignore[import]
+from conftest import api_service
+from utils.server_timing import header_value  # type: ignore[import]
+
+
+def _phases(header: str) -> list[str]:
+    return [entry.split(";")[0].strip() for entry in header.split(",")]
+
+
+def test_header_value_orders_phases_in_milliseconds() -> None:
+    """Test that only recorded phases are listed, in a fixed order"""
+    assert (
+        header_value({"db": 0.0034, "auth": 0.0012}, 0.005)
+        == "auth;dur=1.2, db;dur=3.4, app;dur=5.0"
+    )
+
+
+def test_response_carries_server_timing() -> None:
+    """Test that responses report serialization, total and compression time"""
+    response = TestClient(api_service).get("/api/v1/health")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert _phases(response.headers["server-timing"]) == [
+        "serialization",
+        "app",
+        "compress",
+    ]
+
+
+def test_token_verification_is_reported_as_auth() -> None:
+    """Test that JWT verification in a dependency is reported as the auth phase"""
+    token = PublishToken.sign_in_token("tester", ["admin"])["accessToken"]
+    response = TestClient(api_service).get(
+        "/api/v1/login-throttle", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "auth" in _phases(response.headers["server-timing"])
@@ -0,0 +1,99 @@
+from pathlib import Path
+from time import perf_counter
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.profiling import ProfilingMiddleware  # type: ignore[import]
+from utils.slow_requests import (  # type: ignore[import]
+    SlowRequestMiddleware,
+    SlowRequestPolicy,
+    SlowRequestRecorder,
+    record_command,
+)
+
+
+def _app(recorder: SlowRequestRecorder) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/spirits/{name}")
+    async def spirit(name: str) -> dict[str, str]:
+        record_command("mongodb", "find", "spirits", 0.004, "success")
+        deadline: float = perf_counter() + 0.03
+        while perf_counter() < deadline:
+            pass
+        return {"name": name}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(SlowRequestMiddleware, recorder=recorder)
+    return app
+
+
+def test_slow_request_is_captured_with_commands(tmp_path: Path) -> None:
+    """Test that a slow request is stored with its route and database commands"""
+    recorder = SlowRequestRecorder(
+        SlowRequestPolicy(route_thresholds=(("/spirits/{name}", 0.01),)), tmp_path
+    )
+    client = TestClient(_app(recorder))
+    client.get("/spirits/gin")
+    client.get("/health")
+
+    [capture] = recorder.load()
+    assert capture["route"] == "/spirits/{name}"
+    assert capture["status"] == 200  # noqa: PLR2004
+    assert capture["commands"] == [
+        {
+            "database": "mongodb",
+            "command": "find",
+            "target": "spirits",
+            "duration_ms": 4.0,
+            "status": "success",
+        }
+    ]
+    # 처음 느린 요청은 프로파일링 전이므로 프로파일 없음
+    assert capture["profile"] is None
+
+
+def test_route_is_profiled_after_first_slow_request(tmp_path: Path) -> None:
+    """Test that the first slow request arms profiling for later requests"""
+    recorder = SlowRequestRecorder(
+        SlowRequestPolicy(threshold_seconds=0.01, sample_rate=1.0), tmp_path
+    )
+    client = TestClient(_app(recorder))
+    client.get("/spirits/gin")
+    client.get("/spirits/gin")
+
+    latest, first = recorder.load()
+    assert first["profile"] is None
+    assert any("spirit" in stack for stack in latest["profile"])
+
+
+def test_armed_route_shares_profiler_with_profile_query(tmp_path: Path) -> None:
+    """Test that ?profile=true on an armed route reuses the running profiler"""
+    recorder = SlowRequestRecorder(
+        SlowRequestPolicy(threshold_seconds=0.01, sample_rate=1.0), tmp_path
+    )
+    client = TestClient(_app(recorder))
+    client.get("/spirits/gin")
+
+    # 처음 보는 경로 파라미터도 라우트 템플릿으로 프로파일링 대상 확인
+    response = client.get("/spirits/rum?profile=true")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.json() == {"name": "rum"}
+    latest, _ = recorder.load()
+    assert latest["path"] == "/spirits/rum"
+    assert any("spirit" in stack for stack in latest["profile"])
+
+
+def test_captures_are_bounded_by_capacity(tmp_path: Path) -> None:
+    """Test that only the newest captures are kept"""
+    recorder = SlowRequestRecorder(SlowRequestPolicy(capacity=2), tmp_path)
+    for index in range(3):
+        recorder.store({"route": "/spirits", "index": index})
+
+    assert [capture["index"] for capture in recorder.load()] == [2, 1]
@@ -0,0 +1,56 @@
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from supertokens_python import get_all_cors_headers
+
+from auth.supertokens import (  # type: ignore[import]
+    SUPERTOKENS_BASE_PATH,
+    SUPERTOKENS_CORS_HEADERS,
+    SuperTokensApp,
+    SuperTokensSettings,
+)
+
+
+def _app() -> tuple[FastAPI, SuperTokensApp]:
+    supertokens_app = SuperTokensApp(
+        SuperTokensSettings(connection_uri="http://localhost:3567", api_key="test")
+    )
+    app = FastAPI()
+
+    @app.get("/catalog")
+    async def catalog() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.mount(SUPERTOKENS_BASE_PATH, supertokens_app)
+    return app, supertokens_app
+
+
+def test_catalog_route_does_not_initialize_supertokens() -> None:
+    """Test that routes outside /auth bypass SuperTokens entirely"""
+    app, supertokens_app = _app()
+    response = TestClient(app).get("/catalog")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert not supertokens_app.initialized
+
+
+def test_auth_route_is_handled_by_supertokens() -> None:
+    """Test that the first /auth request initializes the SDK and reaches its handlers"""
+    app, supertokens_app = _app()
+    client = TestClient(app)
+
+    response = client.post(
+        "/auth/signup", json={"formFields": []}, headers={"rid": "emailpassword"}
+    )
+    assert supertokens_app.initialized
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["status"] == "FIELD_ERROR"
+
+    assert client.get("/auth/unknown").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_cors_headers_match_sdk() -> None:
+    """Test that the static CORS header list stays in sync with the SDK recipes"""
+    app, _ = _app()
+    TestClient(app).get("/auth/unknown")
+
+    assert sorted(get_all_cors_headers()) == list(SUPERTOKENS_CORS_HEADERS)
@@ -0,0 +1,159 @@
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from pathlib import Path
+from time import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from jwt import InvalidTokenError
+
+from auth.encryption import Encryption  # type: ignore[import]
+from auth.jwt import PublishToken  # type: ignore[import]
+from auth.revocation import RefreshTokenRevocations  # type: ignore[import]
+from model.user import Login  # type: ignore[import]
+from query.queries import Users  # type: ignore[import]
+from query.role_cache import RoleCache  # type: ignore[import]
+from utils.shared_state import SharedBloomFilter, SharedSlotTable  # type: ignore[import]
+from utils.times import datetime_now  # type: ignore[import]
+
+GENERATION = 3600.0
+
+
+def _mock_conn(collection: AsyncMock):  # noqa: ANN202
+    @asynccontextmanager
+    async def conn(_: str):  # noqa: ANN202
+        yield collection
+
+    return conn
+
+
+def test_bloom_filter_is_shared_between_instances(tmp_path: Path) -> None:
+    """Test that items added by one worker are visible to another"""
+    worker_a = SharedBloomFilter(tmp_path / "bloom", GENERATION, bits=4096, hashes=5)
+    worker_b = SharedBloomFilter(tmp_path / "bloom", GENERATION, bits=4096, hashes=5)
+    expires_at: float = time() + 60
+
+    worker_a.add("jti-1", expires_at)
+
+    assert worker_b.might_contain("jti-1", expires_at)
+    assert not worker_b.might_contain("jti-2", expires_at)
+
+
+def test_bloom_filter_reuses_expired_generation_slots(tmp_path: Path) -> None:
+    """Test that a slot is cleared when a later generation takes it over"""
+    bloom = SharedBloomFilter(tmp_path / "bloom", GENERATION, bits=4096, generations=2)
+    now: float = time()
+    bloom.add("old", now)
+
+    # 두 세대 뒤 같은 슬롯을 쓰는 시점으로 이동
+    with patch("utils.shared_state.time", return_value=now + 2 * GENERATION):
+        bloom.add("new", now + 2 * GENERATION)
+
+    assert bloom.might_contain("new", now + 2 * GENERATION)
+    assert not bloom.might_contain("old", now)
+    assert not bloom.might_contain("old", now + 2 * GENERATION)
+
+
+@pytest.mark.asyncio
+async def test_unrevoked_token_skips_database(tmp_path: Path) -> None:
+    """Test that only Bloom filter positives reach the exact store"""
+    collection = AsyncMock()
+    collection.find_one.return_value = {"_id": "x"}
+    revocations = RefreshTokenRevocations(
+        SharedBloomFilter(tmp_path / "bloom", GENERATION)
+    )
+    expires_at = datetime_now() + timedelta(minutes=1)
+
+    with patch("auth.revocation.mongodb_conn", _mock_conn(collection)):
+        assert not await revocations.is_revoked("active", expires_at)
+        collection.find_one.assert_not_called()
+
+        await revocations.revoke("revoked", "tester", expires_at)
+        assert await revocations.is_revoked("revoked", expires_at)
+
+    assert revocations.exact_lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_revoked_token_is_rejected() -> None:
+    """Test that a revoked refresh token can no longer issue access tokens"""
+    refresh_token = PublishToken.sign_in_token("tester", ["user"])["refreshToken"]
+
+    with (
+        patch(
+            "auth.jwt.refresh_token_revocations.is_revoked",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        pytest.raises(InvalidTokenError, match="revoked"),
+    ):
+        await PublishToken.refresh_access_token(refresh_token)
+
+
+def test_role_cache_invalidation_reaches_other_workers(tmp_path: Path) -> None:
+    """Test that a role change in one worker evicts the cached roles in another"""
+    worker_a = RoleCache(SharedSlotTable(tmp_path / "versions", fields=1, slots=64))
+    worker_b = RoleCache(SharedSlotTable(tmp_path / "versions", fields=1, slots=64))
+
+    worker_b.put("tester", ["user"], worker_b.version("tester"))
+    assert worker_b.get("tester") == ["user"]
+
+    worker_a.invalidate("tester")
+
+    assert worker_b.get("tester") is None
+
+
+def test_role_cache_skips_fill_invalidated_during_lookup(tmp_path: Path) -> None:
+    """Test that roles read before an invalidation are not cached"""
+    cache = RoleCache(SharedSlotTable(tmp_path / "versions", fields=1, slots=64))
+
+    version: float = cache.version("tester")
+    cache.invalidate("tester")
+    cache.put("tester", ["user"], version)
+
+    assert cache.get("tester") is None
+
+
+def test_role_cache_treats_evicted_version_as_miss(tmp_path: Path) -> None:
+    """Test that an evicted version slot does not revive stale cached roles"""
+    versions = SharedSlotTable(tmp_path / "versions", fields=1, slots=1, probes=1)
+    cache = RoleCache(versions)
+    cache.put("tester", ["admin"], cache.version("tester"))
+
+    def assign(values: list[float], now: float) -> None:
+        values[0] = now
+
+    # 다른 사용자가 하나뿐인 슬롯을 차지하여 tester 의 버전이 밀려남
+    versions.update("other", assign)
+
+    assert cache.get("tester") is None
+
+
+@pytest.mark.asyncio
+async def test_sign_in_allocates_role_version_only_for_known_users(
+    tmp_path: Path,
+) -> None:
+    """Test that failed logins for unknown ids leave the shared version table alone"""
+    versions = SharedSlotTable(tmp_path / "versions", fields=1, slots=64)
+    cache = RoleCache(versions)
+    collection = AsyncMock()
+    collection.find_one.return_value = None
+
+    with (
+        patch("query.queries.mongodb_conn", _mock_conn(collection)),
+        patch("query.queries.role_cache", cache),
+    ):
+        assert await Users.sign_in(Login(userId="ghost", password="password1")) == []
+        assert versions.read("ghost") == [0.0]
+
+        hashed = Encryption.passwords("password1")
+        collection.find_one.return_value = {
+            "user_id": "tester",
+            "roles": ["user"],
+            "password": hashed["encrypted_password"],
+            "salt": hashed["salt"],
+        }
+        roles = await Users.sign_in(Login(userId="tester", password="password1"))
+
+    assert roles == ["user"]
+    assert cache.get("tester") == ["user"]
@@ -0,0 +1,108 @@
+from pathlib import Path
+from time import sleep
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.log_rotation import LogArchive, LogRotationPolicy  # type: ignore[import]
+from utils.logger import log_writer  # type: ignore[import]
+from utils.tracing import (  # type: ignore[import]
+    Tracer,
+    TracingMiddleware,
+    TracingPolicy,
+    parse_traceparent,
+)
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+def _client(tracer: Tracer) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/spirits/{name}")
+    async def spirit(name: str) -> dict[str, str]:
+        with tracer.span("mongodb.find", "CLIENT", **{"db.collection.name": "spirits"}):
+            pass
+        return {"name": name}
+
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+    return TestClient(app)
+
+
+def _exported(path: Path) -> list[dict[str, Any]]:
+    log_writer(path).flush()
+    if not path.exists():
+        return []
+    return [
+        span
+        for line in path.read_bytes().splitlines()
+        for span in orjson.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    ]
+
+
+def test_parse_traceparent() -> None:
+    """Test that only well-formed W3C traceparent headers are accepted"""
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (
+        TRACE_ID,
+        PARENT_ID,
+        True,
+    )
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (
+        TRACE_ID,
+        PARENT_ID,
+        False,
+    )
+    assert parse_traceparent(f"00-{'0' * 32}-{PARENT_ID}-01") is None
+    assert parse_traceparent("00-xyz-01") is None
+
+
+def test_sampled_parent_continues_trace(tmp_path: Path) -> None:
+    """Test that a sampled traceparent is continued and exported with child spans"""
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(TracingPolicy(enabled=True, sample_rate=0.0, export_path=path))
+    response = _client(tracer).get(
+        "/spirits/gin", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+    )
+
+    child, root = _exported(path)
+    assert root["name"] == "GET /spirits/{name}"
+    assert root["traceId"] == child["traceId"] == TRACE_ID
+    assert root["parentSpanId"] == PARENT_ID
+    assert child["parentSpanId"] == root["spanId"]
+    assert response.headers["traceparent"] == f"00-{TRACE_ID}-{root['spanId']}-01"
+
+
+def test_unsampled_requests_are_not_exported(tmp_path: Path) -> None:
+    """Test that head sampling and an unsampled parent both skip recording"""
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(TracingPolicy(enabled=True, sample_rate=0.0, export_path=path))
+    client = _client(tracer)
+
+    assert "traceparent" not in client.get("/spirits/gin").headers
+    client.get("/spirits/gin", headers={"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-00"})
+    assert _exported(path) == []
+
+
+def test_rotated_trace_segment_is_indexed_and_retained(tmp_path: Path) -> None:
+    """Test that trace segments are indexed by span time and survive retention"""
+    path = tmp_path / "traces.jsonl"
+    policy = LogRotationPolicy(max_bytes=1, retention_days=1)
+    tracer = Tracer(TracingPolicy(enabled=True, sample_rate=1.0, export_path=path))
+
+    with patch("utils.logger.LOG_ROTATION", policy):
+        _client(tracer).get("/spirits/gin")
+        assert log_writer(path).flush()
+
+    archive = LogArchive(path, policy)
+    while archive.pending():
+        archive.maintain()
+        sleep(0.01)
+    archive.apply_retention()
+
+    [segment] = archive.segments()
+    assert "" < segment["first"] <= segment["last"]
+    assert path.with_name(segment["segment"]).exists()
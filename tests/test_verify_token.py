@@ -0,0 +1,62 @@
+from inspect import iscoroutinefunction
+from unittest.mock import patch
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from auth.jwt import PublishToken, VerifiedTokenCache, VerifyToken  # type: ignore[import]
+
+FORBIDDEN = 403
+
+
+def _credentials(roles: list[str]) -> HTTPAuthorizationCredentials:
+    token = PublishToken.sign_in_token("tester", roles)["accessToken"]
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+@pytest.mark.asyncio
+async def test_verified_token_is_decoded_once() -> None:
+    """Test that repeated requests with the same token skip JWT decoding"""
+    verifier = VerifyToken()
+    credentials = _credentials(["user"])
+    verify = verifier(["user"])
+
+    with patch("auth.jwt.jwt.decode", wraps=jwt.decode) as mock_decode:
+        for _ in range(3):
+            await verify(credentials)
+
+    mock_decode.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_token_still_checks_roles() -> None:
+    """Test that a cached token is rejected by endpoints requiring other roles"""
+    verifier = VerifyToken()
+    credentials = _credentials(["user"])
+
+    await verifier(["user"])(credentials)
+    with pytest.raises(HTTPException) as exc_info:
+        await verifier(["admin"])(credentials)
+
+    assert exc_info.value.status_code == FORBIDDEN
+
+
+def test_cache_drops_expired_and_least_recent_entries() -> None:
+    """Test expiry by integer exp and LRU eviction"""
+    cache = VerifiedTokenCache(max_size=2)
+    cache.put("a", {"exp": 100})
+    cache.put("b", {"exp": 200})
+
+    assert cache.get("a", now=100) is None
+    cache.put("c", {"exp": 300})
+    cache.put("d", {"exp": 300})
+
+    assert cache.get("b", now=0) is None
+    assert cache.get("c", now=0) == {"exp": 300}
+
+
+def test_verify_runs_on_event_loop() -> None:
+    """Test that the dependency is a coroutine so FastAPI does not use the threadpool"""
+    assert iscoroutinefunction(VerifyToken()(["user"]))